@@ -2,42 +2,54 @@
 # Tkinter: 파이썬 기본 GUI                                   # 앱의 목적/범주 설명
 # ─────────────────────────────────────────────────────────
 # 간단한 ToDo 관리 + 프리젠테이션 타이머 + 실시간 '성과 리포트' 대시보드를 제공하는 Tkinter 데스크톱 앱이다.  # New 상위 요약
+# 모델/저장/집계는 todo_core(GUI 비의존)에 있고, 이 파일은 그 위에 얹힌 화면 계층이다.  # New 계층 구분
 
-from dataclasses import dataclass  # dataclass 데코레이터로 생성자/표현 등 보일러플레이트 자동 생성
-from datetime import date, datetime, timedelta  # 날짜(date), 날짜시간(datetime), 기간(timedelta)
-from pathlib import Path  # 운영체제 무관한 경로 처리
+from bisect import bisect_left  # 정렬된 인덱스 목록에서 이동량 계산(부분 갱신 시 선택/스크롤 보정)
+from datetime import date, datetime, timedelta  # 날짜(date), 자정 계산(datetime/timedelta)
 import time  # 단조 증가 시계(time.monotonic) 사용 → 시스템 시간 변경 영향을 안 받는 타이머
+from collections import deque  # 최근 틱 지연 표본(고정 크기)
 import math  # 올림/내림, 보간 계산 등에 사용
-import sqlite3 as sql  # 내장 SQLite DB로 간단 영속화(파일 1개)
+from typing import Callable  # 콜백 타입 힌트
 import tkinter as tk  # Tkinter 기본 위젯
-from tkinter import ttk, messagebox  # ttk(현대식 스킨), messagebox(모달 알림/확인)
+from tkinter import ttk, messagebox, filedialog  # ttk(현대식 스킨), messagebox(모달 알림/확인), 파일 선택
+import tkinter.font as tkfont  # 폰트 메트릭(가상 리스트의 행 높이 계산)
+from todo_core import (  # GUI 비의존 코어(모델/저장소/집계/색인)
+    STATUS_ICON, STATUS_TEXT, LOAD_CHUNK_ROWS,
+    parse_date, to_date, Todo, ChangeSet, DBWorker, PagedLoader, TodoStore, sql_report_stats,
+    TREND_BINS, rollup_trend,
+)
+from todo_io import import_todos, export_todos  # 스트리밍 가져오기/내보내기(JSONL/CSV)
+from todo_perf import Profiler  # 옵트인 계측(TODO_PROFILE=1)
+from todo_report import (  # 리포트 팔레트(캔버스/HTML 공용) + 파일 내보내기
+    HEAT_LEVELS, HEAT_LUT, STACK_COLORS, WEEK_DAYS, TREND_DAYS, rate_color, export_report,
+)
+from todo_timer import (  # 여러 타이머 + 대기열 + 마감 힙 + 세션 영속화
+    RUNNING, PAUSED, TIMER_STATE_TEXT, Timer, TimerBoard,
+    load_timers, save_timers, append_history, timer_history_stats,
+)
 
 # ─────────────────────────────────────────────────────────
-# 상수/포맷/공용 패딩                                         # 상수/공용 값 묶음
+# 상수/공용 패딩                                              # 화면 계층 상수
 # ─────────────────────────────────────────────────────────
-DATE_FMT = "%Y-%m-%d"  # 날짜 문자열 형식(예: 2025-09-16) — DB/표시 포맷을 통일해 파싱오류를 줄임
-STATUS_ICON = {0: "☐", 1: "⏳", 2: "✔"}  # 상태코드→아이콘 매핑(미완/진행/완료)
-STATUS_TEXT = {0: "미완료", 1: "진행중", 2: "완료"}  # 상태코드→읽을 수 있는 텍스트
 PAD6 = {"padx": 10, "pady": 6}  # grid/pack 공통 여백 프리셋(6)
 PAD8 = {"padx": 10, "pady": 8}  # 공통 여백 프리셋(8)
-# New 아이콘/텍스트 매핑을 통해 리스트, 상세 팝업, 리포트 문구 등 UI 전반의 표현을 일관되게 유지한다.
+DB_POLL_MS = 15             # 워커 완료 콜백을 Tk 스레드로 가져오는 폴링 간격(대기 작업이 있을 때만 동작)
+OVERSCAN_ROWS = 20          # 가상 리스트가 화면 위/아래로 미리 채워 두는 행 수(작은 스크롤은 재생성 없이 처리)
+FIRST_PAGE_ROWS = 200       # 시작 시 즉시 읽는 첫 화면분 행 수(첫 페인트 시간은 DB 크기와 무관)
+SEARCH_DEBOUNCE_MS = 150    # 검색/필터 입력 디바운스(타이핑 중에는 마지막 입력만 반영)
+PERF_OVERLAY_MS = 500       # 계측 오버레이 갱신 간격(측정 대상 루프보다 충분히 느리게)
+MIDNIGHT_SLACK_MS = 1000    # 자정 타이머 여유(살짝 늦게 깨어 date.today()가 확실히 바뀐 뒤 갱신)
+FRAME_MS = 16               # 애니메이션 프레임 간격(약 60fps — 모든 애니메이션이 이 틱 하나를 공유)
+CONFETTI_PX_PER_S = 375.0   # 컨페티 낙하 속도(기존 16ms당 6px과 같은 속도를 시간 기준으로)
+TIMER_SLACK_MS = 2          # 초 경계 직후에 깨도록 더하는 여유(경계 직전에 깨어 같은 값을 다시 그리는 일 방지)
+PROGRESS_MIN_MS = 50        # 진행률 바 최소 갱신 간격(짧은 타이머도 20fps 상한)
+JITTER_SAMPLES = 60         # 틱 지연 통계에 쓰는 최근 표본 수
+TIMER_SAVE_MS = 1000        # 타이머 상태 변경을 모아 저장하기까지의 대기(연속 조작은 1회 저장)
+TIMER_RESYNC_MS = 30000     # 실행 중 타이머의 벽시계 기준 재저장 주기(크래시 대비, 틱마다 쓰지 않음)
 
 # ─────────────────────────────────────────────────────────
-# DB 경로 고정(스크립트 폴더) + 대화형 환경 폴백             # 실행 환경 차이에 따른 DB 경로 보정
+# 유틸: 창 중앙 배치                                          # 자주 쓰는 헬퍼 함수
 # ─────────────────────────────────────────────────────────
-try:
-    DB_PATH = str(Path(__file__).with_name("todo.db"))  # 스크립트 파일과 같은 폴더에 todo.db 생성/사용
-except NameError:
-    DB_PATH = "todo.db"  # __file__이 없는 인터프리터/노트북 환경에서는 현재 작업 폴더에 저장
-# New __file__ 유무에 따라 경로 전략을 분기 → 어디서 실행해도 동일한 파일명을 쓰도록 안정화.
-
-# ─────────────────────────────────────────────────────────
-# 유틸: 날짜 파싱 / 창 중앙 배치                              # 자주 쓰는 헬퍼 함수 모음
-# ─────────────────────────────────────────────────────────
-def parse_date(s: str) -> datetime:  # 날짜 문자열을 datetime으로 파싱하는 헬퍼 시그니처
-    """날짜 문자열(YYYY-MM-DD)을 datetime 객체로 변환."""  # 형식 오류 시 예외를 발생시켜 호출부에서 UX 처리
-    return datetime.strptime(s, DATE_FMT)  # 형식 불일치 시 ValueError 발생 → 호출부에서 UX 메시지 처리
-
 def center_over(parent: tk.Tk, win: tk.Toplevel) -> None:  # 부모 기준 중앙 배치 함수 시그니처
     """부모창 기준으로 자식창을 화면 중앙에 배치(화면 밖으로 나가지 않게 보정 포함)."""  # 목적/보정 설명
     parent.update_idletasks()  # 부모 레이아웃/위치 정보 최신화
@@ -51,84 +63,307 @@ def center_over(parent: tk.Tk, win: tk.Toplevel) -> None:  # 부모 기준 중
     win.geometry(f"+{x}+{y}")  # 크기는 유지하고 위치만 이동
 
 # ─────────────────────────────────────────────────────────
-# 데이터 모델                                                 # 도메인 모델 정의
+# New 프레임 스케줄러: 모든 애니메이션을 after 체인 하나로 구동  # 애니메이션 공용 틱
 # ─────────────────────────────────────────────────────────
-@dataclass  # dataclass로 간단한 데이터 컨테이너 정의
-class Todo:  # Todo 데이터 클래스 선언
-    """할 일 1건을 표현하는 데이터 모델."""  # 모델 목적/필드 의미 설명
-    title: str  # 제목
-    start: str  # 시작일(YYYY-MM-DD)
-    end: str    # 종료일(YYYY-MM-DD)
-    desc: str = ""   # 상세 설명(옵션)
-    status: int = 0  # 상태 코드(0=미완,1=진행,2=완료) — UI/DB 공용 코드
-
-    def cycle(self) -> None:  # 상태 순환 메서드 시그니처
-        """상태를 다음 단계로 순환(0→1→2→0)."""  # 순환 규칙 설명
-        self.status = (self.status + 1) % 3  # 키보드 스페이스/버튼으로 빠른 상태 전환 지원
-        # New 리스트에서 '스페이스'로 토글할 때 이 메서드만 호출하면 되어 UI-로직 결합이 느슨해진다.
-
-    def display(self, today: date | None = None) -> str:  # 리스트 표시 문자열 생성 시그니처
-        """리스트박스에 표시할 1줄 요약 문자열을 생성(D-DAY 태그 포함)."""  # 반환 포맷 설명
-        icon = STATUS_ICON.get(self.status, "☐")  # 상태에 맞는 시각 아이콘
-        try:
-            d_end = datetime.strptime(self.end, DATE_FMT).date()  # 종료일 파싱
-        except Exception:
-            # New 날짜 파싱 실패 케이스(유효성 검사가 완벽하지 않을 때를 대비) → 최소정보만 표시
-            return f"{icon} {self.start} ~ {self.end} | {self.title}"  # 안전한 폴백 문자열
-
-        today = today or date.today()  # today 미지정 시 시스템 오늘 날짜
-        delta = (d_end - today).days   # 종료일까지 남은 일수(D-표기 기준)
-        if delta < 0:  # 마감 초과 여부 판단
-            tag = "⛔ 지남"            # 마감 초과
-        elif delta == 0:  # 당일 마감 여부
-            tag = "⚠️ D-DAY"          # 마감 당일
-        elif delta <= 3:  # 3일 이내 임박 여부
-            tag = f"⏰ D-{delta}"      # 3일 이내 임박
-        else:  # 일반 케이스
-            tag = f"D-{delta}"         # 일반 D-N 표기
-        return f"{icon} [{tag}] {self.start} ~ {self.end} | {self.title}"  # 최종 1줄 표시 문자열
-        # New 태그를 통해 리스트만 보고도 긴급도/우선순위를 직관적으로 파악 가능.
+class FrameScheduler:  # 공용 프레임 틱
+    """키별 애니메이션을 한 틱에서 진행률(0~1, 경과 시간 기준)로 갱신하고, 보이지 않으면 틱을 멈춘다."""  # 역할 설명
+
+    def __init__(self, widget: tk.Misc, visible: Callable[[], bool]) -> None:  # 생성자 시그니처
+        """widget.after로 틱을 예약하고, visible()이 False인 동안은 예약하지 않는다."""  # 파라미터 설명
+        self._w = widget          # after 예약 대상
+        self._visible = visible   # 그릴 가치가 있는지(탭 선택/최소화 여부)
+        self._anims: dict = {}    # 키 → [frame(p), 시작 시각, 길이(초)]
+        self._after_id: str | None = None  # 다음 틱 예약 ID
+
+    def start(self, key, frame: Callable[[float], None], duration: float) -> None:  # 애니메이션 등록
+        """frame(p)를 duration초 동안 매 틱 호출(p=1.0이 마지막). 같은 키가 진행 중이면 새 것으로 교체."""  # 병합 규칙
+        self._anims[key] = [frame, time.monotonic(), max(duration, 1e-3)]  # 이전 것은 버림(겹친 애니메이션 병합)
+        self.resume()  # 틱 시작
+
+    def cancel(self, key) -> None:  # 애니메이션 취소
+        """key 애니메이션을 마지막 프레임 없이 버린다(없으면 무시)."""  # 동작 설명
+        self._anims.pop(key, None)  # 제거
+
+    def resume(self) -> None:  # 틱 재개
+        """진행 중인 애니메이션이 있고 보이는 상태면 다음 틱을 예약(탭 전환/창 복원 시 호출)."""  # 재개 조건
+        if self._after_id is None and self._anims and self._visible():  # 예약 없음 + 할 일 있음 + 보임
+            self._after_id = self._w.after(FRAME_MS, self._tick)  # 틱 예약
+
+    def close(self) -> None:  # 종료
+        """예약된 틱을 취소하고 애니메이션을 모두 버린다."""  # 정리 설명
+        if self._after_id is not None:  # 예약 있음
+            self._w.after_cancel(self._after_id)  # 취소
+            self._after_id = None  # 상태 클리어
+        self._anims.clear()  # 버림
+
+    def _tick(self) -> None:  # 프레임 1회
+        """경과 시간으로 진행률을 계산해 각 애니메이션을 갱신하고, 끝난 것은 제거."""  # 보간 규칙
+        self._after_id = None  # 방금 실행된 예약
+        if not self._visible():  # 숨겨졌으면
+            return  # 틱 중지(resume에서 재개 — 그동안 흐른 시간만큼 건너뛰어 오래된 프레임은 그리지 않음)
+        now = time.monotonic()  # 이번 프레임 시각
+        for key, (frame, t0, dur) in list(self._anims.items()):  # 진행 중인 애니메이션
+            p = min(1.0, (now - t0) / dur)  # 진행률(프레임이 밀려도 시간에 맞춰 따라잡음)
+            frame(p)  # 갱신
+            if p >= 1.0 and self._anims.get(key, [None])[0] is frame:  # 끝남(그 사이 교체되지 않은 경우만)
+                del self._anims[key]  # 제거
+        self.resume()  # 남은 것이 있으면 다음 틱
+    # New 애니메이션마다 after(16) 체인을 따로 돌리지 않으므로 동시 애니메이션 수와 무관하게 틱은 하나다.
 
 # ─────────────────────────────────────────────────────────
-# DB 연동                                                     # 영속화 레이어
+# New 가상 리스트: 보이는 행(+오버스캔)만 Listbox에 올림       # 대용량 목록 렌더링
 # ─────────────────────────────────────────────────────────
-def _db() -> sql.Connection:  # DB 연결 함수 시그니처
-    """SQLite 연결을 열어 반환(컨텍스트 매니저와 함께 사용)."""  # 연결 수명/사용법 설명
-    return sql.connect(DB_PATH)  # New 호출 시마다 짧게 열었다가 with 블록 종료 시 자동 닫힘 → 핸들 누수 방지
-
-def init_db() -> None:  # DB 초기화 함수 시그니처
-    """앱 최초 실행 시 todos 테이블 생성(존재하면 무시)."""  # 테이블 스키마 개요
-    with _db() as con:  # 연결 컨텍스트(오류 시 자동 롤백, 정상 시 커밋)
-        # New status 컬럼에 CHECK 제약을 둬서 유효하지 않은 상태 값(0/1/2 외)을 DB 차원에서 차단
-        con.execute("""
-            CREATE TABLE IF NOT EXISTS todos(
-                id     INTEGER PRIMARY KEY AUTOINCREMENT,  -- 내부 PK(표시용 아님)
-                title  TEXT NOT NULL,                      -- 제목
-                start  TEXT NOT NULL,                      -- 시작일(YYYY-MM-DD)
-                end    TEXT NOT NULL,                      -- 종료일(YYYY-MM-DD)
-                memo   TEXT DEFAULT '',                    -- 상세설명(예약어 피하려고 'memo' 사용)
-                status INTEGER NOT NULL CHECK(status IN (0,1,2)) -- 상태코드(무결성 보장)
-            )
-        """)  # 스키마 생성 쿼리 실행
-
-def load_all() -> list[Todo]:  # 전체 로드 함수 시그니처
-    """DB의 모든 항목을 읽어 메모리(list[Todo])로 반환."""  # 정렬/모델 변환 설명
-    init_db()  # 테이블 존재 보장
-    with _db() as con:  # 연결 컨텍스트
-        rows = con.execute(
-            "SELECT title, start, end, memo, status FROM todos ORDER BY id"  # id 순으로 안정 정렬
-        ).fetchall()  # New ORDER BY id로 사용자 입력 순서를 그대로 유지 → UX 일관성
-    return [Todo(title, start, end, memo, status) for (title, start, end, memo, status) in rows]  # 행→모델 변환
-    # New 얇은 변환 계층: SQL 행 → 도메인 모델(Todo). 뷰/로직은 모델만 신경 쓰면 됨.
-
-def save_all(items: list[Todo]) -> None:  # 전량 저장 함수 시그니처
-    """현재 메모리 리스트 상태를 DB에 전량 반영(덮어쓰기 방식)."""  # 단순/안전 전략 설명
-    with _db() as con:  # 트랜잭션 컨텍스트
-        con.execute("DELETE FROM todos")  # New 간단/안전: 순서/상태를 있는 그대로 재기록(소규모 데이터 전제)
-        con.executemany(
-            "INSERT INTO todos(title, start, end, memo, status) VALUES(?,?,?,?,?)",  # 일괄 삽입 SQL
-            [(t.title, t.start, t.end, t.desc, t.status) for t in items],  # 파라미터 시퀀스
-        )  # executemany로 성능/가독성을 동시에 확보
+class VirtualList(ttk.Frame):  # Frame 기반 복합 위젯 선언
+    """모델 인덱스로 스크롤하며, 화면에 보이는 창(window) 범위의 행만 Listbox에 채우는 리스트."""  # 역할 설명
+
+    def __init__(self, parent, row_text: Callable[[int], str], height: int = 10,
+                 overscan: int = OVERSCAN_ROWS) -> None:  # 생성자 시그니처
+        """row_text(i)는 모델 i번째 행의 표시 문자열을 돌려주는 콜백."""  # 파라미터 설명
+        super().__init__(parent)  # Frame 초기화
+        self._row_text = row_text  # 행 문자열 공급 콜백(모델은 위젯 밖에 있음)
+        self._overscan = overscan  # 창 위/아래로 미리 채워 둘 여유 행 수
+        self._count = 0            # 모델 전체 행 수
+        self._top = 0              # 화면 맨 위에 보이는 모델 인덱스
+        self._w0 = 0               # Listbox 0번 행에 해당하는 모델 인덱스(창 시작)
+        self._w1 = 0               # 창 끝(미포함)
+        self._selected: set[int] = set()  # 선택된 모델 인덱스 집합(창 밖 선택도 유지)
+        self._anchor = 0           # Shift 범위 선택 기준점
+        self._cursor = 0           # 키보드 이동 기준(활성 행)
+        self._row_px = 0           # 행 높이(px) 캐시 — 첫 렌더 때 계산
+
+        # 실제 Tk 위젯: 창 범위만 담는 Listbox + 모델 기준 스크롤바
+        self.box = tk.Listbox(self, height=height, selectmode="extended",
+                              activestyle="none", exportselection=False)  # 선택/스크롤은 직접 관리
+        self.box.pack(side="left", fill="both", expand=True)  # 리스트 박스 배치
+        self.scroll = ttk.Scrollbar(self, orient="vertical", command=self._on_scrollbar)  # 모델 기준 스크롤바
+        self.scroll.pack(side="left", fill="y")  # 스크롤바 배치
+        # New Listbox 자체 스크롤(yscrollcommand)은 연결하지 않는다 — 스크롤 위치의 주인은 모델 인덱스(_top).
+
+        # 마우스/키보드 바인딩(기본 Listbox 동작을 대체, "break"로 클래스 바인딩 차단)
+        b = self.box.bind  # 바인딩 단축 참조
+        b("<Button-1>",         lambda e: self._click(e, "set"))     # 단일 선택
+        b("<Control-Button-1>", lambda e: self._click(e, "toggle"))  # 토글 선택
+        b("<Shift-Button-1>",   lambda e: self._click(e, "range"))   # 범위 선택
+        b("<B1-Motion>",        self._drag)                          # 드래그 범위 선택
+        b("<MouseWheel>",       self._wheel)                         # Windows/macOS 휠
+        b("<Button-4>",         lambda e: self.yview_scroll(-3))     # X11 휠 위
+        b("<Button-5>",         lambda e: self.yview_scroll(3))      # X11 휠 아래
+        for key, delta in (("Up", -1), ("Down", 1), ("Prior", "-page"), ("Next", "page")):  # 이동 키
+            b(f"<{key}>",       lambda e, d=delta: self._key_move(d, False))  # 커서 이동
+            b(f"<Shift-{key}>", lambda e, d=delta: self._key_move(d, True))   # 범위 확장
+        b("<Home>",      lambda e: self._key_jump(0))               # 맨 처음
+        b("<End>",       lambda e: self._key_jump(self._count - 1))  # 맨 끝
+        b("<Control-a>", lambda e: self.select_all())                # 전체 선택
+        b("<Configure>", lambda e: self._render(force=True))         # 크기 변경 시 창 재계산
+
+    # ── 공개 API(Listbox 호환 일부) ──
+    def reload(self, count: int) -> None:  # 모델 재적재
+        """모델 행 수가 바뀌었거나 내용이 전부 바뀌었을 때 호출(선택 해제, 스크롤 위치 유지)."""  # 용도 설명
+        self._count = count  # 새 행 수
+        self._selected.clear()  # 인덱스가 무의미해졌으므로 선택 해제
+        self._cursor = self._anchor = min(self._cursor, max(0, count - 1))  # 커서 클램프
+        self._render(force=True)  # 창 다시 채우기
+
+    def redraw(self) -> None:  # 내용 재생성
+        """행 수/순서는 그대로이고 표시 문자열만 바뀌었을 때 호출(선택/스크롤 유지 — 예: 날짜 변경으로 D-DAY 갱신)."""  # 용도 설명
+        self._render(force=True)  # 보이는 창만 다시 채움
+
+    def apply(self, changes: ChangeSet, count: int) -> None:  # 부분 갱신
+        """ChangeSet에 적힌 행만 창에 반영하고, 스크롤 위치/선택은 같은 항목을 가리키도록 보정."""  # 동작 설명
+        if len(changes) > max(self._w1 - self._w0, 1) * 2:  # 변경이 창보다 훨씬 크면
+            self._remap(changes)  # 선택/스크롤 보정만 하고
+            self._count = count  # 새 행 수 반영
+            self._render(force=True)  # 창을 한 번에 다시 채우는 편이 더 싸다
+            return  # 종료
+        self._remap(changes)  # 선택/커서/스크롤 위치를 새 인덱스로 이동
+        for r in sorted(changes.removed, reverse=True):  # 뒤에서부터 삭제(앞쪽 인덱스 보존)
+            if self._w0 <= r < self._w1:  # 창 안의 행
+                self.box.delete(r - self._w0)  # 그 행만 제거
+                self._w1 -= 1  # 창 축소
+            elif r < self._w0:  # 창 위쪽 행
+                self._w0 -= 1  # 창 전체가 한 칸 당겨짐
+                self._w1 -= 1  # 〃
+        for p in sorted(changes.inserted):  # 앞에서부터 삽입(변경 후 인덱스 기준)
+            if p < self._w0:  # 창 위쪽에 삽입
+                self._w0 += 1  # 창 전체가 한 칸 밀림
+                self._w1 += 1  # 〃
+            elif p <= self._w1:  # 창 안(또는 바로 끝)에 삽입
+                self.box.insert(p - self._w0, self._row_text(p))  # 그 행만 생성
+                self._w1 += 1  # 창 확장
+        for m in changes.modified:  # 내용만 바뀐 행
+            if self._w0 <= m < self._w1:  # 창 안의 행만
+                self.box.delete(m - self._w0)  # 기존 문자열 제거
+                self.box.insert(m - self._w0, self._row_text(m))  # 새 문자열로 교체
+        self._count = count  # 새 행 수 반영
+        grown = self._w1 - self._w0 > self._visible_rows() + 4 * self._overscan  # 삽입이 누적돼 창이 과도하게 커짐
+        self._render(force=grown)  # 창이 화면을 못 덮거나 너무 커졌을 때만 재생성
+        self._paint_selection()  # 선택 표시 동기화
+        # New delete(0, END) 후 전량 insert 대신 바뀐 행만 건드리므로 토글/편집이 목록 크기와 무관하게 즉시 반영된다.
+
+    def _remap(self, changes: ChangeSet) -> None:  # 인덱스 재배치
+        """삭제/삽입에 맞춰 선택·커서·기준점·맨 위 인덱스를 새 좌표로 옮긴다(삭제된 선택은 제거)."""  # 보정 규칙
+        removed = sorted(changes.removed)  # 이분 탐색용 정렬
+        inserted = sorted(changes.inserted)  # 〃
+        gone = set(removed)  # 삭제 여부 판정용
+        def move(i: int) -> int:  # 단일 인덱스 이동
+            j = i - bisect_left(removed, i)  # 앞쪽에서 삭제된 개수만큼 당김
+            for p in inserted:  # 앞쪽에 삽입된 개수만큼 밂(오름차순이므로 조기 종료)
+                if p > j:  # 이후 삽입은 영향 없음
+                    break  # 종료
+                j += 1  # 한 칸 밀림
+            return j  # 새 인덱스
+        if removed or inserted:  # 구조 변경이 있을 때만
+            self._selected = {move(i) for i in self._selected if i not in gone}  # 남은 선택만 이동
+            self._top = move(self._top)  # 같은 항목이 맨 위에 오도록(스크롤 위치 보존)
+            self._cursor = move(self._cursor)  # 커서 이동
+            self._anchor = move(self._anchor)  # 기준점 이동
+
+    def select(self, indices) -> None:  # 선택 지정
+        """주어진 모델 인덱스들을 선택 상태로 만든다(필터 재적용 후 선택 복원용)."""  # 용도 설명
+        self._selected = set(indices)  # 선택 교체
+        self._paint_selection()  # 화면 반영
+
+    def curselection(self) -> tuple[int, ...]:  # 선택 조회
+        """선택된 모델 인덱스를 오름차순 튜플로 반환(tk.Listbox.curselection과 동일한 형태)."""  # 호환성 설명
+        return tuple(sorted(self._selected))  # 정렬된 튜플
+
+    def select_all(self) -> str:  # 전체 선택
+        """모든 행을 선택."""  # 동작 설명
+        self._selected = set(range(self._count))  # 전체 인덱스
+        self._paint_selection()  # 화면 반영
+        return "break"  # 기본 동작 차단
+
+    def yview_scroll(self, rows: int) -> str:  # 행 단위 스크롤
+        """rows만큼 위(-)/아래(+)로 스크롤."""  # 방향 규칙 설명
+        self._scroll_to(self._top + rows)  # 맨 위 인덱스 이동
+        return "break"  # 기본 휠 동작 차단
+
+    def see(self, idx: int) -> None:  # 가시 영역 보장
+        """모델 인덱스 idx가 화면 안에 들어오도록 최소한으로 스크롤."""  # 동작 설명
+        vis = self._visible_rows()  # 보이는 행 수
+        if idx < self._top:  # 위쪽 밖
+            self._scroll_to(idx)  # 맨 위로 맞춤
+        elif idx >= self._top + vis:  # 아래쪽 밖
+            self._scroll_to(idx - vis + 1)  # 맨 아래로 맞춤
+
+    # ── 내부: 창 계산/렌더 ──
+    def _visible_rows(self) -> int:  # 보이는 행 수 계산
+        """현재 Listbox 픽셀 높이로 화면에 들어가는 행 수를 계산."""  # 계산 근거 설명
+        if not self._row_px:  # 행 높이 미계산
+            fnt = tkfont.Font(font=self.box.cget("font"))  # Listbox 폰트
+            sbw = int(self.box.cget("selectborderwidth"))  # 선택 테두리 두께
+            self._row_px = fnt.metrics("linespace") + 1 + 2 * sbw  # Tk Listbox의 줄 높이 공식
+        inner = self.box.winfo_height() - 2 * (int(self.box.cget("borderwidth")) + int(self.box.cget("highlightthickness")))  # 내부 높이
+        if inner <= 1:  # 아직 매핑 전(레이아웃 미확정)
+            return int(self.box.cget("height"))  # 요청한 줄 수로 대체
+        return max(1, inner // self._row_px)  # 최소 1행
+
+    def _scroll_to(self, top: int) -> None:  # 스크롤 위치 적용
+        """맨 위 인덱스를 top으로 옮기고 필요하면 창을 다시 채운다."""  # 동작 설명
+        vis = self._visible_rows()  # 보이는 행 수
+        self._top = max(0, min(top, self._count - vis))  # 범위 클램프
+        self._render()  # 렌더(창 안이면 yview만 이동)
+
+    def _render(self, force: bool = False) -> None:  # 창 렌더
+        """_top 기준으로 [top-overscan, top+vis+overscan) 범위만 Listbox에 채운다."""  # 창 정책 설명
+        vis = self._visible_rows()  # 보이는 행 수
+        self._top = max(0, min(self._top, self._count - vis))  # 행 수 변화에 대비한 클램프
+        if force or self._top < self._w0 or min(self._top + vis, self._count) > self._w1:  # 창 밖으로 나감
+            self._w0 = max(0, self._top - self._overscan)  # 새 창 시작
+            self._w1 = min(self._count, self._top + vis + self._overscan)  # 새 창 끝
+            self.box.delete(0, tk.END)  # 이전 창 비우기(창 크기만큼만)
+            if self._w1 > self._w0:  # 채울 행 존재
+                self.box.insert(tk.END, *[self._row_text(i) for i in range(self._w0, self._w1)])  # 창 범위만 문자열 생성
+            self._paint_selection()  # 선택 표시 복원
+        self.box.yview(self._top - self._w0)  # 창 내부에서 맨 위 행 맞춤(오버스캔 안은 재생성 없이 이동)
+        if self._count:  # 스크롤바 위치/크기 갱신
+            self.scroll.set(self._top / self._count, min(1.0, (self._top + vis) / self._count))  # 모델 기준 비율
+        else:  # 빈 목록
+            self.scroll.set(0.0, 1.0)  # 전체 표시
+        # New 렌더 비용이 전체 행 수와 무관하게 '보이는 행 + 2×오버스캔'으로 고정된다.
+
+    def _paint_selection(self) -> None:  # 선택 표시
+        """모델 선택 집합 중 창 안에 있는 것만 Listbox 선택으로 반영."""  # 동작 설명
+        self.box.selection_clear(0, tk.END)  # 창 선택 초기화
+        for i in range(self._w0, self._w1):  # 창 범위만 순회(최대 수십 행)
+            if i in self._selected:  # 선택된 행이면
+                self.box.selection_set(i - self._w0)  # Listbox 로컬 인덱스로 표시
+        if self._w0 <= self._cursor < self._w1:  # 커서가 창 안이면
+            self.box.activate(self._cursor - self._w0)  # 활성 행 표시
+
+    def _index_at(self, y: int) -> int:  # 좌표 → 모델 인덱스
+        """위젯 y좌표를 모델 인덱스로 변환."""  # 변환 설명
+        return self._w0 + self.box.nearest(y)  # Listbox 로컬 인덱스 + 창 시작
+
+    # ── 내부: 입력 처리 ──
+    def _on_scrollbar(self, *args) -> None:  # 스크롤바 콜백
+        """스크롤바의 moveto/scroll 명령을 모델 인덱스로 해석."""  # 해석 규칙 설명
+        if args[0] == "moveto":  # 드래그
+            self._scroll_to(int(float(args[1]) * self._count))  # 비율 → 인덱스
+        elif args[0] == "scroll":  # 화살표/트랙 클릭
+            n = int(args[1])  # 이동량
+            self._scroll_to(self._top + (n * self._visible_rows() if args[2] == "pages" else n))  # 페이지/행 단위
+
+    def _wheel(self, e) -> str:  # 휠 처리
+        """플랫폼별 delta를 행 단위 스크롤로 변환."""  # 변환 설명
+        step = -(e.delta // 120) if abs(e.delta) >= 120 else -e.delta  # Windows(±120 배수)/macOS(작은 값)
+        return self.yview_scroll(step * 3)  # 한 칸에 3행
+
+    def _click(self, e, mode: str) -> str:  # 클릭 선택
+        """클릭 위치의 행을 mode(set/toggle/range)에 따라 선택."""  # 모드 설명
+        self.box.focus_set()  # 키보드 단축키(Space/Delete)가 동작하도록 포커스
+        if not self._count:  # 빈 목록
+            return "break"  # 무시
+        idx = self._index_at(e.y)  # 클릭한 모델 인덱스
+        if mode == "set":  # 단일 선택
+            self._selected = {idx}  # 새 선택
+            self._anchor = idx  # 기준점 갱신
+        elif mode == "toggle":  # Ctrl+클릭
+            self._selected ^= {idx}  # 토글
+            self._anchor = idx  # 기준점 갱신
+        else:  # Shift+클릭
+            lo, hi = sorted((self._anchor, idx))  # 범위 정렬
+            self._selected = set(range(lo, hi + 1))  # 범위 선택
+        self._cursor = idx  # 커서 이동
+        self._paint_selection()  # 화면 반영
+        return "break"  # 기본 Listbox 선택 로직 차단
+
+    def _drag(self, e) -> str:  # 드래그 선택
+        """버튼을 누른 채 움직이면 기준점부터 현재 행까지 범위 선택(가장자리에서 자동 스크롤)."""  # 동작 설명
+        if not self._count:  # 빈 목록
+            return "break"  # 무시
+        if e.y < 0:  # 위쪽 밖으로 드래그
+            self.yview_scroll(-1)  # 한 행 위로
+        elif e.y > self.box.winfo_height():  # 아래쪽 밖으로 드래그
+            self.yview_scroll(1)  # 한 행 아래로
+        idx = self._index_at(min(max(e.y, 0), self.box.winfo_height()))  # 현재 행
+        lo, hi = sorted((self._anchor, idx))  # 범위 정렬
+        self._selected = set(range(lo, hi + 1))  # 범위 선택
+        self._cursor = idx  # 커서 이동
+        self._paint_selection()  # 화면 반영
+        return "break"  # 기본 동작 차단
+
+    def _key_move(self, delta, extend: bool) -> str:  # 키보드 이동
+        """방향키/PageUp/PageDown으로 커서 이동(extend면 Shift 범위 선택)."""  # 동작 설명
+        if isinstance(delta, str):  # 페이지 단위
+            delta = self._visible_rows() * (-1 if delta.startswith("-") else 1)  # 보이는 행 수만큼
+        return self._key_jump(self._cursor + delta, extend)  # 절대 위치 이동으로 위임
+
+    def _key_jump(self, idx: int, extend: bool = False) -> str:  # 절대 위치 이동
+        """커서를 idx로 옮기고 선택/스크롤을 맞춘다."""  # 동작 설명
+        if not self._count:  # 빈 목록
+            return "break"  # 무시
+        idx = max(0, min(idx, self._count - 1))  # 범위 클램프
+        if extend:  # Shift: 범위 확장
+            lo, hi = sorted((self._anchor, idx))  # 범위 정렬
+            self._selected = set(range(lo, hi + 1))  # 범위 선택
+        else:  # 단일 선택 이동
+            self._selected = {idx}  # 새 선택
+            self._anchor = idx  # 기준점 갱신
+        self._cursor = idx  # 커서 이동
+        self.see(idx)  # 화면 안으로 스크롤
+        self._paint_selection()  # 화면 반영
+        return "break"  # 기본 동작 차단
 
 # ─────────────────────────────────────────────────────────
 # 할 일 추가/편집 팝업(모달)                                  # 입력/편집 UX
@@ -141,6 +376,7 @@ class TodoDialog(tk.Toplevel):  # Toplevel 기반 모달 선언
         super().__init__(parent)  # 부모 루트에 부착된 Toplevel 생성
         self.result: Todo | None = None              # 저장 성공 시 채워질 결과(Todo) — 호출자에서 회수
         self._orig_status = item.status if item else 0  # 편집이면 기존 상태를 유지, 신규면 0으로 시작
+        self._orig_id = item.id if item else None        # 편집이면 같은 DB 행을 갱신하도록 id 유지
         # New 편집에서 상태를 초기화하지 않는 이유: 사용자가 이미 진행중/완료 상태를 부여했을 수 있기 때문(의도 존중).
 
         self.title(title)       # 창 타이틀
@@ -221,19 +457,93 @@ class TodoDialog(tk.Toplevel):  # Toplevel 기반 모달 선언
             self.ent_end.focus_set()  # 포커스 이동
             return  # 저장 중단
 
-        # 4) 결과 세팅 후 닫기
-        self.result = Todo(title=title, start=start, end=end, desc=desc, status=self._orig_status)  # 결과 구성
+        # 4) 결과 세팅 후 닫기(날짜는 ISO 텍스트로 정규화 → DB 문자열 비교/인덱스 범위 질의와 일치)
+        start, end = d1.date().isoformat(), d2.date().isoformat()  # 예: 2025-9-1 → 2025-09-01
+        self.result = Todo(title=title, start=start, end=end, desc=desc, status=self._orig_status,
+                           id=self._orig_id)  # 결과 구성(편집이면 기존 id 승계)
         self.destroy()  # 팝업 닫기
         # New 팝업 외부에서는 self.result 존재 여부만 확인해 추가/교체 로직을 간단히 처리한다.
 
+# ─────────────────────────────────────────────────────────
+# New 진행률 팝업(가져오기/내보내기)                          # 워커 작업 진행 표시
+# ─────────────────────────────────────────────────────────
+class ProgressDialog(tk.Toplevel):  # Toplevel 기반 모달 선언
+    """워커 스레드 작업의 진행률을 보여주는 모달(report는 아무 스레드에서나 호출 가능)."""  # 역할 설명
+
+    def __init__(self, parent: tk.Tk, title: str):  # 생성자 시그니처
+        """부모창과 타이틀을 받아 진행 막대를 띄우고 폴링을 시작."""  # 파라미터 설명
+        super().__init__(parent)  # Toplevel 생성
+        self._state = (0, 0)  # (done, total) — 워커가 튜플 통째로 교체(원자적 대입)
+        self.title(title)       # 창 타이틀
+        self.transient(parent)  # 부모창 위에 표시
+        self.resizable(False, False)  # 크기 고정
+        self.protocol("WM_DELETE_WINDOW", lambda: None)  # 작업 중에는 닫기 무시(작업이 끝나면 자동으로 닫힘)
+        self.bar = ttk.Progressbar(self, length=260, mode="determinate", maximum=1000)  # 진행 막대(천분율)
+        self.bar.pack(padx=16, pady=(16, 6))  # 배치
+        self.var_text = tk.StringVar(value="준비 중…")  # 진행 문구
+        ttk.Label(self, textvariable=self.var_text).pack(padx=16, pady=(0, 16))  # 배치
+        self.update_idletasks()  # 크기 계산
+        center_over(parent, self)  # 부모 기준 중앙 배치
+        self.grab_set()  # 모달(작업 중 목록 편집 차단 → 가져오기 결과와 충돌 없음)
+        self._after_id = self.after(100, self._poll)  # 화면 갱신 폴링
+
+    def report(self, done: int, total: int) -> None:  # 진행률 보고(워커 스레드)
+        """진행 상태만 기록(위젯은 건드리지 않음 → 스레드 안전)."""  # 스레드 규칙
+        self._state = (done, total)  # 원자적 교체
+
+    def _poll(self) -> None:  # 진행률 반영(Tk 스레드)
+        """기록된 진행 상태를 막대/문구에 반영."""  # 갱신 설명
+        done, total = self._state  # 스냅샷
+        if total:  # 분모를 알면 퍼센트
+            self.bar["value"] = min(1000, done * 1000 // total)  # 천분율
+            self.var_text.set(f"{done * 100 // total}%")  # 문구
+        elif done:  # 분모를 모르면 처리량만
+            self.var_text.set(f"{done:,}")  # 문구
+        self._after_id = self.after(100, self._poll)  # 다음 폴링
+
+    def close(self) -> None:  # 닫기
+        """폴링을 멈추고 창을 닫는다."""  # 정리 설명
+        self.after_cancel(self._after_id)  # 폴링 정지
+        self.destroy()  # 창 닫기
+
+class PerfOverlay(tk.Toplevel):  # 계측 오버레이
+    """New 콜백/DB 작업별 횟수·소요·지연·간격을 0.5초마다 보여주는 창(F12로 열고 닫음)."""  # 역할 설명
+
+    HEADER = f"{'이름':<28}{'횟수':>7}{'평균ms':>9}{'최대ms':>9}{'지연ms':>9}{'최대지연':>9}{'간격ms':>9}"  # 표 머리글
+
+    def __init__(self, parent: tk.Tk, profiler: Profiler):  # 생성자 시그니처
+        """부모창 옆에 고정폭 표를 띄우고 갱신 루프를 시작."""  # 파라미터 설명
+        super().__init__(parent)  # Toplevel 생성
+        self.title("성능 계측")  # 창 타이틀
+        self.transient(parent)  # 부모창 위에 표시(모달 아님 → 앱을 계속 조작하며 관찰)
+        self._perf = profiler   # 읽을 계측기
+        self.protocol("WM_DELETE_WINDOW", self.close)  # 닫기 = 루프 정지 후 파괴
+        self.text = tk.Text(self, width=82, height=18, font="TkFixedFont", wrap="none")  # 고정폭 표
+        self.text.pack(expand=True, fill="both")  # 배치
+        self._after_id = self.after(0, self._poll)  # 즉시 1회 그린 뒤 주기 갱신
+
+    def _poll(self) -> None:  # 표 갱신
+        """요약 표를 다시 쓴다(간격 = 같은 콜백의 연속 시작 간격 → 틱 주기/프레임 시간)."""  # 열 의미
+        lines = [self.HEADER]  # 머리글
+        for name, n, avg, mx, lag, lag_max, gap in self._perf.summary():  # 이름별 요약
+            lines.append(f"{name[:27]:<28}{n:>7}{avg:>9.2f}{mx:>9.2f}{lag:>9.2f}{lag_max:>9.2f}{gap:>9.1f}")  # 한 줄
+        self.text.delete("1.0", "end")  # 지우고
+        self.text.insert("1.0", "\n".join(lines))  # 다시 씀
+        self._after_id = self.after(PERF_OVERLAY_MS, self._poll)  # 다음 갱신(자기 after는 계측 대상 아님)
+
+    def close(self) -> None:  # 닫기
+        """갱신 루프를 멈추고 창을 닫는다."""  # 정리 설명
+        self.after_cancel(self._after_id)  # 루프 정지
+        self.destroy()  # 창 닫기
+
 # ─────────────────────────────────────────────────────────
 # 메인 앱(노트북 탭: 할 일 / 타이머 / 리포트)                 # 최상위 윈도우/탭 구조
 # ─────────────────────────────────────────────────────────
 class TodoApp(tk.Tk):  # Tk 루트 윈도우 상속
     """최상위 윈도우: 탭 컨테이너 + 각 탭 로직을 포함."""  # 역할 개요
 
-    def __init__(self) -> None:  # 생성자 시그니처
-        """창 생성/크기/탭 구성/DB 로드/초기 렌더링까지 한 번에 수행."""  # 초기화 플로 설명
+    def __init__(self, db_path: str | None = None) -> None:  # 생성자 시그니처
+        """창 생성/크기/탭 구성/DB 로드/초기 렌더링까지 한 번에 수행(db_path: 기본 todo.db 대신 쓸 파일)."""  # 초기화 플로 설명
         super().__init__()  # Tk 루트 초기화
         self.title("갓생살기")  # 창 타이틀 세팅
         sw, sh = self.winfo_screenwidth(), self.winfo_screenheight()  # 스크린 크기 조회
@@ -243,28 +553,64 @@ class TodoApp(tk.Tk):  # Tk 루트 윈도우 상속
         # 안전 종료 핸들러: 예약된 after/깜박임 등을 모두 정리
         self.protocol("WM_DELETE_WINDOW", self._on_close)  # 닫기 이벤트 바인딩
 
+        # ── 계측(TODO_PROFILE=1일 때만) ──
+        self.perf = Profiler.from_env()  # New 꺼져 있으면 None → 아무것도 감싸지 않음
+        self._perf_overlay: PerfOverlay | None = None  # 계측 오버레이 창(F12)
+        if self.perf is not None:  # 계측 켜짐
+            self.perf.wrap_after(self)  # 모든 after 루프(타이머 틱/리포트/도넛 애니/폴링) 소요·지연 기록
+            self.bind("<F12>", lambda e: self.toggle_perf_overlay())  # 오버레이 토글
+
+        # ── 영속화(전용 DB 스레드 + 배치 커밋) ──
+        self.worker = DBWorker(db_path, on_error=self._on_db_error, profiler=self.perf)  # New 모든 SQL은 워커 스레드에서 실행 — _on_close에서 플러시
+        self._pump_after_id: str | None = None  # 완료 큐 폴링 예약 ID(대기 작업이 있을 때만 돈다)
+        self._db_failed_shown = False  # DB 열기 실패 안내를 이미 띄웠는지
+        self._sql_stats: dict | None = None     # 로딩 중 리포트에 쓰는 마지막 SQL 집계 결과
+
         # 애플리케이션 상태(메모리)
-        self.todos: list[Todo] = []  # 현재 세션의 할 일 리스트(화면/DB 싱크는 save_all/load_all로 유지)
+        self.store = TodoStore(self._persist)  # New 목록/집계/색인 서비스(GUI 비의존 코어) — 쓰기는 워커로 위임
+        self.todos = self.store.todos        # 현재 세션의 할 일 리스트(store가 제자리 갱신 → 같은 객체를 공유)
+        self.view: list[Todo] | None = None  # New 검색/필터 결과(None이면 필터 없음 → self.todos를 그대로 표시)
+        self._filter_after_id: str | None = None  # 검색 디바운스 예약 ID
 
         # ── 타이머 상태(모노토닉 기반) ──
-        self._timer_after_id: str | None = None  # 타이머 틱 루프 예약 ID(after_cancel용)
+        self.timers = TimerBoard()        # New id별 타이머 + 대기열 + 마감 힙(모든 타이머가 after 체인 하나를 공유)
+        self._timer_focus: int | None = None  # 큰 라벨/진행 바에 표시할 타이머 id
+        self._timer_after_id: str | None = None  # 타이머 틱 루프 예약 ID(after_cancel용, 타이머 수와 무관하게 1개)
         self._blink_after_id: str | None = None  # 타임업 깜박임 루프 ID
-        self.timer_running: bool = False  # 타이머 동작 여부
-        self.timer_total_sec: int = 0     # 총 타이머 시간(초)
-        self.timer_warn_sec: int = 30     # 경고 시작 임계(초)
-        self.timer_end_mono: float = 0.0  # 단조 시계 기준 종료 목표 시각
-        self.timer_remain_sec: int = 0    # 남은 시간(초)
+        self._timer_due: float | None = None  # 다음 틱이 예약된 단조 시각(지연 측정 기준)
+        self._timer_shown: tuple | None = None  # 마지막으로 그린 (라벨, 색) — 같으면 config 생략
+        self._timer_late: deque = deque(maxlen=JITTER_SAMPLES)  # 최근 틱 지연(초)
+        self._timer_ticks: int = 0        # 이번 실행의 깨어남 횟수
+        self._timer_save_after_id: str | None = None  # 세션 저장 예약 ID(변경 모음/주기 재저장)
+        self._timers_loaded = False  # 지난 세션 복원이 끝났는지(그 전에는 스냅샷 저장 금지 → 저장된 타이머 보호)
         self._blink_on: bool = False      # 깜박임 토글 상태
         # New time.monotonic() 사용으로 OS 시간 변경/동기화에 따른 튀는 현상 방지.
 
         # ── 리포트 루프/마일스톤 상태 ──
-        self._report_after_id: str | None = None  # 리포트 자동 갱신 루프 ID(after_cancel용)
+        self._report_after_id: str | None = None  # 자정(날짜 변경) 타이머 ID(after_cancel용)
+        self._report_dirty: bool = True           # New 리포트를 다시 그려야 하는지(모델 변경/날짜 변경 시 True)
         self._last_rate: float = 0.0              # 이전 완료율(마일스톤 돌파 감지)
+        self._ring_val: float = 0.0               # 도넛에 지금 그려진 완료율(애니메이션 시작값)
+        self.frames = FrameScheduler(self, self._report_visible)  # New 도넛/컨페티 공용 프레임 틱(리포트 탭이 보일 때만)
         self._report_booted: bool = False         # New 첫 갱신 여부(앱 시작 직후 컨페티 오발 방지)
+        self._drawn: tuple | None = None          # 마지막으로 그린 (스냅샷, 캔버스 폭) — 같으면 재그리기 생략
+        self._trend: dict | None = None           # New 워커가 롤업에서 읽어 온 최근 완료 추이
+
+        # New 메뉴: 백업/복원(가져오기/내보내기)
+        menubar = tk.Menu(self)  # 메뉴바
+        m_file = tk.Menu(menubar, tearoff=False)  # 파일 메뉴
+        m_file.add_command(label="가져오기…", command=self.import_file)  # JSONL/CSV → DB
+        m_file.add_command(label="내보내기…", command=self.export_file)  # DB → JSONL/CSV
+        m_file.add_separator()  # 구분선
+        m_file.add_command(label="리포트 저장…", command=self.export_report_file)  # 리포트 → txt/HTML/CSV
+        menubar.add_cascade(label="파일", menu=m_file)  # 메뉴바에 추가
+        self.config(menu=menubar)  # 창에 부착
 
         # 탭 컨테이너
-        nb = ttk.Notebook(self)  # 노트북 위젯 생성
+        self.nb = nb = ttk.Notebook(self)  # 노트북 위젯 생성(리포트 탭 표시 여부 판단에 보관)
         nb.pack(expand=True, fill="both", padx=10, pady=10)  # 창 내부에 배치
+        nb.bind("<<NotebookTabChanged>>", lambda e: self._on_visibility())  # 리포트 탭이 보일 때만 그림/애니메이션
+        self.bind("<Map>", lambda e: e.widget is self and self._on_visibility())  # 최소화 해제 시 재개
 
         # 탭 생성(성적 탭은 제거)
         self.tab_todo   = ttk.Frame(nb)  # 할 일 탭 프레임
@@ -280,10 +626,41 @@ class TodoApp(tk.Tk):  # Tk 루트 윈도우 상속
         self._build_timer_tab()  # 타이머 탭 구성
         self._build_report_tab()  # 리포트 탭 구성
 
-        # DB → 메모리 → UI 초기 렌더
-        init_db()  # 테이블 보장
-        self.todos = load_all()  # DB로부터 로드
-        self.refresh_list()  # New 내부에서 refresh_report()도 호출하여 첫 화면부터 일관된 상태 표시
+        # DB → 메모리 → UI 초기 렌더(창은 바로 띄우고, 페이지는 워커가 읽어 오는 대로 스트리밍)
+        self._loader: PagedLoader | None = None  # 키셋 커서 로더(워커 스레드에서 생성)
+        self.refresh_list()  # New 빈 목록/리포트로 먼저 그림(첫 페이지가 도착하면 이어서 채움)
+        self._db_submit(PagedLoader, write=False, callback=self._on_loader_ready)  # 로더 준비(max_id 조회)
+        self._db_submit(load_timers, write=False, callback=self._on_timers_loaded)  # New 지난 실행의 타이머 세션 복원
+        self._schedule_midnight()  # New 주기 폴링 대신 날짜가 바뀌는 순간 한 번만 깨어남
+
+    # ─────────────────────────────────────────────────────────
+    # New 지연 로딩(첫 페이지 → 유휴 콜백마다 청크)             # 시작 시간 단축
+    # ─────────────────────────────────────────────────────────
+    def _on_loader_ready(self, loader: PagedLoader) -> None:  # 로더 준비 콜백
+        """로더를 받아 첫 화면분 페이지를 요청."""  # 시작 순서 설명
+        self._loader = loader  # 커서 상태 보관(읽기는 항상 워커에서)
+        self._db_submit(loader.next_page, FIRST_PAGE_ROWS, write=False, callback=self._on_page)  # 첫 페이지
+
+    def _on_page(self, page: list[Todo]) -> None:  # 페이지 수신 콜백
+        """읽어 온 페이지를 store에 적재하고 리스트에 삽입 구간만 반영."""  # 처리 내용 설명
+        changes = self.store.extend(page, self._loader.max_id)  # 집계/색인 반영 + id 순서 유지 삽입
+        if self.view is None:  # 필터 없음
+            self.listbox.apply(changes, len(self.todos))  # 리스트 부분 갱신
+        else:  # 필터 중이면 새 페이지에도 같은 조건 적용
+            self._apply_filter()  # 색인 기반 재필터
+        if self._loader.done:  # 마지막 페이지
+            self._on_load_done()  # 완료 처리
+        else:  # 남은 행 존재
+            self._db_submit(self._loader.next_page, LOAD_CHUNK_ROWS, write=False, callback=self._on_page)  # 다음 청크
+        # New 읽기는 워커에서 진행되고 Tk 스레드는 삽입/그리기만 하므로 로딩 중에도 스크롤/타이머가 멈추지 않는다.
+
+    def _on_load_done(self) -> None:  # 로딩 완료 처리
+        """전체 로딩이 끝나면 리포트를 증분 집계로 전환하고, 날짜 오류를 한 번만 안내."""  # 완료 처리 설명
+        self.refresh_report()  # 이제 calc_report_stats는 메모리 집계(O(1))를 사용
+        if self.store.bad_dates:  # 오류 항목이 있으면 한 번만 안내
+            messagebox.showwarning(
+                "날짜 오류", f"날짜 형식이 잘못된 항목 {self.store.bad_dates}개가 있습니다.\n리포트 집계에서 제외됩니다.",
+                parent=self)  # 안내
 
     # ─────────────────────────────────────────────────────────
     # [할 일] 탭 UI                                            # ToDo 탭 구성
@@ -305,31 +682,52 @@ class TodoApp(tk.Tk):  # Tk 루트 윈도우 상속
         ttk.Button(top, text="삭제",   command=self.delete_selected).pack(side="left", padx=6)  # 삭제 버튼
         ttk.Button(top, text="상태전환 (☐→⏳→✔)", command=self.cycle_status_selected).pack(side="left", padx=6)  # 상태 순환 버튼
 
+        # New 검색/필터 바: 제목·설명 부분 검색 + 상태 + 마감일 범위(입력은 디바운스)
+        flt = ttk.Frame(self.tab_todo)  # 필터 컨테이너
+        flt.pack(fill="x", padx=10)  # 가로 채움 배치
+        ttk.Label(flt, text="🔍").pack(side="left")  # 검색 아이콘 라벨
+        self.ent_search = ttk.Entry(flt, width=16)  # 검색어 입력
+        self.ent_search.pack(side="left", fill="x", expand=True, padx=(2, 8))  # 확장 배치
+        self.var_status = [tk.BooleanVar(value=True) for _ in range(3)]  # 상태별 표시 여부
+        for code, var in enumerate(self.var_status):  # 상태 체크박스 3개
+            ttk.Checkbutton(flt, text=STATUS_ICON[code], variable=var, command=self._apply_filter).pack(side="left")  # 즉시 반영
+        ttk.Label(flt, text="마감").pack(side="left", padx=(8, 2))  # 마감 범위 라벨
+        self.ent_due_from = ttk.Entry(flt, width=10)  # 시작 경계(YYYY-MM-DD, 비우면 제한 없음)
+        self.ent_due_from.pack(side="left")  # 배치
+        ttk.Label(flt, text="~").pack(side="left")  # 구분자
+        self.ent_due_to = ttk.Entry(flt, width=10)  # 끝 경계
+        self.ent_due_to.pack(side="left")  # 배치
+        ttk.Button(flt, text="✕", width=2, command=self._clear_filter).pack(side="left", padx=(6, 0))  # 필터 초기화
+        for ent in (self.ent_search, self.ent_due_from, self.ent_due_to):  # 텍스트 입력 3개
+            ent.bind("<KeyRelease>", lambda e: self._schedule_filter())  # 타이핑 → 디바운스 후 반영
+            ent.bind("<Escape>", lambda e: self._clear_filter())  # Esc → 초기화
+
         # 리스트 + 스크롤
         mid = ttk.Frame(self.tab_todo)  # 리스트/스크롤 컨테이너
         mid.pack(fill="both", expand=True, padx=10, pady=5)  # 남는 공간 채우기
 
-        self.listbox = tk.Listbox(mid, height=10, selectmode="extended")  # New 다중 선택으로 일괄 삭제/상태전환 가능
-        self.listbox.pack(side="left", fill="both", expand=True)  # 리스트 박스 배치
-
-        scroll = ttk.Scrollbar(mid, orient="vertical", command=self.listbox.yview)  # 세로 스크롤바
-        scroll.pack(side="left", fill="y")  # 스크롤바 배치
-        self.listbox.config(yscrollcommand=scroll.set)  # 리스트와 스크롤바 연동
+        # New 가상 리스트: 보이는 행만 Tk에 올리고 스크롤바도 모델 인덱스 기준으로 동작(5만 건에도 즉시 반응)
+        self.listbox = VirtualList(mid, lambda i: self._rows()[i].display(), height=10)  # 다중 선택(extended) 유지
+        self.listbox.pack(side="left", fill="both", expand=True)  # 리스트(+자체 스크롤바) 배치
 
         # 단축키(생산성)
-        self.listbox.bind("<Delete>", lambda e: self.delete_selected())  # Del: 삭제
-        self.listbox.bind("<space>",  self._on_space_toggle)             # Space: 상태 토글
-        self.listbox.bind("<Double-Button-1>", self.show_details)        # 더블클릭: 상세 보기
+        box = self.listbox.box  # 실제 키/마우스 이벤트를 받는 내부 Listbox
+        box.bind("<Delete>", lambda e: self.delete_selected())  # Del: 삭제
+        box.bind("<space>",  self._on_space_toggle)             # Space: 상태 토글
+        box.bind("<Double-Button-1>", self.show_details)        # 더블클릭: 상세 보기
 
     # ─────────────────────────────────────────────────────────
     # [타이머] 탭 UI                                            # 발표 타이머 UI
     # ─────────────────────────────────────────────────────────
     def _build_timer_tab(self) -> None:  # 타이머 탭 빌드 함수
         """발표 타이머 입력/컨트롤/피드백 UI 구성."""  # 구성 요소 설명
-        top = ttk.Frame(self.tab_timer)  # 상단 입력/컨트롤 컨테이너
-        top.pack(fill="x", **PAD8)  # 가로 채움
+        top = ttk.Frame(self.tab_timer)  # 상단 입력 컨테이너
+        top.pack(fill="x", padx=10, pady=(8, 2))  # 가로 채움
 
-        # 시간/임계값 입력
+        # 이름/시간/임계값 입력
+        ttk.Label(top, text="이름").pack(side="left")  # 이름 입력 라벨
+        self.ent_tname = ttk.Entry(top, width=10)  # 발표자/순서 이름(비우면 순번)
+        self.ent_tname.pack(side="left", padx=(4, 12))  # 간격
         ttk.Label(top, text="발표 시간(분)").pack(side="left")  # 분 입력 라벨
         self.ent_minutes = ttk.Entry(top, width=6)  # 분 입력 박스
         self.ent_minutes.pack(side="left", padx=(4, 12))  # 라벨과 간격
@@ -341,28 +739,34 @@ class TodoApp(tk.Tk):  # Tk 루트 윈도우 상속
         self.ent_warn.insert(0, "30")  # 기본 30초
 
         # 컨트롤 버튼(상태 흐름에 따라 활성/비활성화)
-        self.btn_start = ttk.Button(top, text="시작",     command=self.start_timer)  # 시작 버튼
-        self.btn_pause = ttk.Button(top, text="일시정지", command=self.pause_resume_timer, state="disabled")  # 일시정지 버튼
-        self.btn_reset = ttk.Button(top, text="초기화",   command=self.reset_timer,       state="disabled")  # 초기화 버튼
-        self.btn_start.pack(side="left", padx=4)  # 버튼 배치
-        self.btn_pause.pack(side="left", padx=4)  # 버튼 배치
-        self.btn_reset.pack(side="left", padx=4)  # 버튼 배치
-
-        # 중앙: 남은 시간 + 진행률 바
+        btns = ttk.Frame(self.tab_timer)  # 버튼 줄
+        btns.pack(fill="x", padx=10, pady=(2, 4))  # 가로 채움
+        self.btn_start = ttk.Button(btns, text="시작",       command=self.start_timer)  # 새 타이머 바로 시작
+        self.btn_queue = ttk.Button(btns, text="대기열 추가", command=self.enqueue_timer)  # 다음 발표로 예약
+        self.btn_next  = ttk.Button(btns, text="다음 순서",   command=self.start_next_timer, state="disabled")  # 대기열 맨 앞 시작
+        self.btn_pause = ttk.Button(btns, text="일시정지",   command=self.pause_resume_timer, state="disabled")  # 일시정지 버튼
+        self.btn_reset = ttk.Button(btns, text="초기화",     command=self.reset_timer,       state="disabled")  # 선택 타이머 제거
+        for b in (self.btn_start, self.btn_queue, self.btn_next, self.btn_pause, self.btn_reset):  # 버튼 배치
+            b.pack(side="left", padx=4)  # 좌측부터
+
+        # 중앙: 선택 타이머의 남은 시간 + 진행률 바(임계 이하 주황, 0이면 빨간색 깜박임)
         mid = ttk.Frame(self.tab_timer)  # 중앙 표시 영역
-        mid.pack(expand=True, fill="both", **PAD8)  # 남는 공간 채움
-        self.lbl_timer = tk.Label(mid, text="00:00", font=("Helvetica", 36, "bold"))  # 남은 시간 라벨
-        self.lbl_timer.pack(pady=10)  # 여백
+        mid.pack(fill="x", padx=10)  # 가로 채움
+        self.lbl_timer = tk.Label(mid, text="00:00", font=("Helvetica", 32, "bold"))  # 남은 시간 라벨
+        self.lbl_timer.pack()  # 배치
         self.pb_timer  = ttk.Progressbar(mid, orient="horizontal", mode="determinate", length=360)  # 진행률 바
-        self.pb_timer.pack(fill="x", padx=20, pady=10)  # 바 배치
-
-        # 하단: 사용 팁
-        bottom = ttk.Frame(self.tab_timer)  # 하단 프레임
-        bottom.pack(fill="x", **PAD8)  # 가로 채움
-        ttk.Label(
-            bottom,
-            text="Tip) 남은 시간이 임계값 이하로 떨어지면 주황색, 0이 되면 빨간색으로 깜박이며 종료를 알립니다."
-        ).pack(anchor="w")  # 좌측 정렬 라벨
+        self.pb_timer.pack(fill="x", padx=20, pady=4)  # 바 배치
+        self.var_jitter = tk.StringVar(value="")  # 틱 횟수/지연 표시
+        ttk.Label(mid, textvariable=self.var_jitter, foreground="#888").pack()  # 보조 정보(작게)
+
+        # 하단: 타이머 목록(진행 중 + 대기열) — 고르면 위 라벨이 그 타이머를 보여줌
+        self.tree_timers = ttk.Treeview(self.tab_timer, columns=("name", "left", "state"), show="headings",
+                                        height=4, selectmode="browse")  # 타이머 목록
+        for col, text, w in (("name", "이름", 240), ("left", "남은 시간", 100), ("state", "상태", 100)):  # 열 정의
+            self.tree_timers.heading(col, text=text)  # 머리글
+            self.tree_timers.column(col, width=w, anchor="w" if col == "name" else "center")  # 폭/정렬
+        self.tree_timers.pack(fill="both", expand=True, padx=10, pady=(2, 8))  # 배치
+        self.tree_timers.bind("<<TreeviewSelect>>", self._on_timer_select)  # 선택 → 포커스
 
     # ─────────────────────────────────────────────────────────
     # [리포트] 탭 UI (텍스트 KPI + 도넛 + 스택바 + 주간 히트맵)  # 대시보드 구성
@@ -393,11 +797,13 @@ class TodoApp(tk.Tk):  # Tk 루트 윈도우 상속
         self.var_soon   = tk.StringVar(value="마감 임박: 0건")    # 임박 건수 바인딩 변수
         self.var_over   = tk.StringVar(value="지남: 0건")  # 지남 건수 바인딩 변수
         self.var_counts = tk.StringVar(value="상태 구성: 미완 0 · 진행 0 · 완료 0")  # 상태 구성 바인딩 변수
+        self.var_talks  = tk.StringVar(value="발표 연습(7일): 0회 · 0분")  # 완료된 타이머 세션 요약
 
         ttk.Label(right, textvariable=self.var_avg   ).pack(anchor="w")  # 평균 표기 라벨
         ttk.Label(right, textvariable=self.var_soon  ).pack(anchor="w")  # 임박 표기 라벨
         ttk.Label(right, textvariable=self.var_over  ).pack(anchor="w")  # 지남 표기 라벨
         ttk.Label(right, textvariable=self.var_counts).pack(anchor="w", pady=(2, 0))  # 상태 구성 라벨
+        ttk.Label(right, textvariable=self.var_talks ).pack(anchor="w")  # 발표 연습 라벨
         # New 숫자 + 설명을 같이 표기해 '읽히는 KPI'를 지향(그래프 해석시간을 줄임).
 
         # 상태 비중 스택바
@@ -408,33 +814,187 @@ class TodoApp(tk.Tk):  # Tk 루트 윈도우 상속
         self.cnv_heat = tk.Canvas(frm, height=56, highlightthickness=0)  # 히트맵 캔버스
         self.cnv_heat.pack(fill="x")  # 가로 채움
 
-        ttk.Label(frm, text="※ 5초마다 자동 갱신 · 리스트 변경 시 즉시 반영", foreground="#666"
+        # New 기간별 완료 추이(일별 롤업 테이블에서 읽음)
+        bar = ttk.Frame(frm)  # 제목 + 기간 선택 행
+        bar.pack(fill="x", pady=(10, 2))  # 가로 채움
+        ttk.Label(bar, text="완료 추이").pack(side="left")  # 제목
+        self.var_trend_days = tk.IntVar(value=TREND_DAYS[0])  # 선택 기간(일)
+        for d in TREND_DAYS:  # 30/90/365일
+            ttk.Radiobutton(bar, text=f"{d}일", value=d, variable=self.var_trend_days,
+                            command=self._request_trend).pack(side="left", padx=(6, 0))  # 기간 선택
+        self.var_trend = tk.StringVar(value="")  # 기간 합계 요약
+        ttk.Label(bar, textvariable=self.var_trend, foreground="#666").pack(side="right")  # 요약 라벨
+        self.cnv_trend = tk.Canvas(frm, height=64, highlightthickness=0)  # 추이 막대 캔버스
+        self.cnv_trend.pack(fill="x")  # 가로 채움
+        self.cnv_stack.bind("<Configure>", lambda e: self._invalidate_report())  # 폭이 바뀌면 다시 그림(첫 배치 포함)
+        self._create_report_items()  # New 캔버스 아이템은 여기서 한 번만 만들고 이후엔 속성/좌표만 갱신
+
+        ttk.Label(frm, text="※ 리스트 변경·날짜 변경 시 즉시 반영", foreground="#666"
                  ).pack(anchor="w", pady=(8, 0))  # 안내 라벨(보조 색)
-        # New 실시간성(자동/즉시)을 명시해 “살아있는 리포트” 느낌 강화.
+        # New 실시간성(변경 즉시)을 명시해 “살아있는 리포트” 느낌 강화.
 
     # ─────────────────────────────────────────────────────────
     # 공통 동작: 선택/리스트 갱신/저장                           # 공통 헬퍼
     # ─────────────────────────────────────────────────────────
     def _selected_indices(self) -> tuple[int, ...] | None:  # 선택 인덱스 획득 함수
         """리스트박스에서 사용자가 선택한 항목 인덱스 튜플을 반환(없으면 경고 후 None)."""  # 반환/에러 경고 설명
-        sel = self.listbox.curselection()  # 현재 선택된 인덱스들
+        sel = self.listbox.curselection()  # 현재 선택된 인덱스들(화면 행 기준)
         if not sel:  # 선택 없음
             messagebox.showwarning("확인", "항목을 선택하세요.", parent=self)  # 사용자 경고
             return None  # None 반환
+        if self.view is not None:  # 필터 중이면 화면 행 → 모델 인덱스로 변환
+            sel = tuple(sorted(self.store.position(self.view[i]) for i in sel))  # 오름차순 유지
         return sel  # 선택 인덱스 튜플 반환
         # New selectmode="extended"이므로 여러 항목을 한 번에 조작 가능(삭제/상태전환).
 
-    def refresh_list(self) -> None:  # 리스트 리프레시 함수
-        """현재 self.todos를 리스트박스에 반영하고, 리포트도 함께 갱신."""  # 처리 내용 설명
-        self.listbox.delete(0, tk.END)  # 기존 내용 초기화
-        if self.todos:  # 항목 존재 시
-            self.listbox.insert(tk.END, *[t.display() for t in self.todos])  # display()는 D-DAY 태그 포함 문자열
+    def refresh_list(self, changes: ChangeSet | None = None) -> None:  # 리스트 리프레시 함수
+        """self.todos를 리스트에 반영(changes가 있으면 그 행만)하고, 리포트도 함께 갱신."""  # 처리 내용 설명
+        if self.view is not None:  # 필터 중이면 변경 후 조건을 다시 적용(색인 기반이라 저렴)
+            self._apply_filter()  # 선택/스크롤은 항목 기준으로 유지
+        elif changes is None:  # 전체 재적재(최초 로드 등)
+            self.listbox.reload(len(self.todos))  # 행 수만 알려주면 보이는 창 범위의 display()만 호출됨
+        else:  # 부분 갱신
+            self.listbox.apply(changes, len(self.todos))  # 바뀐 행만 반영(스크롤/선택 유지)
         self.refresh_report()  # New 리스트 변경 → 리포트 즉시 갱신(행동과 피드백의 연결)
 
-    def _save(self) -> None:  # 저장 함수
-        """현재 메모리 리스트(self.todos)를 DB에 저장(덮어쓰기 방식)."""  # 저장 전략 설명
-        save_all(self.todos)  # 덮어쓰기 저장 호출
-        # New 모든 조작 흐름은 '저장 → 리스트 갱신 → 리포트 갱신'으로 통일하여 화면/DB 싱크를 보장.
+    def _rows(self) -> list[Todo]:  # 표시 행 목록
+        """현재 화면에 보이는 행 목록(필터 결과 또는 전체)."""  # 의미 설명
+        return self.todos if self.view is None else self.view  # 필터 없으면 원본 그대로
+
+    def _schedule_filter(self) -> None:  # 디바운스 예약
+        """입력이 멈춘 뒤 SEARCH_DEBOUNCE_MS 후에 필터를 적용."""  # 디바운스 설명
+        if self._filter_after_id is not None:  # 기존 예약
+            self.after_cancel(self._filter_after_id)  # 취소(마지막 입력만 반영)
+        self._filter_after_id = self.after(SEARCH_DEBOUNCE_MS, self._apply_filter)  # 재예약
+
+    def _clear_filter(self) -> None:  # 필터 초기화
+        """검색어/상태/마감 범위를 모두 비우고 전체 목록으로 복귀."""  # 동작 설명
+        for ent in (self.ent_search, self.ent_due_from, self.ent_due_to):  # 입력 3개
+            ent.delete(0, tk.END)  # 비우기
+        for var in self.var_status:  # 상태 3개
+            var.set(True)  # 전부 표시
+        self._apply_filter()  # 즉시 반영
+
+    def _apply_filter(self) -> None:  # 필터 적용
+        """현재 조건으로 self.view를 다시 만들고 리스트를 재적재(선택 항목은 유지)."""  # 동작 설명
+        self._filter_after_id = None  # 예약 상태 클리어
+        keep = {id(t) for t in (self._rows()[i] for i in self.listbox.curselection())}  # 선택 항목(객체 기준)
+        query = self.ent_search.get()  # 검색어
+        statuses = {code for code, var in enumerate(self.var_status) if var.get()}  # 표시할 상태
+        lo = to_date(self.ent_due_from.get().strip())  # 마감 하한(잘못된/빈 입력이면 None → 제한 없음)
+        hi = to_date(self.ent_due_to.get().strip())    # 마감 상한
+        self.view = self.store.filter(query, statuses, lo, hi)  # 역색인 + 상태/마감 조건(조건 없으면 None)
+        rows = self._rows()  # 새 표시 행
+        self.listbox.reload(len(rows))  # 재적재(가상 리스트라 보이는 행만 생성)
+        if keep:  # 선택 복원
+            self.listbox.select(i for i, t in enumerate(rows) if id(t) in keep)  # 여전히 보이는 항목만
+        # New 상태 토글로 항목이 필터 밖으로 나가면 자연스럽게 목록에서 사라진다.
+
+    def _persist(self, fn, *args, key=None, callback=None) -> None:  # 행 단위 저장 함수
+        """행 단위 영속화 함수 fn(con, *args)를 워커에 넘긴다(커밋은 워커가 디바운스로 묶음)."""  # 저장 전략 설명
+        self._db_submit(fn, *args, key=key, callback=callback)  # store가 넘기는 insert_one/update_one/delete_many/update_status_many
+        # New 모든 조작 흐름은 '메모리 갱신 → 리스트 갱신 → 쓰기 예약'으로 통일 — 화면은 디스크를 기다리지 않는다.
+        # New 저장 비용이 목록 전체 크기가 아니라 '이번에 바뀐 행 수'에 비례한다.
+
+    def _db_submit(self, fn, *args, callback=None, key=None, write: bool = True, errback=None) -> None:  # 워커 제출
+        """워커에 작업을 넣고, 완료 큐 폴링이 멈춰 있으면 다시 시작."""  # 폴링 규칙
+        self.worker.submit(fn, *args, callback=callback, key=key, write=write, errback=errback)  # 큐에 추가(같은 key는 병합)
+        if self._pump_after_id is None:  # 폴링이 쉬고 있으면
+            self._pump_after_id = self.after(DB_POLL_MS, self._pump_db)  # 재개
+
+    def _pump_db(self) -> None:  # 완료 큐 폴링
+        """완료된 DB 작업의 콜백을 Tk 스레드에서 실행(남은 작업이 없으면 폴링 중지)."""  # 스레드 경계 설명
+        self._pump_after_id = None  # 예약 상태 클리어
+        if self.worker.drain():  # 아직 처리 중인 작업이 있으면
+            self._pump_after_id = self.after(DB_POLL_MS, self._pump_db)  # 다음 폴링
+        # New 위젯은 Tk 스레드에서만 만지고, 워커는 큐에 결과만 넣는다.
+
+    def _on_db_error(self, exc: Exception) -> None:  # DB 오류 핸들러
+        """워커에서 실패한 작업을 사용자에게 알린다(해당 작업만 롤백됨)."""  # 오류 처리 설명
+        if self.worker.failed is not None:  # DB를 열지 못함 → 모든 작업이 같은 이유로 실패
+            if not self._db_failed_shown:  # 한 번만 안내
+                self._db_failed_shown = True  # 표시 완료
+                messagebox.showerror("DB 오류", f"데이터베이스를 열 수 없습니다. 변경 사항이 저장되지 않습니다.\n{exc}", parent=self)  # 안내
+            return  # 작업별 대화상자 생략
+        messagebox.showerror("DB 오류", f"저장 중 오류가 발생했습니다.\n{exc}", parent=self)  # 안내
+
+    # ─────────────────────────────────────────────────────────
+    # New 가져오기/내보내기(워커에서 스트리밍, 진행률 팝업)        # 백업/복원
+    # ─────────────────────────────────────────────────────────
+    _FILETYPES = [("JSON Lines", "*.jsonl"), ("CSV", "*.csv"), ("모든 파일", "*.*")]  # 파일 선택 필터
+
+    def _ready_for_io(self) -> bool:  # 가져오기/내보내기 가능 여부
+        """목록 로딩 중이면 안내하고 False(로더 페이지 작업과 섞이지 않게)."""  # 제약 설명
+        if self._loader is None or not self._loader.done:  # 로딩 중
+            messagebox.showinfo("잠시만요", "목록을 불러오는 중입니다. 잠시 후 다시 시도하세요.", parent=self)  # 안내
+            return False  # 불가
+        return True  # 가능
+
+    def import_file(self) -> None:  # 가져오기 핸들러
+        """JSONL/CSV 파일을 한 트랜잭션으로 가져오고(추가 또는 전체 복원) 목록을 다시 읽는다."""  # 동작 설명
+        if not self._ready_for_io():  # 로딩 중
+            return  # 종료
+        path = filedialog.askopenfilename(parent=self, title="가져오기", filetypes=self._FILETYPES)  # 파일 선택
+        if not path:  # 취소
+            return  # 종료
+        replace = messagebox.askyesnocancel(
+            "가져오기", "기존 항목을 모두 지우고 파일 내용으로 복원할까요?\n(아니요: 기존 목록 뒤에 추가)", parent=self)  # 모드 선택
+        if replace is None:  # 취소
+            return  # 종료
+        dlg = ProgressDialog(self, "가져오는 중")  # 진행률 팝업
+        def done(n: int) -> None:  # 성공 콜백(Tk 스레드)
+            dlg.close()  # 팝업 닫기
+            self._reload_from_db()  # 새 데이터로 목록/집계/색인 재구성
+            messagebox.showinfo("가져오기", f"{n:,}건을 가져왔습니다.", parent=self)  # 결과 안내
+        def failed(exc: Exception) -> None:  # 실패 콜백(Tk 스레드)
+            dlg.close()  # 팝업 닫기
+            self._reload_from_db()  # 트랜잭션째 롤백됐으므로 원래 목록 그대로(가져오는 동안 추가한 항목도 다시 읽음)
+            messagebox.showerror("가져오기 실패", f"아무것도 가져오지 않았습니다.\n{exc}", parent=self)  # 안내
+        self._db_submit(import_todos, path, None, replace, dlg.report, callback=done, errback=failed)  # 워커에서 실행
+
+    def export_file(self) -> None:  # 내보내기 핸들러
+        """현재 DB 내용을 JSONL/CSV로 스트리밍 저장(확장자로 형식 결정)."""  # 동작 설명
+        if not self._ready_for_io():  # 로딩 중
+            return  # 종료
+        path = filedialog.asksaveasfilename(parent=self, title="내보내기", defaultextension=".jsonl",
+                                            filetypes=self._FILETYPES)  # 저장 경로
+        if not path:  # 취소
+            return  # 종료
+        dlg = ProgressDialog(self, "내보내는 중")  # 진행률 팝업
+        def done(n: int) -> None:  # 성공 콜백
+            dlg.close()  # 팝업 닫기
+            messagebox.showinfo("내보내기", f"{n:,}건을 저장했습니다.", parent=self)  # 결과 안내
+        def failed(exc: Exception) -> None:  # 실패 콜백
+            dlg.close()  # 팝업 닫기
+            messagebox.showerror("내보내기 실패", str(exc), parent=self)  # 안내
+        self._db_submit(export_todos, path, None, dlg.report, write=False, callback=done, errback=failed)  # 읽기 작업
+        # New 커서에서 파일로 바로 흘려 쓰므로 10만 건 이상도 메모리 증가 없이 저장된다.
+
+    def export_report_file(self) -> None:  # 리포트 저장 핸들러
+        """리포트 탭 지표 + 완료 추이 + 미완료 항목을 txt/HTML/CSV 파일로 저장(워커에서 스트리밍)."""  # 동작 설명
+        if not self._ready_for_io():  # 로딩 중
+            return  # 종료
+        path = filedialog.asksaveasfilename(parent=self, title="리포트 저장", defaultextension=".html",
+                                            filetypes=[("HTML", "*.html"), ("텍스트", "*.txt"), ("CSV", "*.csv")])  # 저장 경로
+        if not path:  # 취소
+            return  # 종료
+        dlg = ProgressDialog(self, "리포트 만드는 중")  # 진행률 팝업
+        def done(n: int) -> None:  # 성공 콜백
+            dlg.close()  # 팝업 닫기
+            messagebox.showinfo("리포트 저장", f"저장했습니다.\n{path}", parent=self)  # 결과 안내
+        def failed(exc: Exception) -> None:  # 실패 콜백
+            dlg.close()  # 팝업 닫기
+            messagebox.showerror("리포트 저장 실패", str(exc), parent=self)  # 안내
+        self._db_submit(export_report, path, None, dlg.report, self.calc_report_stats(),
+                        write=False, callback=done, errback=failed)  # 메모리 집계 스냅샷을 넘겨 재계산 없이 읽기 작업으로
+
+    def _reload_from_db(self) -> None:  # 전체 재적재
+        """메모리 상태를 비우고 시작 시와 같은 스트리밍 로딩을 다시 시작."""  # 재사용 설명
+        self.store.clear()  # 목록/집계/색인 초기화(self.todos는 같은 리스트 객체)
+        self._loader = None  # 로딩 중 표시
+        self._sql_stats = None  # 이전 SQL 집계 폐기
+        self.refresh_list()  # 빈 목록으로 갱신(필터 중이면 빈 결과)
+        self._db_submit(PagedLoader, write=False, callback=self._on_loader_ready)  # 로더 준비 → 페이지 스트리밍
 
     # ─────────────────────────────────────────────────────────
     # 사용자 액션: 추가/편집/삭제/상태전환/상세보기               # CRUD/토글/뷰
@@ -445,9 +1005,7 @@ class TodoApp(tk.Tk):  # Tk 루트 윈도우 상속
         dlg = TodoDialog(self, "할 일 추가", prefill=prefill)  # 추가 팝업 생성
         self.wait_window(dlg)       # 모달 완료 대기
         if dlg.result:              # 저장되었으면
-            self.todos.append(dlg.result)  # 리스트에 추가
-            self._save()  # DB에 반영
-            self.refresh_list()  # UI 갱신
+            self.refresh_list(self.store.add(dlg.result))  # 임시 id + INSERT 예약 → 추가된 마지막 행만 그림(로딩 중에도 가능)
 
     def edit_selected(self) -> None:  # 편집 핸들러
         """선택한 첫 항목을 편집 팝업으로 열고 저장 시 교체."""  # 동작 설명
@@ -458,9 +1016,7 @@ class TodoApp(tk.Tk):  # Tk 루트 윈도우 상속
         dlg = TodoDialog(self, "할 일 편집", item=self.todos[idx])  # 편집 모달
         self.wait_window(dlg)  # 대기
         if dlg.result:  # 저장됨
-            self.todos[idx] = dlg.result  # 교체
-            self._save()  # 저장
-            self.refresh_list()  # 갱신
+            self.refresh_list(self.store.replace(idx, dlg.result))  # 해당 행만 UPDATE 예약 → 편집된 행만 다시 그림
 
     def delete_selected(self) -> None:  # 삭제 핸들러
         """선택된 여러 항목을 삭제(뒤에서부터 지워 인덱스 당김 문제 방지)."""  # 구현 상세 설명
@@ -469,20 +1025,14 @@ class TodoApp(tk.Tk):  # Tk 루트 윈도우 상속
             return  # 종료
         if not messagebox.askyesno("삭제 확인", f"선택한 {len(sel)}개 항목을 정말 삭제할까요?", parent=self):  # 사용자 확인
             return  # 취소
-        for i in reversed(sel):  # New 뒤에서부터 지우면 앞쪽 인덱스의 안전성이 보장됨
-            del self.todos[i]  # 리스트에서 제거
-        self._save()  # 저장
-        self.refresh_list()  # 갱신
+        self.refresh_list(self.store.delete(sel))  # 선택된 행만 DELETE 예약 → 삭제된 행만 창에서 제거
 
     def cycle_status_selected(self) -> None:  # 상태 순환 핸들러
         """선택된 모든 항목의 상태를 0→1→2→0 순환."""  # 동작 설명
         sel = self._selected_indices()  # 선택 확인
         if not sel:  # 무선택
             return  # 종료
-        for i in sel:  # 선택 항목 순회
-            self.todos[i].cycle()  # 상태 순환 실행
-        self._save()  # 저장
-        self.refresh_list()  # 갱신
+        self.refresh_list(self.store.cycle(sel))  # status만 갱신 → 토글된 행만 다시 그림(선택 유지 → 스페이스 연타 가능)
 
     def _on_space_toggle(self, _e) -> str:  # 스페이스 토글 바인딩
         """스페이스바로 상태 순환(리스트박스 기본 스페이스 동작은 차단)."""  # 기본 동작 차단 이유 설명
@@ -494,7 +1044,7 @@ class TodoApp(tk.Tk):  # Tk 루트 윈도우 상속
         sel = self._selected_indices()  # 선택 확인
         if not sel:  # 무선택
             return  # 종료
-        t = self.todos[sel[0]]  # 대상 항목
+        t = self.todos[sel[0]]  # 대상 항목(sel은 모델 인덱스)
         icon = STATUS_ICON.get(t.status, "☐")  # 상태 아이콘
         msg = (  # 상세 메시지 문자열
             f"제목: {t.title}\n"
@@ -513,20 +1063,18 @@ class TodoApp(tk.Tk):  # Tk 루트 윈도우 상속
         m, ss = divmod(s, 60)  # 분/초 분리
         return f"{m:02d}:{ss:02d}"  # 2자리 0패딩 포맷
 
-    def _set_timer_controls_running(self, running: bool) -> None:  # 컨트롤 상태 전환 함수
-        """타이머 실행 여부에 따라 버튼/입력 상태를 전환(오조작 방지)."""  # UI 상태 머신 설명
-        if running:  # 실행 중
-            self.btn_start.config(state="disabled")  # 시작 비활성화
-            self.btn_pause.config(state="normal", text="일시정지")  # 일시정지 활성
-            self.btn_reset.config(state="normal")  # 초기화 활성
-            self.ent_minutes.config(state="disabled")  # 분 입력 잠금
-            self.ent_warn.config(state="disabled")  # 경고 입력 잠금
-        else:  # 정지 상태
-            self.btn_start.config(state="normal")  # 시작 활성화
-            self.btn_pause.config(state="disabled", text="일시정지")  # 일시정지 비활성
-            self.btn_reset.config(state="disabled")  # 초기화 비활성
-            self.ent_minutes.config(state="normal")  # 분 입력 허용
-            self.ent_warn.config(state="normal")  # 경고 입력 허용
+    def _focus_timer(self) -> Timer | None:  # 큰 라벨에 표시 중인 타이머
+        """포커스 타이머(목록에서 선택했거나 마지막으로 시작/종료된 타이머)."""  # 선정 규칙
+        return self.timers.timers.get(self._timer_focus) if self._timer_focus is not None else None  # 없으면 None
+
+    def _sync_timer_controls(self) -> None:  # 컨트롤 상태 전환 함수
+        """포커스 타이머 상태에 따라 일시정지/초기화, 대기열 유무에 따라 다음 순서 버튼을 전환(오조작 방지)."""  # UI 상태 머신 설명
+        t = self._focus_timer()  # 포커스 타이머
+        live = t is not None and t.state in (RUNNING, PAUSED)  # 조작 가능한 상태
+        self.btn_pause.config(state="normal" if live else "disabled",
+                              text="계속" if t is not None and t.state == PAUSED else "일시정지")  # 일시정지/계속
+        self.btn_reset.config(state="normal" if t is not None else "disabled")  # 초기화(목록에서 제거)
+        self.btn_next.config(state="normal" if self.timers.next_queued() else "disabled")  # 대기열이 있을 때만
 
     def _stop_tick_loop(self) -> None:  # 타이머 틱 루프 중지
         """예약된 타이머 틱(after) 루프를 안전하게 취소."""  # 예외 안전성 설명
@@ -536,6 +1084,7 @@ class TodoApp(tk.Tk):  # Tk 루트 윈도우 상속
             except Exception:
                 pass  # New 이미 만료/취소된 ID일 수 있으므로 예외를 무시해 안전성 확보
             self._timer_after_id = None  # 상태 클리어
+        self._timer_due = None  # 다음 틱이 즉시 호출이면 지연 측정에서 제외
 
     def _stop_blink(self) -> None:  # 깜박임 중지
         """타임업 깜박임 루프를 중지하고 글자색을 원래대로 복원."""  # 시각 상태 복원 설명
@@ -554,175 +1103,345 @@ class TodoApp(tk.Tk):  # Tk 루트 윈도우 상속
         self.lbl_timer.config(fg=("red" if self._blink_on else "black"))  # 색상 토글 적용
         self._blink_after_id = self.after(450, self._start_blink)  # New 0.45초 간격 → 자극은 주되 과도하지 않게
 
-    def start_timer(self) -> None:  # 타이머 시작 핸들러
-        """입력값 검증 후 타이머를 시작하고 주기 틱 루프를 가동."""  # 단계별 처리 설명
-        self._stop_tick_loop()  # 기존 루프 중지
-        self._stop_blink()  # 기존 깜박 중지
+    def _read_timer_inputs(self) -> tuple[str, int, int] | None:  # 입력 검증
+        """이름/분/경고 임계 입력을 검증해 (이름, 총 초, 경고 초)를 반환(오류면 안내 후 None)."""  # 반환 규칙
         # 1) 분 입력(실수 허용)
         try:
             minutes = float(self.ent_minutes.get().strip())  # 분 입력 파싱
         except Exception:
             messagebox.showerror("입력 오류", "발표 시간(분)을 숫자로 입력하세요. 예: 5 또는 7.5", parent=self)  # 오류 안내
             self.ent_minutes.focus_set()  # 포커스 복구
-            return  # 중단
+            return None  # 중단
         if minutes <= 0:  # 최소값 검증
             messagebox.showerror("입력 오류", "발표 시간(분)은 0보다 커야 합니다.", parent=self)  # 오류 안내
             self.ent_minutes.focus_set()  # 포커스 복구
-            return  # 중단
+            return None  # 중단
         # 2) 경고 임계(정수)
         try:
             warn = int(self.ent_warn.get().strip())  # 임계 파싱
         except Exception:
             messagebox.showerror("입력 오류", "경고 임계(초)를 정수로 입력하세요. 예: 30", parent=self)  # 오류 안내
             self.ent_warn.focus_set()  # 포커스 복구
-            return  # 중단
+            return None  # 중단
         if warn < 1:  # 최소 1초 보장
             messagebox.showerror("입력 오류", "경고 임계(초)는 1초 이상이어야 합니다.", parent=self)  # 오류 안내
             self.ent_warn.focus_set()  # 포커스 복구
-            return  # 중단
-
-        # 3) 내부 상태 셋업
-        total_sec = int(round(minutes * 60))  # 분→초 환산
-        self.timer_total_sec = total_sec  # 총 시간 저장
-        self.timer_warn_sec  = min(warn, max(1, total_sec - 1))  # New 경고 임계가 총시간 이상이 되지 않게 보정
-        self.timer_running   = True  # 실행 플래그
-        self.timer_end_mono  = time.monotonic() + self.timer_total_sec  # 종료 목표 시각
-        self.timer_remain_sec = self.timer_total_sec  # 남은 시간 초기화
+            return None  # 중단
+        # 3) 이름(비우면 순번)
+        name = self.ent_tname.get().strip() or f"타이머 {len(self.timers.timers) + 1}"  # 기본 이름
+        self.ent_tname.delete(0, tk.END)  # 다음 발표자 입력 준비
+        return name, int(round(minutes * 60)), warn  # 분→초 환산
 
-        # 4) UI 초기화
-        self.lbl_timer.config(text=self._format_sec(self.timer_remain_sec), fg="black")  # 초기 라벨/색
-        self.pb_timer.config(maximum=self.timer_total_sec, value=0)  # 진행 바 초기화
-        self._set_timer_controls_running(True)  # 컨트롤 상태 전환
+    def start_timer(self) -> None:  # 타이머 시작 핸들러
+        """입력값으로 새 타이머를 만들어 바로 시작(다른 타이머가 돌고 있어도 동시에 진행)."""  # 동시 실행 설명
+        vals = self._read_timer_inputs()  # 검증
+        if vals is None:  # 입력 오류
+            return  # 중단
+        t = self.timers.add(*vals)  # 보드에 추가
+        self._start_timer(t)  # 시작 + 포커스
 
-        # 5) 틱 루프 시작
-        self._tick_update()  # 주기 업데이트 가동
+    def enqueue_timer(self) -> None:  # 대기열 추가 핸들러
+        """입력값으로 대기(IDLE) 타이머를 대기열 끝에 추가(‘다음 순서’로 차례대로 시작)."""  # 대기열 설명
+        vals = self._read_timer_inputs()  # 검증
+        if vals is None:  # 입력 오류
+            return  # 중단
+        self._draw_timer_row(self.timers.add(*vals), time.monotonic())  # 목록에 행 추가
+        self._sync_timer_controls()  # 다음 순서 버튼 활성화
+        self._save_timers()  # 세션 저장 예약
+
+    def start_next_timer(self) -> None:  # 다음 순서 핸들러
+        """대기열 맨 앞 타이머를 시작."""  # 동작 설명
+        t = self.timers.next_queued()  # 다음 발표
+        if t is not None:  # 있으면
+            self._start_timer(t)  # 시작 + 포커스
+
+    def _start_timer(self, t: Timer) -> None:  # 시작 공통 처리
+        """t를 시작하고 포커스를 옮긴 뒤 예약표를 다시 계산."""  # 처리 순서
+        t.start(time.monotonic())  # 종료 시각 확정
+        self._set_timer_focus(t.id)  # 큰 라벨/진행 바 대상
+        self._rearm_timers()  # 즉시 그리고 다음 예약
+        self._save_timers()  # 세션 저장 예약
 
     def pause_resume_timer(self) -> None:  # 일시정지/계속 토글
-        """일시정지/계속 토글 — 남은 시간을 저장/복구하여 정확도 유지."""  # 로직 요약
-        if not self.timer_running:  # 현재 정지 상태면
-            # 계속
-            if self.timer_remain_sec <= 0:  # 이미 완료된 타이머면 무시
-                return  # 종료
-            self.timer_end_mono = time.monotonic() + self.timer_remain_sec  # 목표 시각 재설정
-            self.timer_running = True  # 실행 재개
-            self.btn_pause.config(text="일시정지")  # 버튼 라벨 변경
-            self._tick_update()  # 틱 루프 재가동
-            return  # 반환
-
-        # 일시정지
-        now_mono = time.monotonic()  # 현재 단조 시각
-        remain = max(0, int(math.ceil(self.timer_end_mono - now_mono)))  # 남은 초 계산
-        self.timer_remain_sec = remain  # 상태 반영
-        self.timer_running = False  # 정지
-        self.btn_pause.config(text="계속")  # 라벨 변경
-        self._stop_tick_loop()  # 루프 중지
+        """포커스 타이머의 일시정지/계속 토글 — 남은 시간을 소수 초 그대로 저장/복구하여 정확도 유지."""  # 로직 요약
+        t = self._focus_timer()  # 대상
+        if t is None or t.state not in (RUNNING, PAUSED):  # 조작 불가
+            return  # 종료
+        if t.state == PAUSED:  # 계속
+            t.start(time.monotonic())  # 남은 시간으로 재시작
+        else:  # 일시정지
+            t.pause(time.monotonic())  # 남은 시간 보관(힙 예약은 세대 변경으로 무효)
+        self._rearm_timers()  # 그리기 + 예약 재계산
+        self._sync_timer_controls()  # 버튼 라벨 전환
+        self._save_timers()  # 세션 저장 예약
 
     def reset_timer(self) -> None:  # 초기화 핸들러
-        """타이머를 완전히 초기 상태로 되돌림(루프/깜박임 포함)."""  # 리셋 범위 설명
-        self.timer_running = False  # 정지
-        self.timer_total_sec = 0  # 총 시간 리셋
-        self.timer_remain_sec = 0  # 남은 시간 리셋
-        self.timer_end_mono = 0.0  # 목표 시각 리셋
-        self._stop_tick_loop()  # 틱 루프 중지
+        """포커스 타이머를 멈추고 목록에서 제거(다른 타이머는 그대로 진행)."""  # 리셋 범위 설명
+        t = self._focus_timer()  # 대상
+        if t is None:  # 없음
+            return  # 종료
+        self.timers.remove(t.id)  # 보드에서 제거(예약 무효화)
+        self.tree_timers.delete(str(t.id))  # 목록 행 제거
         self._stop_blink()  # 깜박 중지
-        self.lbl_timer.config(text="00:00", fg="black")  # 라벨 리셋
-        self.pb_timer.config(maximum=1, value=0)  # 바 리셋
-        self._set_timer_controls_running(False)  # 컨트롤 비활성화
-
-    def _on_time_up(self) -> None:  # 타임업 처리
-        """남은 시간이 0이 되었을 때 타임업 처리(소리+색+깜박으로 강한 신호)."""  # 사용자 알림 강화
-        self.timer_running = False  # 정지
-        self._stop_tick_loop()  # 루프 중지
+        running = self.timers.running()  # 남은 실행 중 타이머
+        self._set_timer_focus(running[0].id if running else None)  # 다른 타이머로 포커스 이동
+        self._rearm_timers()  # 예약 재계산
+        self._save_timers()  # 세션 저장 예약
+
+    def _set_timer_focus(self, tid: int | None) -> None:  # 포커스 변경
+        """큰 라벨/진행 바가 보여줄 타이머를 바꾸고 즉시 다시 그린다."""  # 동작 설명
+        if tid != self._timer_focus:  # 바뀐 경우
+            self._stop_blink()  # 이전 타이머의 깜박임 중지
+        self._timer_focus = tid  # 기록
+        self._timer_shown = None  # 강제로 다시 그림
+        t = self._focus_timer()  # 새 대상
+        if t is None:  # 없음
+            self.lbl_timer.config(text="00:00", fg="black")  # 라벨 리셋
+            self.pb_timer.config(maximum=1, value=0)  # 바 리셋
+        else:  # 있음
+            left = t.remaining(time.monotonic())  # 지금 남은 시간
+            self.lbl_timer.config(text=self._format_sec(math.ceil(left)), fg="black")  # 라벨(실행 중이면 다음 틱에서 경고색 반영)
+            self.pb_timer.config(maximum=t.total, value=t.total - left)  # 바 최대값/진행
+            if self.tree_timers.exists(str(t.id)) and self.tree_timers.selection() != (str(t.id),):  # 목록 선택 동기화
+                self.tree_timers.selection_set(str(t.id))  # 선택 표시
+        self._sync_timer_controls()  # 버튼 상태
+
+    def _on_timer_select(self, _e=None) -> None:  # 목록 선택 콜백
+        """목록에서 고른 타이머를 포커스로(라벨/진행 바/버튼이 그 타이머를 가리킴)."""  # 동작 설명
+        sel = self.tree_timers.selection()  # 선택 행
+        if sel and int(sel[0]) != self._timer_focus:  # 다른 타이머
+            self._set_timer_focus(int(sel[0]))  # 포커스 이동
+            self._rearm_timers()  # 포커스 타이머만 더 촘촘히 깨어나도록 재계산
+
+    def _on_time_up(self, t: Timer) -> None:  # 타임업 처리
+        """남은 시간이 0이 된 타이머를 종료하고 포커스로 가져와 알림(소리+색+깜박으로 강한 신호)."""  # 사용자 알림 강화
+        self.timers.complete(t, time.time())  # 종료 상태(예약 무효화) + 완료 이력
+        self._save_timers()  # 세션/이력 저장 예약
+        self._draw_timer_row(t, 0.0)  # 목록 행 갱신
+        self._set_timer_focus(t.id)  # 끝난 타이머를 바로 보여줌
         self.lbl_timer.config(text="00:00", fg="red")  # 빨간색 0초
-        self.pb_timer.config(value=self.timer_total_sec)  # 진행 바 끝까지
+        self.pb_timer.config(value=t.total)  # 진행 바 끝까지
         try:
             self.bell()  # 시스템 벨
         except Exception:
             pass  # 일부 환경에서 시스템 벨 실패 가능 → 조용히 무시
-        self.btn_pause.config(state="disabled", text="일시정지")  # 일시정지 버튼 비활성화
         self._start_blink()  # 깜박임 시작
 
-    def _tick_update(self) -> None:  # 주기 틱 함수
-        """200ms 간격으로 남은 시간을 갱신하고, 경고/진행률/종료를 처리."""  # 주기/역할 설명
-        if not self.timer_running:  # 정지 상태면
-            return  # 갱신 중단
-        now_mono = time.monotonic()  # 현재 단조 시각
-        remain = int(max(0, math.ceil(self.timer_end_mono - now_mono)))  # 남은 초 계산(올림)
-        self.timer_remain_sec = remain  # 상태 반영
-        self.lbl_timer.config(text=self._format_sec(remain))  # 라벨 갱신
-        if remain == 0:  # 종료 시점
-            self._on_time_up()  # 타임업 처리
-            return  # 루프 종료
-        elif remain <= self.timer_warn_sec:  # 경고 구간 진입
-            self.lbl_timer.config(fg="orange")  # 주황색 표시
-        else:  # 정상 구간
-            self.lbl_timer.config(fg="black")  # 검정 표시
-        done = self.timer_total_sec - remain  # 경과 초
-        self.pb_timer.config(value=done)  # 진행 바 갱신
-        self._timer_after_id = self.after(200, self._tick_update)  # 다음 틱 예약
-        # New 200ms면 충분히 부드럽고, CPU 소모도 과하지 않은 타협값.
+    def _on_timers_loaded(self, rows: list[tuple]) -> None:  # 세션 복원 콜백
+        """지난 실행의 타이머를 되살린다(실행 중이던 것은 벽시계 기준으로 이어서, 꺼진 사이 끝난 것은 이력으로)."""  # 복원 규칙
+        self._timers_loaded = True  # 이제부터 스냅샷이 DB 내용을 대신함
+        if not rows:  # 복원할 것 없음
+            if self.timers.timers:  # 복원 전에 만든 타이머가 있으면
+                self._save_timers()  # 미뤄 둔 저장 수행
+            return  # 종료
+        ended = self.timers.restore(rows, time.monotonic(), time.time())  # 모델 복원
+        for t in ended:  # 꺼진 사이 끝난 타이머(restore에서 이력으로 기록됨)
+            self.timers.remove(t.id)  # 목록에 남기지 않음(스냅샷에서도 빠지므로 다음 실행과 같은 모습)
+        running = self.timers.running()  # 이어서 진행할 타이머
+        if self._timer_focus is None and self.timers.timers:  # 사용자가 아직 고른 타이머가 없으면
+            first = running[0] if running else next(iter(self.timers.timers.values()))  # 실행 중인 것 우선
+            self._set_timer_focus(first.id)  # 포커스
+        self._rearm_timers()  # 목록 행 + 예약
+        self._save_timers()  # 이력 기록 + 벽시계 기준 재저장(복원 전에 만든 타이머도 함께)
+
+    def _save_timers(self, delay: int = TIMER_SAVE_MS) -> None:  # 저장 예약
+        """delay 후 세션 스냅샷을 저장하도록 예약(그 사이의 변경은 한 번에 모아 씀)."""  # 배치 규칙
+        if self._timer_save_after_id is not None:  # 기존 예약
+            self.after_cancel(self._timer_save_after_id)  # 미루기(디바운스)
+        self._timer_save_after_id = self.after(delay, self._flush_timers)  # 저장 예약
+
+    def _flush_timers(self, resync: bool = True) -> None:  # 세션 저장
+        """세션 스냅샷과 쌓인 완료 이력을 워커에 넘기고, 실행 중인 타이머가 있으면 주기 재저장을 예약."""  # 동작 설명
+        if self._timer_save_after_id is not None:  # 예약 정리(종료 시 직접 호출 대비)
+            self.after_cancel(self._timer_save_after_id)  # 취소
+            self._timer_save_after_id = None  # 상태 클리어
+        if self._timers_loaded:  # 복원 전(로딩 중 종료 등)에는 DB의 세션을 덮어쓰지 않음
+            self._db_submit(save_timers, self.timers.snapshot(time.monotonic(), time.time()), key="timers")  # 대기 중이면 최신 스냅샷으로 병합
+        if self.timers.history:  # 완료 이력
+            self._db_submit(append_history, self.timers.history[:])  # 추가(병합하지 않음 → 유실 없음)
+            self.timers.history.clear()  # 비움
+            if resync:  # 종료 중이 아니면(종료 시엔 애니메이션/폴링을 다시 깨우지 않음)
+                self._invalidate_report()  # 리포트의 발표 연습 요약 갱신
+        if resync and self.timers.running():  # 실행 중이면
+            self._save_timers(TIMER_RESYNC_MS)  # 벽시계 기준 재저장(시계 보정/크래시 대비)
+
+    def _timer_visible(self) -> bool:  # 타이머 탭 표시 여부
+        """타이머 탭이 선택돼 있고 창이 최소화되지 않았는지."""  # 판정 기준
+        return self.nb.select() == str(self.tab_timer) and self.state() != "iconic"  # 보일 때만 그림
+
+    def _draw_timer_row(self, t: Timer, now: float) -> None:  # 목록 행 갱신
+        """타이머 1개의 목록 행(이름/남은 시간/상태)을 만들거나 갱신."""  # 동작 설명
+        values = (t.name, self._format_sec(math.ceil(t.remaining(now))), TIMER_STATE_TEXT[t.state])  # 행 값
+        iid = str(t.id)  # 행 id = 타이머 id
+        if self.tree_timers.exists(iid):  # 기존 행
+            self.tree_timers.item(iid, values=values)  # 값만 교체
+        else:  # 새 행
+            self.tree_timers.insert("", "end", iid=iid, values=values)  # 끝에 추가(대기열 순서)
+
+    def _rearm_timers(self) -> None:  # 전체 재예약
+        """실행 중인 모든 타이머를 지금 값으로 그리고 다음 깨어날 시각을 다시 계산(포커스/표시 상태가 바뀐 뒤 호출)."""  # 호출 시점
+        self._stop_tick_loop()  # 기존 예약 취소
+        now = time.monotonic()  # 기준 시각
+        for t in self.timers.timers.values():  # 모든 타이머
+            if t.state == RUNNING:  # 실행 중
+                self._service_timer(t, now)  # 그리기 + 힙에 다음 예약(이전 예약은 세대 변경으로 무효)
+            else:  # 정지/대기/종료
+                self._draw_timer_row(t, now)  # 행만 갱신
+        self._schedule_timers()  # 힙 맨 앞에 after 1개
+
+    def _schedule_timers(self) -> None:  # 단일 after 예약
+        """힙에서 가장 이른 예약 시각에 after 하나만 건다(타이머가 몇 개든 콜백은 1개)."""  # 설계 설명
+        due = self.timers.heap.next_due()  # 가장 이른 유효 예약
+        if due is None:  # 실행 중인 타이머 없음
+            return  # 잠듦
+        now = time.monotonic()  # 현재 시각
+        ms = max(0, int(math.ceil((due - now) * 1000))) + TIMER_SLACK_MS  # 경계 직후
+        self._timer_due = now + ms / 1000  # 예정 시각(지연 측정 기준)
+        self._timer_after_id = self.after(ms, self._tick_update)  # 다음 틱 예약
+
+    def _tick_update(self) -> None:  # 타이머 틱 함수
+        """기한이 된 타이머만 꺼내 갱신하고, 각자의 다음 깨어날 시각을 힙에 넣은 뒤 다시 예약."""  # 스케줄 규칙
+        self._timer_after_id = None  # 방금 실행된 예약
+        now = time.monotonic()  # 현재 단조 시각
+        if self._timer_due is not None:  # 예약으로 깨어난 경우
+            self._timer_late.append(max(0.0, now - self._timer_due))  # 예정보다 늦은 시간 기록
+            self._timer_due = None  # 소비
+        self._timer_ticks += 1  # 깨어남 횟수
+        for t in self.timers.heap.pop_due(now):  # 기한 도래 타이머만(나머지는 건드리지 않음)
+            self._service_timer(t, now)  # 갱신 + 다음 예약
+        self._schedule_timers()  # 힙 맨 앞에 다시 예약
+
+    def _service_timer(self, t: Timer, now: float) -> None:  # 타이머 1개 처리
+        """t의 라벨/행/진행 바를 갱신하고 다음 깨어날 시각을 힙에 넣는다(0초면 타임업).
+
+        포커스 타이머는 초 경계와 진행 바 1px 이동 중 빠른 쪽, 나머지는 초 경계에만 깨어난다.
+        탭이 안 보이면 그리지 않고 종료 시각에만 깨어난다(탭으로 돌아오면 _on_visibility가 즉시 다시 그림).
+        """  # 스케줄 규칙
+        left = t.remaining(now)  # 남은 시간(소수 초)
+        remain = int(math.ceil(left))  # 표시할 남은 초(올림)
+        if remain <= 0:  # 종료 시점
+            self._on_time_up(t)  # 타임업 처리
+            return  # 재예약 없음
+        if not self._timer_visible():  # 안 보이면
+            self.timers.heap.push(now + left, t)  # 종료 시각에만 깨어남(벨/깜박임은 제시간에)
+            return  # 그리기 생략
+        self._draw_timer_row(t, now)  # 목록 행(초 단위)
+        wait = left - (remain - 1)  # 다음 초 경계까지
+        if t.id == self._timer_focus:  # 큰 라벨 대상
+            shown = (self._format_sec(remain), "orange" if remain <= t.warn else "black")  # 라벨/경고색
+            if shown != self._timer_shown:  # 초가 바뀐 경우만
+                self._timer_shown = shown  # 기록
+                self.lbl_timer.config(text=shown[0], fg=shown[1])  # 라벨 갱신
+                late = self._timer_late  # 지연 표본
+                if late:  # 측정값 있음
+                    self.var_jitter.set(f"틱 {self._timer_ticks}회 · 지연 평균 {sum(late) / len(late) * 1000:.1f}ms"
+                                        f" / 최대 {max(late) * 1000:.1f}ms")  # 지연 보고
+            self.pb_timer.config(value=t.total - left)  # 진행 바(소수 초 → 매끄럽게)
+            px = max(1, self.pb_timer.winfo_width())  # 바 폭(px)
+            wait = min(wait, max(PROGRESS_MIN_MS / 1000, t.total / px))  # 바가 1px 움직이는 시간(상한 20fps)
+        self.timers.heap.push(now + wait, t)  # 다음 깨어날 시각
+        # New 타이머마다 after 체인을 두지 않고 힙 하나로 모으므로 동시 타이머 수와 무관하게 예약된 콜백은 1개다.
 
     # ─────────────────────────────────────────────────────────
     # 리포트 로직(집계/시각화/오토루프/마일스톤 컨페티)            # 대시보드 엔진
     # ─────────────────────────────────────────────────────────
     def _stop_report_loop(self) -> None:  # 리포트 루프 중지
-        """리포트 자동 갱신(after) 예약이 있으면 취소하여 중복 루프를 방지."""  # 중복 방지 설명
+        """자정 타이머(after) 예약이 있으면 취소하여 중복 예약을 방지."""  # 중복 방지 설명
         if self._report_after_id:  # 예약 존재 검사
             try:
                 self.after_cancel(self._report_after_id)  # 예약 취소
             except Exception:
                 pass  # 예외 무시
             self._report_after_id = None  # 상태 클리어
-        # New 리스트 갱신/탭 초기화 등에서 refresh_report를 다시 부를 때 중복 예약을 예방.
+        # New 자정 재예약/종료 처리에서 중복 예약을 예방.
+
+    def _schedule_midnight(self) -> None:  # 자정 타이머 예약
+        """다음 로컬 자정 직후에 _on_midnight가 한 번 불리도록 예약."""  # 예약 규칙
+        self._stop_report_loop()  # 기존 예약 제거
+        now = datetime.now()  # 로컬 시각
+        nxt = datetime.combine(now.date() + timedelta(days=1), datetime.min.time())  # 다음 자정
+        ms = int((nxt - now).total_seconds() * 1000) + MIDNIGHT_SLACK_MS  # 남은 시간(+여유)
+        self._report_after_id = self.after(ms, self._on_midnight)  # 하루 한 번만 깨어남
+
+    def _on_midnight(self) -> None:  # 날짜 변경 처리
+        """날짜가 바뀌면 D-DAY 표시와 임박/지남/주간 집계가 달라지므로 목록과 리포트를 갱신하고 다음 자정을 예약."""  # 갱신 이유
+        self._report_after_id = None  # 방금 실행된 예약
+        self.listbox.redraw()  # 보이는 행의 D-DAY만 재계산(선택/스크롤 유지)
+        self.refresh_report()  # 임박/지남/주간 집계 무효화(스냅샷은 오늘 날짜로 다시 계산됨)
+        self._schedule_midnight()  # 다음 날 예약(절전 복귀 등으로 늦게 깨어도 기준은 다시 계산)
+
+    def _report_visible(self) -> bool:  # 리포트 탭 표시 여부
+        """리포트 탭이 선택돼 있고 창이 최소화되지 않았는지."""  # 판정 기준
+        return self.nb.select() == str(self.tab_report) and self.state() != "iconic"  # 보일 때만 그림
+
+    def _on_visibility(self) -> None:  # 탭 전환/창 복원
+        """리포트/타이머가 다시 보이게 되면 밀린 갱신을 그리고 멈춰 둔 애니메이션·틱을 재개."""  # 처리 내용
+        self._flush_report()  # 더러우면 그림
+        self.frames.resume()  # 프레임 틱 재개(안 보이면 아무것도 안 함)
+        if self.timers.running():  # 실행 중인 타이머가 있으면
+            self._timer_shown = None  # 강제로 다시 그림
+            self._rearm_timers()  # 숨김 상태의 긴 예약을 버리고 지금 값으로 그린 뒤 재예약
+
+    def _invalidate_report(self) -> None:  # 리포트 무효화
+        """다시 그려야 한다고 표시하고, 지금 보이면 바로 그린다."""  # 동작 설명
+        self._report_dirty = True  # 더러움 표시
+        self._flush_report()  # 보이면 즉시 반영
 
     def calc_report_stats(self) -> dict:  # 집계 함수
-        """self.todos를 집계해 리포트용 요약 지표를 계산."""  # 지표 정의 설명
-        total = len(self.todos)  # 총 개수
-        if total == 0:  # 비어있을 때
-            # New 빈 리스트일 때도 UI가 안정적으로 렌더되도록 0/빈 배열을 반환
-            return {"rate": 0.0, "avg_days": 0.0, "soon": 0, "overdue": 0,
-                    "counts": (0, 0, 0), "week_bins": [0]*7}  # 기본 구조 반환
-
-        # 상태별 개수
-        cnt0 = sum(1 for t in self.todos if t.status == 0)  # 미완
-        cnt1 = sum(1 for t in self.todos if t.status == 1)  # 진행
-        cnt2 = sum(1 for t in self.todos if t.status == 2)  # 완료
-        rate = round(cnt2 / total * 100, 1)                 # 완료율(소수 1자리)
-
-        today = date.today()  # 오늘 날짜
-        start_week = today - timedelta(days=today.weekday())  # New 이번 주의 월요일(week anchor)
-        soon = 0       # 3일 이내 마감(미완/진행만)
-        overdue = 0    # 마감이 지난 항목(미완/진행만)
-        durations: list[int] = []  # (종료-시작) 일수
-        week_bins = [0]*7          # 월(0)~일(6) 마감 건수
-
-        for t in self.todos:  # 항목 순회
-            try:
-                d1 = parse_date(t.start).date()  # 시작일 파싱
-                d2 = parse_date(t.end).date()    # 종료일 파싱
-            except Exception:
-                continue  # 잘못된 날짜는 스킵(리포트가 전체 실패로 이어지지 않도록 보호)
-
-            if d2 >= d1:  # 음수 기간 방지
-                durations.append((d2 - d1).days)  # 기간 리스트에 추가
-            delta = (d2 - today).days  # 오늘 기준 잔여 일수
-            if t.status != 2 and 0 <= delta <= 3:  # 완료 제외 + 3일 이내
-                soon += 1  # 임박++
-            if t.status != 2 and delta < 0:  # 완료 제외 + 마감 초과
-                overdue += 1  # 지남++
-            off = (d2 - start_week).days  # 이번주 offset
-            if 0 <= off < 7:  # 이번 주 범위 내
-                week_bins[off] += 1  # 해당 요일 카운트
-
-        avg_days = round(sum(durations)/len(durations), 1) if durations else 0.0  # 평균 기간 계산
-        return {"rate": rate, "avg_days": avg_days, "soon": soon, "overdue": overdue,
-                "counts": (cnt0, cnt1, cnt2), "week_bins": week_bins}  # 집계 결과 반환
+        """리포트용 요약 지표를 반환(store의 증분 집계 → 전체 순회 없음)."""  # 지표 정의 설명
+        if self._loader is None or not self._loader.done:  # 아직 스트리밍 로딩 중이면 메모리 집계가 불완전
+            return self._sql_stats or self.store.report()  # 워커가 마지막으로 계산한 DB 기준 요약
+        return self.store.report()  # 데이터/날짜가 그대로면 캐시된 dict를 그대로 반환
         # New 임박/지남은 “완료되지 않은 항목”만 대상으로 계산 → 관리 포인트만 부각.
 
     def refresh_report(self) -> None:  # 리포트 갱신 루틴
-        """리포트 텍스트/KPI와 시각화를 갱신하고, 5초 후 다시 자신을 예약."""  # 오토루프 설명
-        self._stop_report_loop()  # 중복 루프 방지
-        s = self.calc_report_stats()  # 집계 수행
+        """모델이 바뀌었음을 알린다(리포트 탭이 보이면 바로 그리고, 아니면 탭을 열 때 그림)."""  # 이벤트 구동 설명
+        self._invalidate_report()  # 더러움 표시 + 보이면 반영
+        # New 주기 루프 없이 변경/날짜/탭 전환 때만 일하므로 유휴 상태의 CPU 사용이 0에 가깝다.
+
+    def _flush_report(self) -> None:  # 리포트 반영
+        """더러운 상태이고 리포트 탭이 보일 때만 집계를 갱신하고 그린다."""  # 실행 조건
+        if not self._report_dirty or not self._report_visible():  # 바뀐 것이 없거나 안 보임
+            return  # 나중에(탭 전환 시) 처리
+        self._report_dirty = False  # 처리 시작
+        if self._loader is None or not self._loader.done:  # 로딩 중이면 전체 기준 집계를 워커에 요청
+            self._db_submit(sql_report_stats, write=False, key="sql_stats", callback=self._on_sql_stats)  # 중복 요청은 병합
+        self._db_submit(timer_history_stats, write=False, key="timer_stats", callback=self._on_timer_stats)  # 이력 집계(인덱스 범위 스캔)
+        self._request_trend()  # 완료 추이(롤업 범위 조회)
+        self._draw_report()  # 현재 가진 집계로 그리기
+
+    def _request_trend(self) -> None:  # 추이 요청
+        """선택한 기간의 완료 추이를 워커에 요청(연속 요청은 마지막 기간 하나로 병합)."""  # 병합 규칙
+        self._db_submit(rollup_trend, self.var_trend_days.get(), write=False, key="trend", callback=self._on_trend)  # 읽기 전용
+
+    def _on_trend(self, tr: dict) -> None:  # 추이 수신 콜백
+        """롤업 추이를 보관하고 요약 라벨/막대를 갱신."""  # 동작 설명
+        self._trend = tr  # 보관(폭 변경 시 다시 그림)
+        unit = f" · 막대 {tr['width']}일" if tr["width"] > 1 else ""  # 구간 폭 안내
+        self.var_trend.set(f"완료 {tr['completed']} · 되돌림 {tr['reopened']} · 추가 {tr['created']}"
+                           f" · 하루 {tr['per_day']}건{unit}")  # 기간 합계
+        self._draw_trend()  # 막대 갱신
+
+    def _on_timer_stats(self, s: dict) -> None:  # 타이머 이력 집계 수신 콜백
+        """최근 7일 완료 세션 요약을 라벨에 반영."""  # 표시 내용
+        self.var_talks.set(f"발표 연습({s['days']}일): {s['sessions']}회 · {s['minutes']:g}분 / 누적 {s['all_sessions']}회")  # 라벨
+
+    def _on_sql_stats(self, s: dict) -> None:  # SQL 집계 수신 콜백
+        """워커가 계산한 DB 기준 요약을 보관하고 다시 그린다(재요청하지 않음)."""  # 루프 방지 설명
+        self._sql_stats = s  # 보관
+        if self._loader is None or not self._loader.done:  # 그 사이 로딩이 끝났으면 메모리 집계가 우선
+            if self._report_visible():  # 보이면
+                self._draw_report()  # 다시 그리기(재요청 없이)
+            else:  # 안 보이면
+                self._report_dirty = True  # 탭을 열 때 그림
+
+    def _draw_report(self) -> None:  # 리포트 그리기
+        """리포트 텍스트/KPI와 시각화를 갱신(스냅샷/폭이 같으면 생략)."""  # 생략 규칙
+        s = self.calc_report_stats()  # 집계 조회(O(1))
+        key = (s, self.cnv_stack.winfo_width())  # 데이터 + 레이아웃 폭
+        if self._drawn is not None and key[0] is self._drawn[0] and key[1] == self._drawn[1]:  # 변화 없음
+            return  # New 데이터가 그대로면 텍스트/캔버스 갱신을 통째로 생략
+        self._drawn = key  # 이번에 그린 상태 기록
 
         # 텍스트 KPI
         self.lbl_rate.config(text=f"완료율 {s['rate']:.1f}%")  # 완료율 표시
@@ -748,94 +1467,114 @@ class TodoApp(tk.Tk):  # Tk 루트 윈도우 상속
         self._report_booted = True  # 첫 갱신 이후로 전환
         self._last_rate = s["rate"]  # 현재 완료율 저장
 
-        # 다음 자동 갱신 예약(5초)
-        self._report_after_id = self.after(5000, self.refresh_report)  # 자기 재호출 예약
-        # New 리스트 변동이 잦아도 비용이 낮은 집계/드로잉만 수행 → UI 반응성 유지.
-
     # ─────────────────────────────────────────────────────────
     # New 색상/도넛/스택바/히트맵/컨페티 드로잉 유틸              # 시각화 유틸 모듈
     # ─────────────────────────────────────────────────────────
     def _rate_color(self, rate: float) -> str:  # 색상 결정 함수
         """New 완료율(%)에 따른 시그널 색을 반환: <50 빨강, <80 주황, 그 외 초록."""  # 색상 구간 규칙
-        return "#e53935" if rate < 50 else "#fb8c00" if rate < 80 else "#43a047"  # 삼항으로 간결 처리
+        return rate_color(rate)  # HTML 리포트와 같은 규칙(todo_report)
+
+    def _create_report_items(self) -> None:  # 리포트 캔버스 아이템 생성
+        """도넛(링/아크/퍼센트), 스택바(구간 3개+외곽선), 히트맵(칸 7개+요일 7개) 아이템을 한 번만 만든다."""  # 구성 설명
+        c = self.cnv_ring  # 도넛 캔버스
+        cx, cy, r, th = 80, 80, 70, 14  # 중심/반지름/두께 파라미터
+        c.create_oval(cx - r, cy - r, cx + r, cy + r, outline="#e6e6e6", width=th)  # 바탕 링(이후 변경 없음)
+        self._ring_arc = c.create_arc(cx - r, cy - r, cx + r, cy + r, start=90, extent=0,
+                                      style="arc", width=th, outline=self._rate_color(0))  # 진행 아크(12시에서 시계방향)
+        self._ring_text = c.create_text(cx, cy, text="0.0%", font=("Helvetica", 16, "bold"))  # 중앙 퍼센트
+        c = self.cnv_stack  # 스택바 캔버스
+        self._stack_segs = [c.create_rectangle(0, 0, 0, 22, fill=col, width=0) for col in STACK_COLORS]  # 구간 박스
+        self._stack_frame = c.create_rectangle(0, 0, 0, 22, outline="#d0d0d0")  # 외곽선
+        c = self.cnv_heat  # 히트맵 캔버스
+        self._heat_cells = [c.create_rectangle(0, 0, 0, 0, fill=HEAT_LUT[0], outline="#cfd8dc") for _ in WEEK_DAYS]  # 칸
+        self._heat_labels = [c.create_text(0, 0, text=d, font=("Helvetica", 9)) for d in WEEK_DAYS]  # 요일 라벨
+        self._heat_w = -1  # 마지막으로 배치한 폭(같으면 coords 생략)
+        c = self.cnv_trend  # 추이 캔버스
+        c.create_line(0, 62, 4000, 62, fill="#d0d0d0")  # 기준선(폭보다 길게 한 번만)
+        self._trend_done = [c.create_rectangle(0, 0, 0, 0, fill="#43a047", width=0) for _ in range(TREND_BINS)]  # 완료 막대
+        self._trend_back = [c.create_rectangle(0, 0, 0, 0, fill="#e53935", width=0) for _ in range(TREND_BINS)]  # 되돌림 막대(완료 막대 위에 겹침)
+        # New delete("all") + 재생성 대신 itemconfig/coords만 호출 → 애니메이션 중 Tk 아이템 할당/해제가 없다.
 
     def _draw_ring(self, rate: float) -> None:  # 도넛 렌더 함수
-        """완료율(0~100)을 도넛 형태로 그린다(베이스 링+진행 아크+중앙 퍼센트)."""  # 요소 구성 설명
+        """완료율(0~100)을 도넛에 반영(아크 각도/색과 중앙 퍼센트만 갱신)."""  # 갱신 대상 설명
         c = self.cnv_ring  # 대상 캔버스 단축 참조
-        c.delete("all")  # 이전 프레임 지우기
-        cx, cy, r, th = 80, 80, 70, 14  # 중심/반지름/두께 파라미터
-        # 베이스(회색 링)
-        c.create_oval(cx - r, cy - r, cx + r, cy + r, outline="#e6e6e6", width=th)  # 바탕 링
-        # 진행 아크(12시 방향에서 시계방향으로 채움)
-        col = self._rate_color(rate)  # 비율에 따른 색상
-        extent = 360 * (rate / 100)  # 각도(0~360)
-        c.create_arc(cx - r, cy - r, cx + r, cy + r, start=90, extent=-extent,
-                     style="arc", width=th, outline=col)  # 진행 아크(시계방향)
-        # 중앙 퍼센트 라벨
-        c.create_text(cx, cy, text=f"{rate:.1f}%", font=("Helvetica", 16, "bold"))  # 퍼센트 텍스트
+        c.itemconfigure(self._ring_arc, extent=-360 * (rate / 100), outline=self._rate_color(rate))  # 진행 아크(시계방향)
+        c.itemconfigure(self._ring_text, text=f"{rate:.1f}%")  # 퍼센트 텍스트
+        self._ring_val = rate  # 지금 그려진 값(다음 애니메이션의 시작점)
 
     def _animate_ring_to(self, target: float) -> None:  # 도넛 애니 함수
         """완료율 변화량에 따라 도넛을 부드럽게 보간 렌더(아주 작으면 즉시 반영)."""  # 애니 정책 설명
-        start = getattr(self, "_ring_anim_start", self._last_rate)  # 시작값(없으면 마지막 완료율)
+        start = self._ring_val  # 시작값 = 지금 화면에 그려진 값(진행 중 애니메이션의 중간값일 수도 있음)
         if abs(target - start) < 0.2:     # New 0.2% 미만 변화는 눈에 안 띄므로 바로 그림
+            self.frames.cancel("ring")  # 진행 중인 도넛 애니메이션이 있으면 멈춤
             self._draw_ring(target)  # 즉시 렌더
-            self._ring_anim_start = target  # 상태 저장
             return  # 종료
-        steps = max(8, int(abs(target - start) // 2))  # 변화폭에 비례한 스텝 수(하한 8)
-        def step(i=0):  # 내부 스텝 함수
-            val = start + (target - start) * i / steps  # 선형 보간
-            self._draw_ring(val)  # 중간값 렌더
-            if i < steps:  # 다음 스텝 존재
-                self.after(16, step, i + 1)  # 약 60fps
-            else:  # 마지막 스텝
-                self._ring_anim_start = target  # 상태 저장
-        step()  # 애니 시작
+        duration = max(8, int(abs(target - start) // 2)) * FRAME_MS / 1000  # 변화폭에 비례한 길이(하한 8프레임)
+        def frame(p: float) -> None:  # 프레임 함수
+            self._draw_ring(start + (target - start) * p)  # 경과 시간 기준 선형 보간
+        self.frames.start("ring", frame, duration)  # 같은 키 → 연타해도 도넛 애니메이션은 항상 하나
 
     def _draw_stack(self, counts: tuple[int, int, int]) -> None:  # 스택바 렌더 함수
         """상태 구성(미완/진행/완료)을 가로 스택바로 시각화."""  # 입력/표현 설명
         c = self.cnv_stack  # 대상 캔버스
-        c.delete("all")  # 초기화
         w = c.winfo_width() or 400  # 현재 폭(레이아웃 초기엔 0일 수 있어 기본값 400)
         h = 22  # 고정 높이
         total = max(1, sum(counts))  # 0분모 방지
-        colors = ["#90a4ae", "#fb8c00", "#43a047"]  # 미완/진행/완료 색
         x = 0  # 누적 X 시작점
-        for n, col in zip(counts, colors):  # 구간 렌더
+        for n, item in zip(counts, self._stack_segs):  # 구간별
             seg = int(w * n / total)  # 구간 길이
-            c.create_rectangle(x, 0, x + seg, h, fill=col, width=0)  # 구간 박스
+            c.coords(item, x, 0, x + seg, h)  # 구간 박스 위치/폭만 갱신
             x += seg  # 다음 시작점 이동
-        c.create_rectangle(0, 0, w, h, outline="#d0d0d0")  # 외곽선으로 바 경계 명확화
+        c.coords(self._stack_frame, 0, 0, w, h)  # 외곽선으로 바 경계 명확화
 
     def _draw_heat(self, bins: list[int]) -> None:  # 히트맵 렌더 함수
         """이번 주(월~일) 마감 건수를 연녹→진녹 그라데이션으로 히트맵 표시."""  # 색/의미 설명
         c = self.cnv_heat  # 대상 캔버스
-        c.delete("all")  # 초기화
         w = c.winfo_width() or 420  # 현재 폭(레이아웃 초기 보정)
-        h = 56  # 고정 높이
-        cell = w // 7  # 하루당 칸 폭
-        pad = 4  # 칸 내부 패딩
-        days = ["월", "화", "수", "목", "금", "토", "일"]  # 요일 라벨
+        if w != self._heat_w:  # 폭이 바뀐 경우에만 배치
+            self._heat_w = w  # 기록
+            h = 56  # 고정 높이
+            cell = w // 7  # 하루당 칸 폭
+            pad = 4  # 칸 내부 패딩
+            for i, (rect, label) in enumerate(zip(self._heat_cells, self._heat_labels)):  # 7일 순회
+                x0, x1 = i * cell + pad, (i + 1) * cell - pad  # X 영역
+                c.coords(rect, x0, pad, x1, h - 18)  # 칸 위치
+                c.coords(label, (x0 + x1) // 2, h - 8)  # 요일 라벨 위치
         mx = max(bins) or 1  # 최대값 0일 때 0으로 나누기 방지
-        def blend(a: str, b: str, t: float) -> str:  # 색 보간 유틸
-            """hex 색상 a→b 사이를 t(0~1)로 보간하여 hex로 반환."""  # 보간 규칙 설명
-            ah, ag, ab = int(a[1:3], 16), int(a[3:5], 16), int(a[5:7], 16)  # 색상 a 분해
-            bh, bg, bb = int(b[1:3], 16), int(b[3:5], 16), int(b[5:7], 16)  # 색상 b 분해
-            ih, ig, ib = int(ah + (bh - ah) * t), int(ag + (bg - ag) * t), int(ab + (bb - ab) * t)  # 보간
-            return f"#{ih:02x}{ig:02x}{ib:02x}"  # 보간 결과 hex
-        for i, v in enumerate(bins):  # 7일 순회
-            x0, x1 = i * cell + pad, (i + 1) * cell - pad  # X 영역
-            y0, y1 = pad, h - 18  # Y 영역
-            col = blend("#e8f5e9", "#1b5e20", v / mx)  # 연녹→진녹 매핑
-            c.create_rectangle(x0, y0, x1, y1, fill=col, outline="#cfd8dc")  # 칸 렌더
-            c.create_text((x0 + x1) // 2, h - 8, text=days[i], font=("Helvetica", 9))  # 요일 라벨
+        top = HEAT_LEVELS - 1  # LUT 마지막 인덱스
+        for rect, v in zip(self._heat_cells, bins):  # 칸별 색만 갱신
+            c.itemconfigure(rect, fill=HEAT_LUT[round(v * top / mx)])  # 연녹→진녹 매핑(LUT 조회)
         # New 수치 라벨 없이도 '농도'로 피크 요일을 직관적으로 파악 가능.
 
+    def _draw_trend(self) -> None:  # 추이 렌더 함수
+        """구간별 완료(초록)/되돌림(빨강) 건수를 막대로 표시(남는 막대는 크기 0으로 숨김)."""  # 표현 설명
+        tr = self._trend  # 마지막 추이
+        if tr is None:  # 아직 수신 전
+            return  # 종료
+        c = self.cnv_trend  # 대상 캔버스
+        w = c.winfo_width() or 420  # 현재 폭(레이아웃 초기 보정)
+        bins = tr["bins"]  # [(completed, reopened, created)]
+        slot = w / len(bins)  # 구간당 폭
+        gap = 1 if slot < 6 else 2  # 막대 사이 여백
+        mx = max(max(b[0], b[1]) for b in bins) or 1  # 0 나누기 방지
+        base, top = 62, 4  # 기준선/상단 여백
+        for i, (done, back) in enumerate(zip(self._trend_done, self._trend_back)):  # 고정 아이템 재사용
+            if i >= len(bins):  # 쓰지 않는 막대
+                c.coords(done, 0, 0, 0, 0)  # 완료 막대 숨김
+                c.coords(back, 0, 0, 0, 0)  # 되돌림 막대 숨김
+                continue  # 다음
+            x0, x1 = i * slot + gap, (i + 1) * slot - gap  # X 영역
+            n_done, n_back = bins[i][0], bins[i][1]  # 완료/되돌림
+            c.coords(done, x0, base - (base - top) * n_done / mx, x1, base)  # 완료 막대
+            c.coords(back, x0, base - (base - top) * n_back / mx, x1, base)  # 되돌림 막대
+        # New 기간이 365일이어도 막대는 TREND_BINS개로 묶여 그려지므로 아이템 수가 늘지 않는다.
+
     def _burst_confetti(self, n: int = 28, duration: int = 800) -> None:  # 컨페티 연출 함수
         """New 도넛 캔버스 위에서만 0.8초간 컨페티를 떨어뜨려(오버레이 없이) 시각적 보상을 제공."""  # 목적/범위 설명
         c = self.cnv_ring  # 투명 오버레이를 쓰지 않기 위해 대상 캔버스(도넛)에 직접 그림
-        import random as _r, time as _t  # 지역 임포트(전역 네임스페이스 오염 방지)
+        import random as _r  # 지역 임포트(전역 네임스페이스 오염 방지)
         W = c.winfo_width() or 160  # 캔버스 폭(초기값 보정)
-        parts = []  # 파편 객체 ID 보관 리스트
+        tag = f"confetti{id(object())}"  # 이번 연출의 파편 묶음 태그(겹쳐 터져도 서로 독립)
         pal = ["#43a047", "#1e88e5", "#fdd835", "#e53935", "#8e24aa"]  # 팔레트(초록/파랑/노랑/빨강/보라)
         # 파편 생성(작은 원)
         for _ in range(n):  # n개 생성
@@ -843,30 +1582,49 @@ class TodoApp(tk.Tk):  # Tk 루트 윈도우 상속
             y = -_r.randint(0, 40)  # 시작 Y(상단 바깥에서 진입)
             s = _r.randint(4, 8)  # 지름(4~8)
             col = _r.choice(pal)  # 색상 랜덤 선택
-            parts.append(c.create_oval(x, y, x + s, y + s, fill=col, width=0))  # 원 파편 생성
-        t0 = _t.monotonic()  # 시작 시각(모노토닉)
-        # 간단한 낙하 애니메이션(수직 이동)
-        def tick():  # 프레임 함수
-            dt = (_t.monotonic() - t0) * 1000.0  # 경과(ms)
-            for p in parts:  # 모든 파편 이동
-                c.move(p, 0, 6)  # 아래로 고정 속도 낙하
-            if dt < duration:  # 아직 지속 시간 내
-                c.after(16, tick)  # 약 60fps로 다음 프레임 예약
-            else:  # 시간 만료
-                for p in parts:  # 모든 파편
-                    c.delete(p)  # 삭제해 잔상/리소스 누수 방지
-        tick()  # 첫 프레임 호출
+            c.create_oval(x, y, x + s, y + s, fill=col, width=0, tags=(tag,))  # 원 파편 생성
+        fall = CONFETTI_PX_PER_S * duration / 1000  # 전체 낙하 거리(px)
+        moved = [0.0]  # 지금까지 이동한 거리
+        # 간단한 낙하 애니메이션(수직 이동, 경과 시간 기준)
+        def frame(p: float) -> None:  # 프레임 함수
+            if p >= 1.0:  # 시간 만료
+                c.delete(tag)  # 삭제해 잔상/리소스 누수 방지
+                return  # 종료
+            dy = fall * p - moved[0]  # 이번 프레임 이동량(프레임이 밀리면 그만큼 더 이동)
+            c.move(tag, 0, dy)  # 태그 한 번으로 모든 파편 이동
+            moved[0] += dy  # 누적
+        self.frames.start(tag, frame, duration / 1000)  # 공용 프레임 틱에 등록
         # New Tk는 캔버스 bg의 '완전 투명'을 지원하지 않아 빈 문자열/투명 컬러 지정 시 오류가 나므로,
         # New 별도 오버레이 캔버스 없이 도넛 캔버스에 직접 그려 안정적으로 연출한다.
 
     # ─────────────────────────────────────────────────────────
     # 종료 처리(안전 정리)                                      # 종료 시퀀스
     # ─────────────────────────────────────────────────────────
+    def toggle_perf_overlay(self) -> None:  # 계측 오버레이 토글
+        """계측 오버레이를 열거나 닫는다(계측이 꺼져 있으면 아무것도 안 함)."""  # 동작 설명
+        if self.perf is None:  # 계측 꺼짐
+            return  # 무시
+        if self._perf_overlay is not None and self._perf_overlay.winfo_exists():  # 열려 있으면
+            self._perf_overlay.close()  # 닫기
+            self._perf_overlay = None  # 상태 클리어
+        else:  # 닫혀 있으면
+            self._perf_overlay = PerfOverlay(self, self.perf)  # 열기
+
     def _on_close(self) -> None:  # 닫기 핸들러
-        """예약된 after 루프(타이머/깜박/리포트)를 모두 취소하고 창을 닫는다."""  # 안전 종료 설명
+        """예약된 after 루프(타이머/깜박/리포트)를 모두 취소하고 DB를 커밋/닫은 뒤 창을 닫는다."""  # 안전 종료 설명
+        if self._perf_overlay is not None and self._perf_overlay.winfo_exists():  # 오버레이 열려 있으면
+            self._perf_overlay.close()  # 갱신 루프 정지
         self._stop_tick_loop()  # 타이머 루프 정지
         self._stop_blink()  # 깜박임 루프 정지
         self._stop_report_loop()  # 리포트 루프 정지
+        self.frames.close()  # 도넛/컨페티 애니메이션 정지
+        self._flush_timers(resync=False)  # 타이머 세션/이력 마지막 저장(워커 종료 전에 큐에 넣음)
+        if self._pump_after_id is not None:  # 완료 큐 폴링 중이면
+            self.after_cancel(self._pump_after_id)  # 폴링 취소(남은 콜백은 버림)
+            self._pump_after_id = None  # 상태 클리어
+        self.worker.close()  # 대기 중인 쓰기를 모두 실행·커밋한 뒤 워커 종료
+        if self.perf is not None:  # 계측 중이면
+            self.perf.dump()  # TODO_PROFILE_DUMP 경로에 cProfile + trace 저장(경로 없으면 무시)
         self.destroy()  # 창 파괴(프로세스 종료)
         # New after 콜백이 남아있는 상태로 종료하면 예외가 날 수 있으므로 반드시 선 정리
 
@@ -874,5 +1632,9 @@ class TodoApp(tk.Tk):  # Tk 루트 윈도우 상속
 # 실행 엔트리포인트                                           # main guard
 # ─────────────────────────────────────────────────────────
 if __name__ == "__main__":  # 이 파일을 직접 실행할 때만 아래 코드 실행
+    import sys  # 명령줄 인자 확인
+    if len(sys.argv) > 1:  # New `python app.py list ...`처럼 서브커맨드가 오면 CLI로 위임
+        from todo_cli import main  # CLI 엔트리포인트
+        sys.exit(main(sys.argv[1:]))  # 종료 코드 전달
     app = TodoApp()   # 최상위 앱 인스턴스 생성
     app.mainloop()    # Tk 이벤트 루프 시작(사용자 인터랙션 처리)
@@ -0,0 +1,219 @@
+# ─────────────────────────────────────────────────────────
+# 갓생살기 벤치마크: 쓰기/로드/리포트/표시/리스트 갱신 핫패스   # 회귀 추적용 측정 도구
+# ─────────────────────────────────────────────────────────
+# 고정 시드로 합성 데이터셋(1k/10k/100k/1M)을 만들고 핫패스별 소요 시간(로드는 메모리도)을 JSON으로 출력한다.  # New 상위 요약
+# 예) python bench.py --out before.json  →  (변경 후) python bench.py --baseline before.json  # New 사용 예
+
+import argparse  # 옵션 파싱
+import gc  # 메모리 측정 전 정리
+import json  # 결과 출력
+import os  # 임시 파일 정리
+import platform  # 실행 환경 메타데이터
+import random  # 합성 데이터(고정 시드)
+import sqlite3 as sql  # SQLite 버전 기록
+import statistics  # 중앙값
+import sys  # 종료 코드/stderr
+import tempfile  # 벤치 전용 DB 파일
+import time  # perf_counter
+import tracemalloc  # 파이썬 할당량 측정
+from datetime import date, timedelta  # 날짜 분포 생성
+from todo_core import (  # GUI 비의존 코어
+    DBWorker, Database, Todo, TodoStore, ReportStats, load_all, insert_many, insert_one, update_one,
+    update_status_many, sql_report_stats,
+)
+
+# ─────────────────────────────────────────────────────────
+# 상수/합성 데이터                                            # 재현 가능한 데이터셋
+# ─────────────────────────────────────────────────────────
+SIZES = (1_000, 10_000, 100_000, 1_000_000)  # 기본 데이터셋 크기
+SEED = 20250901  # 고정 시드(같은 버전이면 같은 데이터)
+TODAY = date(2025, 9, 1)  # 기준일 고정(D-DAY 분포/리포트 값이 실행 날짜에 따라 달라지지 않게)
+TITLES = ("과제", "발표 준비", "보고서", "운동", "독서", "회의", "시험 공부", "프로젝트", "장보기", "정리")  # 반복 제목
+
+def make_todos(n: int, seed: int = SEED) -> list[Todo]:  # 합성 데이터 생성
+    """기준일 ±180일에 퍼진 시작일, 대부분 짧고 가끔 긴 기간, 완료 쪽으로 기운 상태 분포의 할 일 n건."""  # 분포 설명
+    rnd = random.Random(seed)  # 독립 난수원
+    out = []  # 결과
+    for i in range(n):  # 항목별
+        start = TODAY + timedelta(days=rnd.randint(-180, 180))  # 시작일: 반년 전 ~ 반년 후
+        end = start + timedelta(days=min(int(rnd.expovariate(1 / 7)), 120))  # 기간: 평균 1주, 최대 4개월
+        status = rnd.choices((0, 1, 2), weights=(3, 2, 5))[0]  # 미완/진행/완료 비율
+        title = f"{rnd.choice(TITLES)} {i % 500}"  # 제목 종류를 제한(실사용처럼 반복)
+        desc = "" if rnd.random() < 0.7 else "메모 " * rnd.randint(1, 8)  # 30%만 설명 보유
+        out.append(Todo(title, start.isoformat(), end.isoformat(), desc, status))  # 생성
+    return out  # 데이터셋
+
+def make_db(path: str, n: int) -> None:  # 벤치 DB 생성
+    """합성 데이터 n건이 들어 있는 DB 파일을 만든다(스키마/인덱스는 앱과 동일)."""  # 용도 설명
+    db = Database(path)  # 스키마 + 마이그레이션
+    db.run(insert_many, make_todos(n))  # 한 트랜잭션
+    db.close()  # 커밋 후 닫기
+
+# ─────────────────────────────────────────────────────────
+# 측정 유틸                                                   # 반복/요약
+# ─────────────────────────────────────────────────────────
+def measure(fn, repeat: int) -> dict:  # 반복 측정
+    """fn()을 repeat번 재고 최소/중앙값(초)을 반환."""  # 요약 규칙
+    runs = []  # 회차별 시간
+    for _ in range(repeat):  # 반복
+        t0 = time.perf_counter()  # 시작
+        fn()  # 대상 실행
+        runs.append(time.perf_counter() - t0)  # 기록
+    return {"min": min(runs), "median": statistics.median(runs), "runs": runs}  # 최소값이 잡음에 가장 덜 민감
+
+def measure_memory(fn, rows: int) -> dict:  # 메모리 측정
+    """fn() 1회 동안의 최대 할당량(peak)과 결과를 붙잡은 채 남은 양(retained, 바이트)을 tracemalloc으로 잰다."""  # 측정 규칙
+    gc.collect()  # 이전 측정의 쓰레기 제외
+    tracemalloc.start()  # 추적 시작(이후 할당만 셈)
+    try:
+        kept = fn()  # 결과를 살려 둬야 로드 후 상주량이 잡힘
+        retained, peak = tracemalloc.get_traced_memory()  # (현재, 최대)
+    finally:
+        tracemalloc.stop()  # 추적 해제(다른 측정 시간에 영향 없게)
+    del kept  # 해제
+    return {"peak": peak, "retained": retained, "per_row": round(retained / max(rows, 1), 1)}  # 행당 상주 바이트
+
+def bench_size(n: int, repeat: int, gui: bool) -> dict:  # 크기별 벤치
+    """n건 데이터셋에 대해 각 핫패스를 측정."""  # 측정 목록
+    path = os.path.join(tempfile.mkdtemp(prefix="todo-bench-"), "bench.db")  # 전용 DB 파일
+    make_db(path, n)  # 데이터 준비
+    db = Database(path)  # 측정용 연결
+    items = load_all(db.con)  # 이후 측정의 입력
+    res = {"rows": n}  # 결과
+
+    res["load_all"] = measure(lambda: load_all(db.con), repeat)  # SELECT + 행→모델 변환
+    res["load_all_mem"] = measure_memory(lambda: load_all(db.con), n)  # 같은 경로의 메모리(슬롯/문자열 공유 효과)
+    res["report_rebuild"] = measure(lambda: ReportStats(TODAY).reset(items), repeat)  # 증분 집계 전체 재구축
+    stats = ReportStats(TODAY)  # 증분 집계기
+    stats.reset(items)  # 한 번 구축
+    first = items[0]  # 토글 대상
+    probe = Todo(first.title, first.start, first.end, first.desc, first.status)  # 사본(items는 뒤 측정의 입력이라 그대로 둠)
+    def report_after_toggle():  # 항목 1건 토글 후 스냅샷(앱의 calc_report_stats 경로)
+        stats.remove(probe)  # 빼고(집계는 값 기준이라 사본으로도 같은 항목이 빠짐)
+        probe.cycle()  # 상태 순환
+        stats.add(probe)  # 더하고
+        stats.snapshot(TODAY)  # 새 스냅샷
+    res["calc_report_stats"] = measure(report_after_toggle, repeat)  # 증분 경로
+    res["sql_report_stats"] = measure(lambda: sql_report_stats(db.con, TODAY), repeat)  # 로딩 중 경로(인덱스 질의)
+    days = iter(range(1, repeat + 1))  # 회차마다 다른 기준일 → 표시 캐시가 매번 빗나감
+    def display_cold():  # 날짜가 바뀐 직후(자정 이후 첫 갱신)의 전 행 재포맷
+        day = TODAY + timedelta(days=next(days))  # 새 기준일
+        [t.display(day) for t in items]  # 전 행 생성
+    res["display_cold"] = measure(display_cold, repeat)  # 캐시 미스 경로
+    res["display_all"] = measure(lambda: [t.display(TODAY) for t in items], repeat)  # 전 행 표시 문자열(같은 날 → 캐시 적중)
+    res["store_open"] = measure(lambda: TodoStore.open(path).close(), repeat)  # 로드 + 집계 + 색인(헤드리스 시작 비용)
+    res.update(bench_writes(path, items, repeat))  # 행 단위 쓰기(DB 내용이 바뀌므로 마지막에)
+    db.close()  # 연결 종료
+    if gui:  # 화면 계층
+        res["refresh_list"] = bench_refresh_list(path, repeat)  # Tk 측정(디스플레이 없으면 skipped)
+    for f in os.listdir(os.path.dirname(path)):  # 임시 파일(WAL/SHM 포함) 정리
+        os.remove(os.path.join(os.path.dirname(path), f))  # 삭제
+    os.rmdir(os.path.dirname(path))  # 폴더 삭제
+    return res  # 크기별 결과
+
+def bench_writes(path: str, items: list[Todo], repeat: int) -> dict:  # 쓰기 경로 벤치
+    """앱과 같은 DBWorker 경로로 단건 추가/단건 수정/선택 100건 상태 전환을 제출하고 완료까지의 시간을 잰다.
+
+    커밋은 워커가 디바운스해 묶으므로 측정에 들어가지 않는다(편집 1건이 화면에 반영되기까지의 비용).
+    """  # 측정 범위
+    worker = DBWorker(path)  # 앱과 같은 단일 작성자 스레드
+    def settle():  # 제출한 작업이 모두 끝날 때까지
+        while worker.drain():  # Tk after 폴링 대신
+            time.sleep(0.0001)  # 워커 스레드에 GIL 양보
+    worker.submit(lambda con: None, write=False)  # 연결 열기/마이그레이션은 측정에서 제외
+    settle()  # 준비 완료
+    edited = [Todo(t.title + " 수정", t.start, t.end, t.desc, t.status, t.id) for t in items[:100]]  # 사본(items는 그대로)
+    day = TODAY.isoformat()  # 새 항목 날짜
+    def add():  # 단건 추가(id는 DB가 발급)
+        worker.submit(insert_one, Todo("벤치 추가", day, day))  # INSERT
+        settle()  # 완료 대기
+    def edit():  # 단건 수정
+        worker.submit(update_one, edited[0])  # UPDATE 1행
+        settle()  # 완료 대기
+    def toggle():  # 선택 항목 상태 전환(스페이스 키)
+        for t in edited:  # 모델 갱신
+            t.cycle()  # 상태 순환
+        worker.submit(update_status_many, edited)  # status 컬럼만 executemany
+        settle()  # 완료 대기
+    res = {"insert_one": measure(add, repeat), "update_one": measure(edit, repeat),
+           "update_status_many": measure(toggle, repeat)}  # 쓰기 경로별
+    worker.close()  # 남은 쓰기 커밋 후 종료
+    return res  # 측정 결과
+
+def bench_refresh_list(path: str, repeat: int) -> dict:  # 리스트 갱신 벤치
+    """창을 숨긴(withdraw) TodoApp으로 전체 로드 후 refresh_list() + 유휴 작업 처리 시간을 잰다."""  # 측정 방법
+    try:
+        from app import TodoApp  # New tkinter는 GUI 측정 때만 import
+        app = TodoApp(db_path=path)  # 벤치 DB로 앱 생성
+    except Exception as exc:  # 디스플레이 없음(TclError) 등 → xvfb-run으로 실행하면 측정됨
+        return {"skipped": f"{type(exc).__name__}: {exc}".strip()}  # 건너뜀 사유 기록
+    try:
+        app.withdraw()  # 창은 띄우지 않음
+        while app._loader is None or not app._loader.done:  # 스트리밍 로딩 완료까지
+            app.update()  # 워커 완료 콜백 처리
+            time.sleep(0.001)  # 바쁜 대기 완화
+        def refresh():  # 전체 재적재 + 그리기
+            app.refresh_list()  # 리스트 + 리포트 갱신
+            app.update_idletasks()  # 실제 위젯 갱신까지 포함
+        return measure(refresh, repeat)  # 측정
+    finally:
+        app._on_close()  # 루프 정리 + 워커 종료 + 창 파괴
+
+# ─────────────────────────────────────────────────────────
+# 비교/엔트리포인트                                           # 회귀 검출
+# ─────────────────────────────────────────────────────────
+def compare(cur: dict, base: dict, tolerance: float) -> list[str]:  # 기준 결과와 비교
+    """같은 크기·항목의 min 시간(메모리 항목은 peak)이 기준 대비 (1 + tolerance)배를 넘으면 회귀로 보고."""  # 판정 규칙
+    bad = []  # 회귀 목록
+    for size, row in cur["results"].items():  # 크기별
+        for name, m in row.items():  # 항목별
+            old = base.get("results", {}).get(size, {}).get(name)  # 기준 값
+            if not isinstance(m, dict) or not isinstance(old, dict):  # 비교 불가(행 수 등)
+                continue  # 건너뜀
+            for key, unit, scale in (("min", "ms", 1000), ("peak", "MB", 1 / 2**20)):  # 시간/메모리 지표
+                if key not in m or key not in old:  # 이 항목의 지표가 아님(건너뛴 측정 포함)
+                    continue  # 건너뜀
+                ratio = m[key] / old[key] if old[key] else 1.0  # 배율
+                line = f"{size:>8} {name:<18} {old[key] * scale:10.2f}{unit} → {m[key] * scale:10.2f}{unit}  x{ratio:.2f}"  # 표시
+                print(line, file=sys.stderr)  # 표는 stderr(JSON은 stdout)
+                if ratio > 1 + tolerance:  # 회귀
+                    bad.append(line)  # 기록
+    return bad  # 회귀 목록
+
+def main(argv: list[str] | None = None) -> int:  # 엔트리포인트
+    """측정 → JSON 출력 → (선택) 기준 결과와 비교. 회귀가 있으면 종료 코드 1."""  # 반환 규칙
+    p = argparse.ArgumentParser(description="갓생살기 핫패스 벤치마크(JSON 출력)")  # 파서
+    p.add_argument("--sizes", default=",".join(map(str, SIZES)), help="데이터셋 크기(쉼표 구분)")  # 크기
+    p.add_argument("--repeat", type=int, default=3, help="항목별 반복 횟수(최소/중앙값 보고)")  # 반복
+    p.add_argument("--no-gui", action="store_true", help="refresh_list(Tk) 측정 생략")  # GUI 생략
+    p.add_argument("--out", help="결과 JSON 파일(생략 시 stdout)")  # 출력
+    p.add_argument("--baseline", help="비교할 이전 결과 JSON")  # 기준
+    p.add_argument("--tolerance", type=float, default=0.2, help="회귀 판정 허용 비율(기본 0.2 = 20%%)")  # 허용치
+    args = p.parse_args(argv)  # 파싱
+    result = {
+        "meta": {
+            "python": platform.python_version(), "sqlite": sql.sqlite_version, "platform": platform.platform(),
+            "seed": SEED, "today": TODAY.isoformat(), "repeat": args.repeat,
+            "started": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        },  # 실행 환경(버전 간 비교 시 같은 환경인지 확인용)
+        "results": {},  # 크기별 결과
+    }
+    for n in (int(s) for s in args.sizes.split(",") if s.strip()):  # 크기별
+        print(f"bench {n:,} rows…", file=sys.stderr)  # 진행 표시
+        result["results"][str(n)] = bench_size(n, args.repeat, not args.no_gui)  # 측정
+    text = json.dumps(result, ensure_ascii=False, indent=2)  # 직렬화
+    if args.out:  # 파일 출력
+        with open(args.out, "w", encoding="utf-8") as fp:  # 저장
+            fp.write(text + "\n")  # 기록
+    else:  # 표준 출력
+        print(text)  # 출력
+    if args.baseline:  # 비교 모드
+        with open(args.baseline, encoding="utf-8") as fp:  # 기준 읽기
+            bad = compare(result, json.load(fp), args.tolerance)  # 비교
+        if bad:  # 회귀 있음
+            print(f"회귀 {len(bad)}건", file=sys.stderr)  # 요약
+            return 1  # 실패
+    return 0  # 성공
+
+if __name__ == "__main__":  # 직접 실행 시
+    sys.exit(main())  # 종료 코드 전달
@@ -0,0 +1,83 @@
+# ─────────────────────────────────────────────────────────
+# 갓생살기 CLI 테스트: 서브커맨드/종료 코드/출력 형식          # pytest
+# ─────────────────────────────────────────────────────────
+
+import io  # stdin 흉내
+import json  # JSON 출력 검사
+import pytest  # 픽스처
+from todo_cli import main  # 대상
+
+@pytest.fixture
+def db(tmp_path):  # 임시 DB 경로
+    return str(tmp_path / "todo.db")  # 테스트마다 새 파일
+
+def _run(db: str, *argv: str) -> int:  # 명령 실행
+    return main(["--db", db, *argv])  # 항상 임시 DB
+
+def test_add_prints_id_and_list_streams_rows(db, capsys):  # add → list
+    assert _run(db, "add", "보고서", "--start", "2026-01-02", "--end", "2026-01-05", "--status", "doing") == 0  # 단건
+    assert capsys.readouterr().out == "1\n"  # 발급 id만 stdout
+    assert _run(db, "list", "--json") == 0  # JSON Lines
+    rows = [json.loads(line) for line in capsys.readouterr().out.splitlines()]  # 파싱
+    assert rows == [{"id": 1, "title": "보고서", "start": "2026-01-02", "end": "2026-01-05", "desc": "", "status": 1}]  # 그대로
+
+def test_add_rejects_reversed_period(db, capsys):  # 기간 역전
+    assert _run(db, "add", "x", "--start", "2026-01-05", "--end", "2026-01-02") == 1  # 실패
+    assert "종료일이 시작일보다 빠릅니다" in capsys.readouterr().err  # 안내
+    assert _run(db, "list") == 0  # 조회
+    assert capsys.readouterr().out == ""  # 아무것도 추가되지 않음
+
+def test_batch_add_is_all_or_nothing(db, capsys, monkeypatch):  # stdin 일괄 입력
+    monkeypatch.setattr("sys.stdin", io.StringIO("a\t2026-01-01\nb\t2026-02-30\n"))  # 2행 오류
+    assert _run(db, "add") == 1  # 실패
+    assert "2행" in capsys.readouterr().err  # 줄 번호 안내
+    monkeypatch.setattr("sys.stdin", io.StringIO("a\t2026-01-01\nb\t2026-01-02\t2026-01-03\n"))  # 정상 2행
+    assert _run(db, "add", "-") == 0  # 성공
+    assert capsys.readouterr().err == "2건 추가\n"  # 요약은 stderr
+    _run(db, "list", "--json")  # 조회
+    assert [json.loads(line)["title"] for line in capsys.readouterr().out.splitlines()] == ["a", "b"]  # 앞 실패분은 없음
+
+def test_toggle_and_rm_report_missing_ids_with_exit_code(db, capsys):  # id 기반 명령
+    _run(db, "add", "a", "--start", "2026-01-01")  # id 1
+    _run(db, "add", "b", "--start", "2026-01-01")  # id 2
+    capsys.readouterr()  # 출력 비움
+    assert _run(db, "toggle", "1", "1") == 0  # 두 번 순환
+    assert _run(db, "toggle", "2", "9") == 1  # 9는 없음
+    assert _run(db, "rm", "2") == 0  # 삭제
+    err = capsys.readouterr().err  # 요약
+    assert "1건 상태 전환" in err and "1건 삭제" in err  # 실제 처리 수
+    _run(db, "list", "--status", "done", "--json")  # 완료만
+    assert [json.loads(line)["id"] for line in capsys.readouterr().out.splitlines()] == [1]  # 0→1→2
+
+def test_repeated_ids_succeed_and_missing_ids_are_listed(db, capsys):  # 없는 id 안내
+    _run(db, "add", "a", "--start", "2026-01-01")  # id 1
+    capsys.readouterr()  # 출력 비움
+    assert _run(db, "toggle", "1", "9", "9", "7") == 1  # 일부 없음
+    assert "없는 id: 9, 7" in capsys.readouterr().err  # 입력 순서, 중복 없이
+    assert _run(db, "rm", "1", "1") == 0  # 같은 id 반복은 실패가 아님
+    assert "없는 id" not in capsys.readouterr().err  # 안내 없음
+
+def test_report_json_counts_statuses(db, capsys):  # report
+    for title, status in (("a", "todo"), ("b", "done"), ("c", "2")):  # 3건
+        _run(db, "add", title, "--start", "2026-01-01", "--status", status)  # 추가
+    capsys.readouterr()  # 출력 비움
+    assert _run(db, "report", "--json") == 0  # 기계용 출력
+    s = json.loads(capsys.readouterr().out)  # 파싱
+    assert s["counts"] == [1, 0, 2]  # 상태별 개수
+    assert round(s["rate"], 1) == 66.7  # 완료율
+
+def test_bad_id_is_reported_not_raised(db, capsys):  # 형식 오류
+    assert _run(db, "rm", "x") == 1  # 예외 대신 종료 코드
+    assert capsys.readouterr().err.startswith("오류:")  # 안내
+
+def test_gui_mode_opens_the_db_given_with_db(db, monkeypatch):  # 인자 없는 실행
+    import app  # TodoApp 교체 대상(지연 import되는 모듈)
+    opened = []  # 생성자에 넘어온 경로
+    class FakeApp:  # 창을 띄우지 않는 대역
+        def __init__(self, db_path=None) -> None:  # TodoApp과 같은 시그니처
+            opened.append(db_path)  # 기록
+        def mainloop(self) -> None:  # 이벤트 루프 대신
+            pass  # 바로 반환
+    monkeypatch.setattr(app, "TodoApp", FakeApp)  # GUI 대체
+    assert main(["--db", db]) == 0  # 서브커맨드 없음 = GUI 모드
+    assert opened == [db]  # 기본 DB가 아니라 지정한 파일
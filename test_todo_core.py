@@ -0,0 +1,365 @@
+# ─────────────────────────────────────────────────────────
+# 갓생살기 코어 테스트: 영속화/집계/검색/워커/TodoStore/이력     # pytest
+# ─────────────────────────────────────────────────────────
+
+import sqlite3 as sql  # 다른 연결에서 DB 내용 확인
+import threading  # 워커 멈춰 두기
+import time  # 완료 대기
+from datetime import date, datetime, timedelta  # 집계 기준일/이벤트 시각
+import pytest  # 픽스처
+import todo_core  # 커밋 디바운스 상수 조정
+from todo_core import (DBWorker, Database, MIGRATIONS, PagedLoader, ReportStats, SearchIndex, TEMP_ID_BASE, Todo,
+                       TodoStore, cycle_status_ids, insert_one, load_all, log_status_events, missing_ids, rollup_trend,
+                       sql_report_stats, update_one, delete_many, update_status_many)  # 대상
+
+TODAY = date(2026, 1, 14)  # 집계 기준일(수요일)
+
+def _todo(title: str, status: int = 0, start: str = "2026-01-01", end: str = "2026-01-20") -> Todo:  # 테스트 항목
+    """기간이 정상인 항목 1개(날짜는 필요할 때만 지정)."""  # 생성 규칙
+    return Todo(title, start, end, status=status)  # 고정 기간
+
+def _mixed() -> list[Todo]:  # 집계용 데이터
+    """지남/임박/이번 주/완료/날짜 오류가 섞인 목록."""  # 구성
+    return [
+        _todo("지남", 0, "2026-01-01", "2026-01-10"),  # 미완료 + 지난 마감
+        _todo("임박", 1, "2026-01-12", "2026-01-16"),  # D-2
+        _todo("오늘", 0, "2026-01-14", "2026-01-14"),  # D-DAY
+        _todo("완료", 2, "2026-01-05", "2026-01-13"),  # 완료는 지남/임박에서 제외
+        _todo("나중", 0, "2026-01-20", "2026-02-28"),  # 먼 마감
+        _todo("오류", 0, "2026-1-x", "2026-01-15"),    # 날짜 오류(상태 수만 반영)
+    ]  # 6건
+
+@pytest.fixture
+def db_path(tmp_path):  # 임시 DB 경로
+    return str(tmp_path / "todo.db")  # 테스트마다 새 파일
+
+@pytest.fixture
+def db(db_path):  # 장수명 연결
+    d = Database(db_path)  # 스키마 포함
+    yield d  # 테스트
+    d.close()  # 정리
+
+def _rows(path: str) -> list[tuple]:  # 커밋된 DB 내용
+    """별도 연결로 읽은 (id, title, status) 행 목록."""  # 반환 형식
+    con = sql.connect(path)  # 별도 연결
+    try:
+        return con.execute("SELECT id, title, status FROM todos ORDER BY id").fetchall()  # 전체
+    finally:
+        con.close()  # 정리
+
+def test_row_writes_touch_only_changed_rows(db, db_path):  # 행 단위 저장
+    a, b, c = _todo("a"), _todo("b"), _todo("c")  # 3건
+    for t in (a, b, c):  # 단건 INSERT
+        t.id = db.run(insert_one, t)  # DB가 발급한 id를 모델에 반영
+    assert [a.id, b.id, c.id] == [1, 2, 3]  # 모델에 PK 반영
+    b.title = "b2"  # 편집
+    db.run(update_one, b)  # 해당 행만
+    a.cycle()  # 상태 전환
+    c.cycle()  # 〃
+    db.run(update_status_many, [a, c])  # 상태 컬럼만
+    db.run(delete_many, [c.id])  # 선택 삭제
+    db.commit()  # 확정
+    assert _rows(db_path) == [(1, "a", 1), (2, "b2", 0)]  # 결과
+
+def test_writes_are_batched_until_commit(db, db_path):  # 배치 커밋
+    db.run(insert_one, _todo("a"))  # 첫 쓰기
+    db.run(insert_one, _todo("b"))  # 같은 트랜잭션
+    assert _rows(db_path) == []  # 커밋 전에는 다른 연결에 보이지 않음
+    db.commit()  # fsync 1회
+    assert [r[1] for r in _rows(db_path)] == ["a", "b"]  # 한 번에 확정
+    assert db.con.execute("PRAGMA journal_mode").fetchone()[0] == "wal"  # WAL 모드
+
+def test_incremental_stats_match_rebuild_after_changes():  # 증분 = 재구축
+    items = _mixed()  # 시작 목록
+    stats = ReportStats(TODAY)  # 증분 집계
+    for t in items:  # 하나씩 추가
+        stats.add(t)  # 반영
+    stats.remove(items[1])  # 편집: 이전 값을 빼고
+    items[1] = _todo("임박", 2, "2026-01-12", "2026-01-16")  # 완료로 교체
+    stats.add(items[1])  # 새 값을 더함
+    stats.remove(items.pop(0))  # 삭제
+    fresh = ReportStats(TODAY)  # 비교 대상
+    fresh.reset(items)  # 전체 순회로 재구축
+    assert stats.snapshot(TODAY) == fresh.snapshot(TODAY)  # 같은 요약
+
+def test_snapshot_values_and_cache():  # 지표 값/캐시
+    stats = ReportStats(TODAY)  # 집계
+    stats.reset(_mixed())  # 6건
+    snap = stats.snapshot(TODAY)  # 요약
+    assert snap["counts"] == (4, 1, 1)  # 상태 구성
+    assert (snap["overdue"], snap["soon"]) == (1, 2)  # 지남 1, D-0~D-3 미완료 2
+    assert snap["week_bins"] == [0, 1, 1, 0, 1, 0, 0]  # 월~일(1/12~1/18) 마감 분포(완료 포함, 날짜 오류 제외)
+    assert stats.snapshot(TODAY) is snap  # 변경이 없으면 같은 객체
+
+def test_day_rollover_matches_rebuild_on_new_day():  # 자정 경계
+    items = _mixed()  # 목록
+    stats = ReportStats(TODAY)  # 어제 기준 집계
+    stats.reset(items)  # 적재
+    later = TODAY + timedelta(days=3)  # 며칠 뒤에 깨어남
+    fresh = ReportStats(later)  # 새 기준일
+    fresh.reset(items)  # 재구축
+    assert stats.snapshot(later) == fresh.snapshot(later)  # 경계 버킷만 옮겨도 같음
+
+def test_report_stats_reset_rebuilds_and_invalidates_snapshot():  # 집계 초기화
+    stats = ReportStats(TODAY)  # 기준일 고정
+    stats.add(_todo("a", status=2))  # 완료 1건
+    before = stats.snapshot(TODAY)  # 캐시 생성
+    stats.reset([_todo("b"), _todo("c")])  # 미완 2건으로 재구축
+    after = stats.snapshot(TODAY)  # 새 스냅샷
+    assert stats.counts == [2, 0, 0]  # 이전 값이 남지 않음
+    assert after is not before  # 캐시 무효화
+    assert stats._today == TODAY  # 기준일 유지
+
+def test_date_cache_follows_start_end_assignment():  # 날짜 캐시
+    t = _todo("a")  # 생성 시 파싱
+    assert (t.start_d, t.end_d, t.dates_ok) == (date(2026, 1, 1), date(2026, 1, 20), True)  # 캐시
+    t.end = "2026-02-03"  # 편집
+    assert t.end_d == date(2026, 2, 3)  # 대입과 함께 갱신
+    t.start = "언젠가"  # 잘못된 값
+    assert t.start_d is None and not t.dates_ok  # 오류는 None으로 표시(예외 없음)
+    t.end = "2026-13-01"  # 없는 달
+    assert t.end_d is None  # 〃
+    assert t.display(TODAY) == "☐ 언젠가 ~ 2026-13-01 | a"  # D-DAY 태그 없이 폴백 표시
+
+def test_bulk_load_builds_slotted_todos_equal_to_constructed(db):  # 대량 로드 모델
+    for title in ("같은 제목", "같은 제목"):  # 반복 문자열
+        db.run(insert_one, _todo(title))  # 저장
+    a, b = load_all(db.con)  # 생성자를 거치지 않는 경로
+    assert not hasattr(a, "__dict__")  # 슬롯 모델(인스턴스 사전 없음)
+    assert a == Todo("같은 제목", "2026-01-01", "2026-01-20", id=1)  # 생성자와 같은 상태
+    assert a.end_d == date(2026, 1, 20)  # 날짜 캐시도 채워짐
+    assert a.title is b.title and a.start is b.start  # 반복 문자열은 객체 1개 공유
+
+def test_paged_loader_reads_each_row_once_up_to_start_max(db):  # 키셋 페이지 로딩
+    for k in range(7):  # 7건
+        db.run(insert_one, _todo(f"t{k}"))  # 저장
+    db.run(delete_many, [3])  # 중간에 빈 id
+    loader = PagedLoader(db.con)  # MAX(id)=7 고정
+    db.run(insert_one, _todo("late"))  # 로딩 시작 뒤 추가(id 8) → 앱이 이미 메모리에 가진 항목
+    pages = []  # 페이지별 id
+    while not loader.done:  # 끝까지
+        pages.append([t.id for t in loader.next_page(db.con, 3)])  # 3행씩(연결은 워커가 넘김)
+    assert pages == [[1, 2, 4], [5, 6, 7]]  # 빠짐/중복 없이 id 순, 새 행은 제외
+    assert loader.loaded == 6  # 누적 행 수
+    assert loader.next_page(db.con, 3) == []  # 끝난 뒤에는 빈 페이지
+
+def test_migrations_normalize_dates_and_record_version(db_path):  # 스키마 마이그레이션
+    con = sql.connect(db_path)  # 마이그레이션 이전 형식의 DB
+    con.execute("CREATE TABLE todos(id INTEGER PRIMARY KEY AUTOINCREMENT, title TEXT NOT NULL, start TEXT NOT NULL, "
+                "end TEXT NOT NULL, memo TEXT DEFAULT '', status INTEGER NOT NULL CHECK(status IN (0,1,2)))")  # 원래 스키마
+    con.execute("INSERT INTO todos(title, start, end, status) VALUES('a', '2026-1-5', '2026-01-9', 0), ('b', '???', '2026-02-01', 0)")  # 0 패딩 없음/오류
+    con.commit()  # 확정
+    con.close()  # 정리
+    db = Database(db_path)  # 열면서 마이그레이션
+    rows = db.con.execute("SELECT start, end FROM todos ORDER BY id").fetchall()  # 결과
+    assert rows == [("2026-01-05", "2026-01-09"), ("???", "2026-02-01")]  # ISO로 정규화(오류 값은 그대로)
+    assert db.con.execute("PRAGMA user_version").fetchone()[0] == len(MIGRATIONS)  # 버전 기록
+    names = {r[0] for r in db.con.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}  # 인덱스
+    assert {"idx_todos_status_end", "idx_todos_end"} <= names  # 커버링 인덱스
+    db.close()  # 다시 열어도 재실행하지 않음
+    assert Database(db_path).con.execute("PRAGMA user_version").fetchone()[0] == len(MIGRATIONS)  # 그대로
+
+@pytest.mark.parametrize("today", [TODAY, TODAY + timedelta(days=5), date(2025, 12, 29)])  # 주/월 경계 포함
+def test_sql_report_stats_matches_incremental_stats(db, today):  # SQL 집계 = 증분 집계
+    items = _mixed() + [_todo("없는 날", 0, "2026-01-12", "2026-02-30")]  # 모양만 맞는 없는 날짜
+    for t in items:  # 저장
+        db.run(insert_one, t)  # 행 단위
+    stats = ReportStats(today)  # 메모리 집계
+    stats.reset(items)  # 같은 목록
+    assert sql_report_stats(db.con, today) == stats.snapshot(today)  # 로딩 중/후 리포트가 같은 값
+
+def test_sql_report_stats_on_empty_db(db):  # 빈 DB
+    assert sql_report_stats(db.con, TODAY) == ReportStats(TODAY).snapshot(TODAY)  # 기본 구조
+
+def _indexed(*specs: tuple[str, str]) -> SearchIndex:  # 검색 색인
+    """(제목, 설명) 목록에 1부터 id를 붙여 색인."""  # 생성 규칙
+    index = SearchIndex()  # 빈 색인
+    for i, (title, desc) in enumerate(specs, 1):  # 항목별
+        index.add(Todo(title, "2026-01-01", "2026-01-02", desc, id=i))  # 추가
+    return index  # 색인
+
+def test_search_matches_substrings_of_title_and_desc_with_and():  # 부분 문자열 + AND
+    index = _indexed(("발표 준비", "슬라이드 초안"), ("Report draft", ""), ("발표 리허설", "report 검토"))  # 3건
+    assert index.search("") is None  # 검색어 없음 = 필터 없음
+    assert index.search("발표") == {1, 3}  # 제목
+    assert index.search("슬라") == {1}  # 설명의 부분 문자열
+    assert index.search("REPORT") == {2, 3}  # 대소문자 무시
+    assert index.search("발표 rep") == {3}  # 단어 간 AND
+    assert index.search("없는말") == set()  # 결과 없음
+
+def test_search_follows_incremental_add_remove_and_narrowing():  # 증분 갱신/좁히기 캐시
+    index = _indexed(("장보기", ""), ("장학금 서류", ""))  # 2건
+    assert index.search("장") == {1, 2}  # 한 글자
+    assert index.search("장학") == {2}  # 이전 결과 안에서 좁힘
+    index.add(Todo("장학재단 면접", "2026-01-01", "2026-01-02", id=3))  # 새 토큰 → 캐시 무효화
+    assert index.search("장학") == {2, 3}  # 새 항목 반영
+    index.remove(Todo("장학금 서류", "2026-01-01", "2026-01-02", id=2))  # 삭제(같은 id)
+    assert index.search("장학") == {3}  # 제거 반영
+    assert index.search("서류") == set()  # 빈 posting은 어휘에서도 제거
+
+def _wait(worker: DBWorker) -> None:  # 완료 대기
+    """제출한 작업이 모두 끝나 콜백까지 불릴 때까지 drain()을 돌린다."""  # Tk 폴링 대신
+    deadline = time.monotonic() + 5  # 안전 상한
+    while worker.drain():  # 남은 작업
+        assert time.monotonic() < deadline  # 멈춤 방지
+        time.sleep(0.005)  # 폴링 간격
+
+def test_worker_merges_pending_jobs_with_the_same_key(db_path):  # 키 병합
+    worker = DBWorker(db_path)  # 워커
+    gate = threading.Event()  # 첫 작업을 붙잡아 둠
+    worker.submit(lambda con: gate.wait(5), write=False)  # 워커를 점유
+    calls, results = [], []  # 실행 기록
+    def job(con, n):  # 병합 대상
+        calls.append(n)  # 실제 실행된 인자
+        return n  # 결과
+    for n in range(5):  # 연타
+        worker.submit(job, n, key="k", callback=results.append)  # 같은 키
+    gate.set()  # 워커 재개
+    _wait(worker)  # 완료
+    assert calls == [4] and results == [4]  # 최신 인자로 한 번만 실행
+    worker.submit(job, 5, key="k", callback=results.append)  # 시작된 뒤의 같은 키는 새 작업
+    _wait(worker)  # 완료
+    assert calls == [4, 5]  # 다시 실행
+    worker.close()  # 정리
+
+def test_worker_batches_commits_and_flushes_on_close(db_path, monkeypatch):  # 배치 커밋
+    monkeypatch.setattr(todo_core, "COMMIT_DEBOUNCE_MS", 60_000)  # 테스트 중에는 디바운스 커밋이 일어나지 않게
+    monkeypatch.setattr(todo_core, "COMMIT_MAX_WAIT_S", 60.0)  # 〃
+    errors = []  # 실패 작업
+    worker = DBWorker(db_path, on_error=errors.append)  # 워커
+    worker.submit(insert_one, _todo("a"))  # 쓰기 1
+    worker.submit(lambda con: con.execute("INSERT INTO todos(title) VALUES('x')"))  # NOT NULL 위반 → 이 작업만 롤백
+    worker.submit(insert_one, _todo("b"))  # 쓰기 2
+    _wait(worker)  # 실행 완료
+    assert len(errors) == 1  # 실패는 on_error로
+    assert _rows(db_path) == []  # 아직 커밋 전(다른 연결에 안 보임)
+    worker.close()  # 남은 쓰기 커밋 후 종료
+    assert _rows(db_path) == [(1, "a", 0), (2, "b", 0)]  # 실패한 작업만 빠지고 한 번에 확정
+
+def test_worker_that_cannot_open_db_fails_every_job(tmp_path):  # 열기 실패
+    errors, failed = [], []  # 공통 핸들러/작업별 errback
+    worker = DBWorker(str(tmp_path / "missing" / "todo.db"), on_error=errors.append)  # 없는 폴더
+    worker.submit(insert_one, _todo("a"), errback=failed.append)  # 열기 전/후 어느 쪽이든
+    _wait(worker)  # 멈추지 않고 끝나야 함
+    worker.submit(insert_one, _todo("b"))  # 실패 뒤 제출
+    assert worker.drain() is False  # 큐를 거치지 않고 바로 실패
+    assert isinstance(worker.failed, sql.OperationalError)  # 원인 보관
+    assert failed == [worker.failed] and errors == [worker.failed]  # errback 우선, 없으면 on_error
+    worker.close()  # 스레드는 이미 끝남
+
+def test_store_keeps_list_stats_index_and_db_in_step(db_path):  # 서비스 일관성
+    store = TodoStore.open(db_path)  # 빈 DB
+    for t in _mixed():  # 6건
+        store.add(t)  # 끝에 추가 + INSERT
+    store.replace(0, _todo("지남 수정", 0, "2026-01-01", "2026-01-11"))  # 편집
+    store.cycle([1, 2])  # 상태 순환
+    store.delete([3, 5])  # 선택 삭제
+    store.close()  # 커밋
+    again = TodoStore.open(db_path)  # 다시 읽음
+    assert again.todos == store.todos  # 메모리와 DB가 같은 내용
+    assert [t.id for t in again.todos] == sorted(t.id for t in again.todos)  # id 오름차순 불변식
+    fresh = ReportStats(TODAY)  # 재구축 집계
+    fresh.reset(store.todos)  # 전체 순회
+    assert store.report(TODAY) == fresh.snapshot(TODAY)  # 증분 집계가 어긋나지 않음
+    assert store.index.search("수정") == {store.todos[0].id}  # 편집한 제목이 색인에 반영
+    again.close()  # 정리
+
+def test_store_filter_combines_query_status_and_due_range(db_path):  # 검색/필터
+    store = TodoStore.open(db_path)  # 빈 DB
+    for t in _mixed():  # 6건
+        store.add(t)  # 추가
+    assert store.filter() is None  # 조건 없음 = 필터 해제
+    assert [t.title for t in store.filter(statuses=(0,))] == ["지남", "오늘", "나중", "오류"]  # 상태만
+    assert [t.title for t in store.filter(lo=TODAY, hi=TODAY + timedelta(days=3))] == ["임박", "오늘", "오류"]  # 마감 범위(종료일만 봄)
+    assert [t.title for t in store.filter("오", statuses=(0, 1))] == ["오늘", "오류"]  # 검색어 AND 상태
+    store.close()  # 정리
+
+class DeferredPersist:  # 워커 흉내
+    """쓰기를 쌓아 두었다가 flush()에서 순서대로 실행하고 콜백을 부른다(DBWorker와 같은 순서 보장)."""  # 역할
+
+    def __init__(self, db: Database) -> None:  # 생성자
+        self.db = db  # 실행 대상
+        self.jobs: list = []  # (fn, args, callback)
+
+    def __call__(self, fn, *args, key=None, callback=None) -> None:  # persist 규약
+        self.jobs.append((fn, args, callback))  # 예약만
+
+    def flush(self) -> None:  # 일괄 실행
+        jobs, self.jobs = self.jobs, []  # 꺼내기
+        for fn, args, callback in jobs:  # 제출 순서대로
+            result = self.db.run(fn, *args)  # 실행
+            if callback is not None:  # 완료 콜백
+                callback(result)  # 호출 스레드에서
+        self.db.commit()  # 커밋
+
+def test_add_takes_db_id_when_another_writer_inserted_first(db_path):  # 동시 쓰기
+    store = TodoStore.open(db_path)  # 시작 시 빈 DB
+    other = sql.connect(db_path)  # CLI 흉내
+    other.execute("INSERT INTO todos(title, start, end, memo, status) VALUES('cli', '2026-01-01', '2026-01-02', '', 0)")  # id 1
+    other.commit()  # 확정
+    other.close()  # 정리
+    store.add(_todo("gui"))  # 예전 방식이면 id 1을 다시 쓰다 UNIQUE 오류
+    store.commit()  # 커밋
+    assert _rows(db_path) == [(1, "cli", 0), (2, "gui", 0)]  # DB가 발급
+    assert [t.id for t in store.todos] == [2]  # 모델에도 반영
+    store.close()  # 정리
+
+def test_queued_writes_follow_provisional_id(db_path):  # 임시 id 번역
+    db = Database(db_path)  # 워커 쪽 연결
+    persist = DeferredPersist(db)  # 콜백을 늦게 부르는 저장소
+    store = TodoStore(persist)  # 화면 쪽 모델
+    store.add(_todo("a"))  # INSERT 결과 전
+    store.add(_todo("b"))  # 〃
+    assert store.todos[0].id >= TEMP_ID_BASE  # 아직 임시 id
+    store.cycle([0])  # 임시 id로 상태 전환 예약
+    store.delete([1])  # 임시 id로 삭제 예약
+    persist.flush()  # 워커 실행 + 콜백
+    assert _rows(db_path) == [(1, "a", 1)]  # 번역된 id로 수정/삭제
+    assert [t.id for t in store.todos] == [1]  # 발급 id로 교체
+    assert store.index.search("a") == {1}  # 색인도 새 id로 교체
+    events = db.con.execute("SELECT todo_id, old, new FROM status_events ORDER BY rowid").fetchall()  # 이력
+    assert events == [(1, None, 0), (2, None, 0), (1, 0, 1)]  # 임시 id가 로그에 남지 않음
+    db.close()  # 정리
+
+def test_assign_ignores_rows_cleared_before_insert_finished(db_path):  # 재적재 중 완료
+    db = Database(db_path)  # 워커 쪽 연결
+    persist = DeferredPersist(db)  # 늦은 콜백
+    store = TodoStore(persist)  # 모델
+    store.add(_todo("a"))  # 임시 id
+    store.clear()  # 가져오기 등으로 목록을 비움
+    persist.flush()  # 콜백이 빈 목록을 만남
+    assert store.todos == []  # 아무것도 되살리지 않음
+    assert _rows(db_path) == [(1, "a", 0)]  # DB에는 저장됨(다음 로딩에서 읽힘)
+    db.close()  # 정리
+
+def _noon(d: date) -> float:  # 이벤트 시각
+    """d일 정오의 epoch 초(로컬 시각 기준 롤업 일자가 d가 되도록)."""  # 변환 규칙
+    return datetime(d.year, d.month, d.day, 12).timestamp()  # 자정 경계와 멀리
+
+def test_cycle_status_ids_logs_every_transition_and_rolls_up(db):  # CLI 토글 이력
+    db.run(insert_one, _todo("a"))  # id 1
+    assert db.run(cycle_status_ids, [1, 1, 9]) == 2  # 같은 id 두 번, 없는 id는 건너뜀
+    assert db.con.execute("SELECT status FROM todos").fetchone() == (2,)  # 최종 상태만 기록
+    events = db.con.execute("SELECT todo_id, old, new FROM status_events ORDER BY rowid").fetchall()  # 로그
+    assert events == [(1, 0, 1), (1, 1, 2)]  # 중간 전환까지 모두
+    assert db.con.execute("SELECT SUM(completed), SUM(reopened) FROM daily_rollup").fetchone() == (1, 0)  # 롤업
+
+def test_rollup_trend_buckets_days_ending_today(db):  # 기간 추이 구간
+    events = [(1, 0, 2, _noon(TODAY)),                         # 마지막 구간: 완료
+              (2, None, 0, _noon(TODAY - timedelta(days=2))),  # 마지막 구간: 추가
+              (3, 2, 0, _noon(TODAY - timedelta(days=3))),     # 그 앞 구간: 되돌림
+              (4, None, 2, _noon(TODAY - timedelta(days=89))), # 첫 구간: 완료 상태로 추가
+              (5, None, 0, _noon(TODAY - timedelta(days=90))), # 기간 밖
+              (6, 0, 2, _noon(TODAY + timedelta(days=1)))]     # 미래(기간 밖)
+    db.run(log_status_events, events)  # 로그 + 롤업
+    r = rollup_trend(db.con, 90, TODAY)  # 90일 = 3일 단위
+    assert (r["width"], len(r["bins"]), r["since"]) == (3, 30, "2025-10-17")  # 구간 격자
+    assert r["bins"][-1] == (1, 0, 1) and r["bins"][-2] == (0, 1, 0) and r["bins"][0] == (1, 0, 1)  # (완료, 되돌림, 추가)
+    assert (r["completed"], r["reopened"], r["created"]) == (2, 1, 2)  # 기간 합계
+    year = rollup_trend(db.con, 365, TODAY)  # 13일 단위
+    assert (year["width"], len(year["bins"])) == (13, 29)  # 첫 구간은 짧음
+    assert sum(b[0] for b in year["bins"]) == 2 and year["per_day"] == round(2 / 365, 2)  # 같은 데이터
+
+def test_missing_ids_keeps_input_order_without_duplicates(db):  # CLI 안내용
+    db.run(insert_one, _todo("a"))  # id 1
+    assert missing_ids(db.con, [9, 1, 7, 9]) == [9, 7]  # 없는 것만, 입력 순서
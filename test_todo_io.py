@@ -0,0 +1,94 @@
+# ─────────────────────────────────────────────────────────
+# 갓생살기 가져오기/내보내기 테스트: 왕복/복원/오류/상태 로그   # pytest
+# ─────────────────────────────────────────────────────────
+
+import json  # JSONL 파일 작성
+import pytest  # 예외 검사/픽스처
+from todo_core import Database, Todo, insert_one  # 코어
+from todo_io import export_todos, import_todos  # 대상
+
+def _write_jsonl(path, rows: list[dict]) -> str:  # 입력 파일
+    """dict 목록을 JSON Lines 파일로 쓰고 경로 문자열을 반환."""  # 반환 규칙
+    path.write_text("".join(json.dumps(r, ensure_ascii=False) + "\n" for r in rows), encoding="utf-8")  # 1행 1객체
+    return str(path)  # import_todos 인자
+
+def _rec(id_, title: str, status: int = 0) -> dict:  # 파일 레코드
+    """기간이 정상인 레코드 1개(id_가 None이면 id 키 생략)."""  # 생성 규칙
+    r = {"title": title, "start": "2026-01-01", "end": "2026-01-02", "status": status}  # 필수 컬럼
+    if id_ is not None:  # 복원용 id
+        r["id"] = id_  # 포함
+    return r  # 레코드
+
+@pytest.fixture
+def db(tmp_path):  # 항목 1건이 든 DB
+    d = Database(str(tmp_path / "todo.db"))  # 연결
+    d.run(insert_one, Todo("keep", "2026-01-01", "2026-01-02"))  # 기존 항목
+    d.commit()  # 확정
+    yield d  # 테스트
+    d.close()  # 정리
+
+def _titles(db: Database) -> list[str]:  # 현재 제목
+    return [r[0] for r in db.con.execute("SELECT title FROM todos ORDER BY id")]  # id 순
+
+def _all(db: Database) -> list[tuple]:  # 전체 행
+    return db.con.execute("SELECT id, title, start, end, memo, status FROM todos ORDER BY id").fetchall()  # id 순
+
+@pytest.mark.parametrize("ext", ["jsonl", "csv"])
+def test_export_then_replace_import_round_trips(db, tmp_path, ext):  # 왕복
+    db.run(insert_one, Todo("쉼표, \"따옴표\"", "2026-01-03", "2026-01-09", "줄\n바꿈", 2))  # 특수 문자
+    db.commit()  # 확정
+    before = _all(db)  # 원본
+    path = str(tmp_path / f"out.{ext}")  # 확장자로 형식 판정
+    assert export_todos(db.con, path) == 2  # 행 수
+    db.run(lambda con: con.execute("UPDATE todos SET title = 'changed'"))  # 원본 훼손
+    assert db.run(import_todos, path, None, True) == 2  # 복원 모드
+    assert _all(db) == before  # id까지 그대로
+    names = {r[0] for r in db.con.execute("SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = 'todos'")}  # 인덱스
+    assert {"idx_todos_status_end", "idx_todos_end"} <= names  # 재생성됨
+
+def test_append_assigns_new_ids_and_normalizes_dates(db, tmp_path):  # 추가 모드
+    rec = {"id": 1, "title": "a", "start": "2026-1-5", "end": "2026-01-07"}  # 관대한 날짜, 파일 id는 무시
+    path = _write_jsonl(tmp_path / "add.jsonl", [rec])  # 1건
+    assert db.run(import_todos, path) == 1  # 추가
+    assert _all(db)[1] == (2, "a", "2026-01-05", "2026-01-07", "", 0)  # 새 id, ISO 정규화
+
+def test_csv_without_title_header_is_rejected(db, tmp_path):  # 헤더 누락
+    path = tmp_path / "bad.csv"  # 입력
+    path.write_text("name,start\nx,2026-01-01\n", encoding="utf-8")  # title 없음
+    with pytest.raises(ValueError, match="1행"):  # 헤더 오류
+        db.run(import_todos, str(path))  # 추가 모드
+    assert _titles(db) == ["keep"]  # 그대로
+
+def test_replace_with_duplicate_id_reports_line_and_keeps_data(db, tmp_path):  # 중복 id
+    path = _write_jsonl(tmp_path / "dup.jsonl", [_rec(1, "a"), _rec(2, "b"), _rec(1, "c")])  # 3행에서 중복
+    with pytest.raises(ValueError, match="3행: 중복 id"):  # IntegrityError가 아닌 ValueError
+        db.run(import_todos, path, None, True)  # 복원 모드
+    db.con.rollback()  # CLI와 같은 처리
+    assert _titles(db) == ["keep"]  # 아무것도 바뀌지 않음
+
+def test_bad_date_reports_line_number(db, tmp_path):  # 형식 오류
+    bad = {"title": "x", "start": "2026-13-01", "end": "2026-01-02"}  # 없는 달
+    path = _write_jsonl(tmp_path / "bad.jsonl", [_rec(None, "a"), bad])  # 2행 오류
+    with pytest.raises(ValueError, match="2행: 날짜 형식 오류"):  # 줄 번호 포함
+        db.run(import_todos, path)  # 추가 모드
+    db.con.rollback()  # 앞선 행까지 취소
+    assert _titles(db) == ["keep"]  # 그대로
+
+def test_append_logs_created_events(db, tmp_path):  # 추가 모드 로그
+    path = _write_jsonl(tmp_path / "add.jsonl", [_rec(None, "a"), _rec(None, "b", status=2)])  # 2건
+    assert db.run(import_todos, path) == 2  # 가져온 행 수
+    events = db.con.execute("SELECT todo_id, old, new FROM status_events ORDER BY rowid").fetchall()  # 로그
+    assert events == [(2, None, 0), (3, None, 2)]  # 새 id로 추가 이벤트
+    created, completed = db.con.execute("SELECT SUM(created), SUM(completed) FROM daily_rollup").fetchone()  # 롤업
+    assert (created, completed) == (2, 1)  # 완료 상태로 들어온 항목도 완료로 집계
+
+def test_replace_keeps_log_and_assigns_ids_to_rows_without_one(db, tmp_path):  # 복원 모드 로그
+    db.run(lambda con: con.execute("INSERT INTO daily_rollup(day, created) VALUES('2025-01-01', 9)"))  # 이전 이력
+    db.run(lambda con: con.execute("INSERT INTO status_events(todo_id, old, new, at, day) "
+                                   "VALUES(1, NULL, 0, '2025-01-01T09:00:00', '2025-01-01')"))  # 이전 로그
+    path = _write_jsonl(tmp_path / "rep.jsonl", [_rec(5, "a"), _rec(None, "b")])  # id 없는 행 섞임
+    assert db.run(import_todos, path, None, True) == 2  # 2건
+    assert db.con.execute("SELECT id, title FROM todos ORDER BY id").fetchall() == [(5, "a"), (6, "b")]  # 기존 항목 삭제
+    events = db.con.execute("SELECT todo_id FROM status_events ORDER BY rowid").fetchall()  # 로그
+    assert events == [(1,), (5,), (6,)]  # 이전 로그는 남고 발급 id까지 추가 기록
+    assert db.con.execute("SELECT SUM(created) FROM daily_rollup").fetchone()[0] == 9 + 2  # 이전 롤업 유지
@@ -0,0 +1,56 @@
+# ─────────────────────────────────────────────────────────
+# 갓생살기 리포트 내보내기 테스트: txt/html/csv                # pytest
+# ─────────────────────────────────────────────────────────
+
+import csv  # CSV 요약 파싱
+from datetime import date, datetime  # 기준일/이벤트 시각
+import pytest  # 예외 검사/픽스처
+from todo_core import Database, Todo, insert_one, log_status_events  # 코어
+from todo_report import export_report  # 대상
+
+TODAY = date(2026, 1, 14)  # 리포트 기준일
+
+@pytest.fixture
+def db(tmp_path):  # 미완 2건 + 완료 1건
+    d = Database(str(tmp_path / "todo.db"))  # 연결
+    for t in (Todo("<나중&>", "2026-01-01", "2026-01-30"), Todo("지남", "2026-01-01", "2026-01-10", status=1),
+              Todo("끝", "2026-01-01", "2026-01-02", status=2)):  # 마감 순서와 id 순서가 다름
+        d.run(insert_one, t)  # 삽입
+    noon = datetime(TODAY.year, TODAY.month, TODAY.day, 12).timestamp()  # 기준일 정오
+    d.run(log_status_events, [(3, 1, 2, noon), (1, None, 0, noon)])  # 오늘 완료 1 + 추가 1
+    d.commit()  # 확정
+    yield d  # 테스트
+    d.close()  # 정리
+
+def test_text_report_lists_open_items_by_due_date(db, tmp_path):  # 텍스트
+    path = tmp_path / "r.txt"  # 확장자로 형식 판정
+    seen = []  # 진행률 호출
+    assert export_report(db.con, str(path), progress=lambda done, total: seen.append((done, total)), today=TODAY) == 2  # 미완료 2건
+    text = path.read_text(encoding="utf-8")  # 결과
+    assert "완료율 33.3%" in text and "최근 30일: 완료 1 · 되돌림 0 · 추가 1" in text  # 요약/추이
+    items = text.split("미완료 항목(마감순)\n")[1].splitlines()  # 목록 부분
+    assert [line.split("| ")[-1] for line in items] == ["지남", "<나중&>"]  # 마감순(완료 항목 제외)
+    assert seen == [(2, 2)]  # 청크마다 1회
+
+def test_html_report_escapes_titles_and_embeds_svg(db, tmp_path):  # HTML
+    path = tmp_path / "r.html"  # 확장자로 형식 판정
+    assert export_report(db.con, str(path), today=TODAY) == 2  # 항목 수
+    html = path.read_text(encoding="utf-8")  # 결과
+    assert "&lt;나중&amp;&gt;" in html and "<나중&>" not in html  # 제목 이스케이프
+    assert html.count("<svg") == 1 + 1 + 1 + 3  # 도넛/스택바/히트맵/추이 3개
+    assert html.rstrip().endswith("</html>")  # 문서 완결
+
+def test_csv_summary_is_long_format_with_trend_totals(db, tmp_path):  # CSV
+    path = tmp_path / "r.csv"  # 확장자로 형식 판정
+    n = export_report(db.con, str(path), today=TODAY)  # 요약 행 수
+    rows = list(csv.reader(path.open(encoding="utf-8", newline="")))  # 파싱
+    assert rows[0] == ["section", "key", "metric", "value"] and len(rows) == n + 1  # 헤더 + 요약
+    table = {(s, k, m): v for s, k, m, v in rows[1:]}  # 조회용
+    assert [table[("status", k, "count")] for k in ("미완료", "진행중", "완료")] == ["1", "1", "1"]  # 상태 구성
+    assert table[("trend_90d", "total", "completed")] == "1"  # 기간 합계
+    assert table[("trend_30d", "2026-01-14", "created")] == "1"  # 마지막 구간 = 오늘
+    assert ("trend_365d", "2025-01-15", "completed") in table  # 짧은 첫 구간은 조회 시작일로 표시
+
+def test_unknown_report_format_is_rejected(db, tmp_path):  # 형식 오류
+    with pytest.raises(ValueError, match="지원하지 않는 형식"):  # 안내용 예외
+        export_report(db.con, str(tmp_path / "r.txt"), "pdf", today=TODAY)  # 명시 형식 우선
@@ -0,0 +1,50 @@
+# ─────────────────────────────────────────────────────────
+# 갓생살기 타이머 테스트: 세션 복원/저장                        # pytest
+# ─────────────────────────────────────────────────────────
+
+from todo_core import Database  # 스키마(타이머 테이블 포함)
+from todo_timer import IDLE, PAUSED, RUNNING, DONE, TimerBoard, load_timers, save_timers  # 대상
+
+NOW, WALL = 1000.0, 1_700_000_000.0  # 단조 시각/벽시계 기준
+
+def test_running_timer_resumes_from_wall_clock():  # 이어서 진행
+    board = TimerBoard()  # 새 실행
+    ended = board.restore([(1, "A", 300.0, 60, RUNNING, 200.0, WALL + 120.0)], NOW, WALL)  # 120초 남음
+    t = board.timers[1]  # 복원된 타이머
+    assert ended == []  # 아직 끝나지 않음
+    assert t.state == RUNNING  # 다시 실행
+    assert t.remaining(NOW) == 120.0  # 저장된 left가 아니라 벽시계 기준
+
+def test_timer_that_ended_while_closed_goes_to_history():  # 꺼진 사이 종료
+    board = TimerBoard()  # 새 실행
+    ended = board.restore([(1, "A", 300.0, 60, RUNNING, 10.0, WALL - 5.0)], NOW, WALL)  # 5초 전에 끝남
+    assert [t.id for t in ended] == [1]  # 호출부에 알림
+    assert board.timers[1].state == DONE  # 종료 상태
+    assert board.history == [("A", 300.0, WALL - 5.0)]  # 원래 종료 시각으로 이력
+
+def test_paused_and_idle_keep_state_and_left():  # 정지/대기
+    board = TimerBoard()  # 새 실행
+    board.restore([(1, "A", 300.0, 60, PAUSED, 42.5, None), (2, "B", 180.0, 30, IDLE, 180.0, None)], NOW, WALL)  # 2개
+    assert [(t.state, t.left) for t in board.timers.values()] == [(PAUSED, 42.5), (IDLE, 180.0)]  # 그대로
+    assert board.next_queued().id == 2  # 대기열 순서 유지
+
+def test_restore_renumbers_ids_taken_before_load():  # 복원 전 추가
+    board = TimerBoard()  # 새 실행
+    board.add("new", 60, 10)  # id 1(로드보다 먼저 만든 타이머)
+    board.restore([(1, "A", 300.0, 60, IDLE, 300.0, None), (2, "B", 300.0, 60, IDLE, 300.0, None)], NOW, WALL)  # 저장분
+    assert [(t.id, t.name) for t in board.timers.values()] == [(1, "new"), (2, "A"), (3, "B")]  # 번호가 겹치지 않고 순서 유지
+    assert board.add("next", 60, 10).id == 4  # 다음 번호도 충돌 없음
+
+def test_snapshot_round_trip_through_db(tmp_path):  # 저장 → 로드
+    db = Database(str(tmp_path / "todo.db"))  # 마이그레이션 포함
+    board = TimerBoard()  # 이전 실행
+    board.add("A", 300, 60).start(NOW)  # 실행 중
+    board.add("B", 120, 30)  # 대기
+    db.run(save_timers, board.snapshot(NOW + 100.0, WALL))  # 100초 뒤 저장
+    db.commit()  # 확정
+    again = TimerBoard()  # 다음 실행
+    again.restore(load_timers(db.con), 50.0, WALL + 30.0)  # 30초 꺼져 있었음
+    a, b = again.timers[1], again.timers[2]  # 복원
+    assert (a.state, a.remaining(50.0)) == (RUNNING, 170.0)  # 300 - 100 - 30
+    assert (b.state, b.left) == (IDLE, 120)  # 그대로
+    db.close()  # 정리
@@ -0,0 +1,263 @@
+# ─────────────────────────────────────────────────────────
+# 갓생살기 CLI: Tk 없이 todo.db를 직접 다루는 명령줄 도구       # 스크립트/대량 작업용 진입점
+# ─────────────────────────────────────────────────────────
+# add / list / toggle / rm / report 서브커맨드를 제공하고, 인자가 없으면 GUI를 띄운다.  # New 상위 요약
+# tkinter는 GUI를 띄울 때만 import하므로 CLI 명령은 코어(todo_core)만 읽고 바로 시작한다.  # New 시작 시간
+
+import argparse  # 서브커맨드/옵션 파싱
+import json  # --json 출력
+import os  # 파이프 종료 시 stdout을 devnull로 돌림
+import sys  # 표준 입출력/종료 코드
+from datetime import date  # 기준일
+from todo_core import (  # GUI 비의존 코어
+    STATUS_TEXT, Database, Todo, to_date, insert_many, iter_todos,
+    cycle_status_ids, delete_many, missing_ids, sql_report_stats, log_status_events, created_events, rollup_trend,
+)
+from todo_io import import_todos, export_todos  # 스트리밍 가져오기/내보내기
+from todo_report import export_report  # 리포트 파일(txt/html/csv)
+
+# ─────────────────────────────────────────────────────────
+# 상수/입력 파싱                                              # 인자 변환 헬퍼
+# ─────────────────────────────────────────────────────────
+STATUS_NAMES = {"todo": 0, "doing": 1, "done": 2, **{v: k for k, v in STATUS_TEXT.items()}}  # 이름 → 상태코드
+BATCH_ROWS = 5000  # stdin 일괄 입력 시 executemany 1회당 행 수(메모리 상한)
+
+def parse_status(s: str) -> int:  # 상태 인자 변환 함수 시그니처
+    """'0'/'todo'/'미완료' 같은 상태 표기를 상태코드(0~2)로 변환."""  # 허용 표기 설명
+    s = s.strip()  # 공백 제거
+    code = int(s) if s.isdigit() else STATUS_NAMES.get(s.lower())  # 숫자 또는 이름
+    if code not in STATUS_TEXT:  # 범위 밖/모르는 이름
+        raise argparse.ArgumentTypeError(f"알 수 없는 상태: {s!r} (0/1/2, todo/doing/done)")  # argparse가 종료 코드 2로 안내
+    return code  # 상태코드
+
+def parse_statuses(s: str) -> set[int]:  # 상태 목록 인자 변환 함수 시그니처
+    """쉼표로 구분된 상태 목록(예: 'todo,doing')을 상태코드 집합으로 변환."""  # 형식 설명
+    return {parse_status(p) for p in s.split(",") if p.strip()}  # 빈 항목 무시
+
+def parse_iso(s: str) -> str:  # 날짜 인자 변환 함수 시그니처
+    """날짜 문자열을 검증해 ISO(YYYY-MM-DD)로 정규화(2025-9-1 → 2025-09-01)."""  # 정규화 규칙
+    d = to_date(s.strip())  # 관대한 파서(오류면 None)
+    if d is None:  # 형식 오류/없는 날짜
+        raise ValueError(f"날짜 형식 오류: {s!r} (YYYY-MM-DD)")  # 호출부에서 안내
+    return d.isoformat()  # DB 저장 형식
+
+def read_ids(values: list[str]) -> list[int]:  # id 인자 수집 함수 시그니처
+    """인자의 id 목록을 정수로 변환('-'이면 stdin에서 공백/줄 단위로 읽음)."""  # 입력 규칙
+    if values == ["-"]:  # 파이프 입력
+        values = (tok for line in sys.stdin for tok in line.split())  # 줄 단위 스트리밍
+    return [int(v) for v in values]  # 정수 id(형식 오류는 ValueError)
+
+def read_batch(lines, today: str):  # stdin 일괄 입력 파서 시그니처
+    """'제목<TAB>시작<TAB>종료<TAB>설명<TAB>상태' 줄을 Todo로 변환하는 제너레이터(뒤쪽 칸은 생략 가능)."""  # 입력 형식
+    for no, line in enumerate(lines, 1):  # 줄 번호는 1부터
+        line = line.rstrip("\r\n")  # 줄바꿈 제거
+        if not line.strip() or line.startswith("#"):  # 빈 줄/주석
+            continue  # 건너뜀
+        cols = line.split("\t") + [""] * 4  # 부족한 칸 채움
+        title, start, end, desc, status = (c.strip() for c in cols[:5])  # 앞 5칸
+        try:
+            if not title:  # 제목 필수
+                raise ValueError("제목이 비어 있습니다")  # 오류
+            start = parse_iso(start) if start else today  # 시작일(생략 시 오늘)
+            end = parse_iso(end) if end else start  # 종료일(생략 시 시작일)
+            if end < start:  # ISO 문자열 비교 = 날짜 비교
+                raise ValueError("종료일이 시작일보다 빠릅니다")  # TodoDialog와 같은 규칙
+            code = parse_status(status) if status else 0  # 상태(생략 시 미완료)
+        except (ValueError, argparse.ArgumentTypeError) as exc:
+            raise ValueError(f"{no}행: {exc}") from None  # 줄 번호를 붙여 전달
+        yield Todo(title, start, end, desc, code)  # 검증된 항목
+
+# ─────────────────────────────────────────────────────────
+# 서브커맨드                                                  # add/list/toggle/rm/report
+# ─────────────────────────────────────────────────────────
+def cmd_add(db: Database, args) -> int:  # add 명령
+    """제목 인자 1건 또는 stdin 일괄 입력을 한 트랜잭션으로 추가."""  # 동작 설명
+    today = date.today().isoformat()  # 기본 날짜
+    if args.title in (None, "-"):  # 일괄 입력 모드
+        items, total = [], 0  # 청크 버퍼/누적 수
+        try:
+            for t in read_batch(sys.stdin, today):  # 줄 단위 스트리밍 파싱
+                items.append(t)  # 버퍼
+                if len(items) >= BATCH_ROWS:  # 청크가 차면
+                    total += len(db.run(insert_many, items))  # 같은 트랜잭션 안에서 executemany
+                    db.run(log_status_events, created_events(items))  # 추가 이벤트 + 일별 롤업
+                    items = []  # 버퍼 비움
+            total += len(db.run(insert_many, items))  # 남은 항목
+            db.run(log_status_events, created_events(items))  # 〃
+        except ValueError as exc:
+            db.con.rollback()  # 전부 아니면 전무(앞 청크도 되돌림)
+            db.dirty = False  # 커밋할 것 없음
+            print(f"오류: {exc} — 아무것도 추가하지 않았습니다.", file=sys.stderr)  # 안내
+            return 1  # 실패
+        print(f"{total}건 추가", file=sys.stderr)  # 요약은 stderr(stdout은 파이프용으로 비움)
+        return 0  # 성공
+    try:
+        start = parse_iso(args.start) if args.start else today  # 시작일
+        end = parse_iso(args.end) if args.end else start  # 종료일
+    except ValueError as exc:
+        print(f"오류: {exc}", file=sys.stderr)  # 안내
+        return 1  # 실패
+    if end < start:  # 기간 역전
+        print("오류: 종료일이 시작일보다 빠릅니다", file=sys.stderr)  # 안내
+        return 1  # 실패
+    t = Todo(args.title, start, end, args.desc, args.status)  # 단건
+    db.run(insert_many, [t])  # 삽입(id 선할당)
+    db.run(log_status_events, created_events([t]))  # 추가 이벤트 + 일별 롤업
+    print(t.id)  # 발급된 id(스크립트에서 바로 사용 가능)
+    return 0  # 성공
+
+def cmd_list(db: Database, args) -> int:  # list 명령
+    """조건에 맞는 항목을 id 순으로 한 줄씩 스트리밍 출력."""  # 동작 설명
+    today = date.today()  # D-DAY 기준일(행마다 호출하지 않음)
+    out = sys.stdout.write  # 단축 참조
+    for t in iter_todos(db.con, args.status, args.due_before):  # 커서 순회(전체 로드 없음)
+        if args.json:  # JSON Lines
+            out(json.dumps({"id": t.id, "title": t.title, "start": t.start, "end": t.end,
+                            "desc": t.desc, "status": t.status}, ensure_ascii=False) + "\n")  # 1행 1객체
+        else:  # 사람용
+            out(f"{t.id}\t{t.display(today)}\n")  # 리스트 탭과 같은 표시
+    return 0  # 성공
+
+def cmd_toggle(db: Database, args) -> int:  # toggle 명령
+    """id들의 상태를 0→1→2→0 순환(없는 id는 stderr로 알림)."""  # 동작 설명
+    ids = read_ids(args.ids)  # 대상 id
+    missing = missing_ids(db.con, ids)  # 없는 id(안내용)
+    n = db.run(cycle_status_ids, ids)  # 한 트랜잭션
+    print(f"{n}건 상태 전환", file=sys.stderr)  # 요약
+    return _report_missing(missing)  # 일부 id가 없으면 1
+
+def cmd_rm(db: Database, args) -> int:  # rm 명령
+    """id들의 행을 삭제(없는 id는 stderr로 알림)."""  # 동작 설명
+    ids = read_ids(args.ids)  # 대상 id
+    missing = missing_ids(db.con, ids)  # 지우기 전에 조회(지운 뒤엔 구분 불가)
+    before = db.con.total_changes  # 누적 변경 수
+    db.run(delete_many, ids)  # 한 트랜잭션
+    n = db.con.total_changes - before  # 실제 삭제 수
+    print(f"{n}건 삭제", file=sys.stderr)  # 요약
+    return _report_missing(missing)  # 일부 id가 없으면 1
+
+def _report_missing(missing: list[int]) -> int:  # 없는 id 안내
+    """없는 id가 있으면 stderr에 나열하고 종료 코드 1, 없으면 0."""  # 반환 규칙
+    if not missing:  # 모두 있음
+        return 0  # 성공
+    print("없는 id: " + ", ".join(map(str, missing)), file=sys.stderr)  # 안내
+    return 1  # 일부 실패
+
+def cmd_report(db: Database, args) -> int:  # report 명령
+    """리포트 탭과 같은 지표를 인덱스 질의로 계산해 출력(전체 로드 없음, --export면 파일로)."""  # 동작 설명
+    if args.export:  # 리포트 파일 생성(cron 등 예약 실행용)
+        lead = "\n" if args.progress else ""  # 진행률 줄 다음 줄에 요약
+        n = export_report(db.con, args.export, args.format, _progress if args.progress else None)  # 요약 + 항목 스트림
+        print(f"{lead}리포트 저장: {args.export} ({n}행)", file=sys.stderr)  # 요약
+        return 0  # 성공
+    s = sql_report_stats(db.con)  # COUNT/GROUP BY 집계
+    tr = rollup_trend(db.con, args.days)  # 일별 롤업 기반 완료 추이
+    if args.json:  # 기계용
+        print(json.dumps({**s, "trend": tr}, ensure_ascii=False))  # dict 그대로
+        return 0  # 성공
+    c0, c1, c2 = s["counts"]  # 상태 튜플 언팩
+    print(f"완료율 {s['rate']:.1f}%")  # 완료율
+    print(f"평균 기간: {s['avg_days']}일")  # 평균 기간
+    print(f"마감 임박: {s['soon']}건")  # 임박
+    print(f"지남: {s['overdue']}건")  # 지남
+    print(f"상태 구성: 미완 {c0} · 진행 {c1} · 완료 {c2}")  # 상태 구성
+    print("이번 주 마감: " + " ".join(f"{d}{n}" for d, n in zip("월화수목금토일", s["week_bins"])))  # 주간 분포
+    print(f"최근 {tr['days']}일: 완료 {tr['completed']} · 되돌림 {tr['reopened']} · 추가 {tr['created']}"
+          f" (하루 평균 {tr['per_day']}건 완료)")  # 기간 추이 요약
+    return 0  # 성공
+
+def _progress(done: int, total: int) -> None:  # 진행률 출력
+    """stderr 한 줄을 덮어쓰며 진행률 표시(stdout은 데이터용)."""  # 출력 규칙
+    sys.stderr.write(f"\r{done * 100 // total}%" if total else f"\r{done:,}")  # 퍼센트 또는 처리 수
+    sys.stderr.flush()  # 즉시 표시
+
+def cmd_import(db: Database, args) -> int:  # import 명령
+    """JSONL/CSV 파일(또는 stdin)을 검증하며 한 트랜잭션으로 가져오기."""  # 동작 설명
+    lead = "\n" if args.progress else ""  # 진행률 줄 다음 줄에 요약
+    try:
+        n = db.run(import_todos, args.path, args.format, args.replace, _progress if args.progress else None)  # 청크 executemany
+    except ValueError as exc:
+        db.con.rollback()  # 앞선 청크까지 모두 취소
+        print(f"{lead}오류: {exc} — 아무것도 가져오지 않았습니다.", file=sys.stderr)  # 안내
+        return 1  # 실패
+    print(f"{lead}{n}건 가져옴", file=sys.stderr)  # 요약
+    return 0  # 성공
+
+def cmd_export(db: Database, args) -> int:  # export 명령
+    """todos 전체를 JSONL/CSV 파일(또는 stdout)로 스트리밍 내보내기."""  # 동작 설명
+    lead = "\n" if args.progress else ""  # 진행률 줄 다음 줄에 요약
+    n = export_todos(db.con, args.path, args.format, _progress if args.progress else None)  # 커서 → 파일
+    print(f"{lead}{n}건 내보냄", file=sys.stderr)  # 요약
+    return 0  # 성공
+
+# ─────────────────────────────────────────────────────────
+# 인자 파서 / 엔트리포인트                                    # argparse 구성
+# ─────────────────────────────────────────────────────────
+def build_parser() -> argparse.ArgumentParser:  # 파서 생성 함수
+    """서브커맨드별 인자 정의."""  # 구성 설명
+    p = argparse.ArgumentParser(prog="todo", description="갓생살기 할 일 CLI (인자가 없으면 GUI 실행)")  # 최상위
+    p.add_argument("--db", help="DB 파일 경로(기본: 스크립트 폴더의 todo.db)")  # 경로 재정의
+    sub = p.add_subparsers(dest="cmd")  # 서브커맨드
+
+    a = sub.add_parser("add", help="할 일 추가(제목 생략 또는 '-'면 stdin에서 TSV 일괄 입력)")  # add
+    a.add_argument("title", nargs="?", help="제목")  # 단건 제목
+    a.add_argument("--start", help="시작일 YYYY-MM-DD(기본: 오늘)")  # 시작일
+    a.add_argument("--end", help="종료일 YYYY-MM-DD(기본: 시작일)")  # 종료일
+    a.add_argument("--desc", default="", help="설명")  # 설명
+    a.add_argument("--status", type=parse_status, default=0, help="상태 0/1/2 또는 todo/doing/done")  # 상태
+    a.set_defaults(func=cmd_add)  # 핸들러
+
+    ls = sub.add_parser("list", help="할 일 목록(스트리밍 출력)")  # list
+    ls.add_argument("--status", type=parse_statuses, help="표시할 상태(쉼표 구분, 예: todo,doing)")  # 상태 필터
+    ls.add_argument("--due-before", type=lambda s: date.fromisoformat(parse_iso(s)),
+                    help="이 날짜 이전(미포함) 마감만")  # 마감 필터
+    ls.add_argument("--json", action="store_true", help="JSON Lines로 출력")  # 출력 형식
+    ls.set_defaults(func=cmd_list)  # 핸들러
+
+    for name, func, text in (("toggle", cmd_toggle, "상태 순환"), ("rm", cmd_rm, "삭제")):  # id 기반 명령 2개
+        c = sub.add_parser(name, help=f"id들의 {text}('-'면 stdin에서 id 읽기)")  # 서브커맨드
+        c.add_argument("ids", nargs="+", help="대상 id 목록 또는 '-'")  # id 인자
+        c.set_defaults(func=func)  # 핸들러
+
+    r = sub.add_parser("report", help="리포트 지표 출력")  # report
+    r.add_argument("--json", action="store_true", help="JSON으로 출력")  # 출력 형식
+    r.add_argument("--days", type=int, choices=(30, 90, 365), default=30, help="완료 추이 기간(일)")  # 추이 기간
+    r.add_argument("--export", metavar="PATH", help="리포트 파일로 저장(.html/.csv/그 밖은 txt, '-'면 stdout)")  # 파일 출력
+    r.add_argument("--format", choices=("txt", "html", "csv"), help="--export 형식 강제")  # 형식
+    r.add_argument("--progress", action="store_true", help="--export 진행률을 stderr에 표시")  # 진행률
+    r.set_defaults(func=cmd_report)  # 핸들러
+
+    for name, func, text in (("import", cmd_import, "가져오기('-'면 stdin)"),
+                             ("export", cmd_export, "내보내기('-'면 stdout)")):  # 백업/복원 명령 2개
+        c = sub.add_parser(name, help=f"JSONL/CSV {text}")  # 서브커맨드
+        c.add_argument("path", help="파일 경로(확장자 .csv면 CSV, 그 밖은 JSONL)")  # 경로
+        c.add_argument("--format", choices=("jsonl", "csv"), help="형식 강제(stdin/stdout일 때 필요)")  # 형식
+        c.add_argument("--progress", action="store_true", help="stderr에 진행률 표시")  # 진행률
+        if name == "import":  # 가져오기 전용
+            c.add_argument("--replace", action="store_true", help="기존 항목을 지우고 파일의 id로 복원")  # 복원 모드
+        c.set_defaults(func=func)  # 핸들러
+    return p  # 완성된 파서
+
+def main(argv: list[str] | None = None) -> int:  # 엔트리포인트
+    """명령을 실행하고 종료 코드를 반환(명령이 없으면 GUI 실행)."""  # 반환 규칙
+    args = build_parser().parse_args(argv)  # 인자 파싱(오류면 종료 코드 2)
+    if args.cmd is None:  # GUI 모드
+        from app import TodoApp  # New tkinter는 여기서만 import(지연 로딩)
+        TodoApp(db_path=args.db).mainloop()  # 이벤트 루프(--db도 GUI에 적용)
+        return 0  # 정상 종료
+    db = Database(args.db)  # 연결 + 스키마/마이그레이션
+    try:
+        return args.func(db, args)  # 명령 실행(쓰기는 모두 한 트랜잭션)
+    except ValueError as exc:  # id 형식 오류 등
+        db.con.rollback()  # 부분 쓰기 취소
+        db.dirty = False  # 커밋할 것 없음
+        print(f"오류: {exc}", file=sys.stderr)  # 안내
+        return 1  # 실패
+    except BrokenPipeError:  # `todo list | head` 처럼 출력 쪽이 먼저 닫힘
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())  # 종료 시 flush 오류 메시지 방지
+        return 0  # 정상 취급
+    finally:
+        db.close()  # 커밋 후 닫기(조회 명령은 쓰기가 없으므로 커밋 생략)
+
+if __name__ == "__main__":  # 직접 실행 시
+    sys.exit(main())  # 종료 코드 전달
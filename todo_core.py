@@ -0,0 +1,965 @@
+# ─────────────────────────────────────────────────────────
+# 갓생살기 코어: GUI 없이 쓰는 모델/저장소/집계              # tkinter 비의존 모듈
+# ─────────────────────────────────────────────────────────
+# 할 일 모델, SQLite 저장소, 증분 집계, 검색 색인과 이를 묶는 TodoStore를 제공한다.  # New 상위 요약
+# tkinter를 import하지 않으므로 디스플레이 없는 서버/CLI/배치/벤치마크에서도 그대로 쓸 수 있다.  # New 사용처
+
+from dataclasses import dataclass, field  # dataclass 데코레이터로 생성자/표현 등 보일러플레이트 자동 생성
+from bisect import bisect_left  # id 오름차순 목록에서 항목 위치 탐색
+from datetime import date, datetime, timedelta  # 날짜(date), 날짜시간(datetime), 기간(timedelta)
+from functools import lru_cache  # 순수 함수 결과 메모이제이션(반복되는 날짜 문자열 파싱 1회로)
+from operator import attrgetter  # id 키 추출(정렬된 목록 이분 탐색)
+from pathlib import Path  # 운영체제 무관한 경로 처리
+import sys  # sys.intern(반복 문자열 공유)
+import time  # 단조 증가 시계(커밋 디바운스/상한)
+import queue  # 스레드 간 작업/결과 전달 큐
+import threading  # DB 전용 워커 스레드
+import re  # 검색 토큰 분리(\w+ — 한글 포함)
+import sqlite3 as sql  # 내장 SQLite DB로 간단 영속화(파일 1개)
+from typing import Callable  # 콜백 타입 힌트
+
+# ─────────────────────────────────────────────────────────
+# 상수/포맷                                                   # 코어 공용 값
+# ─────────────────────────────────────────────────────────
+DATE_FMT = "%Y-%m-%d"  # 날짜 문자열 형식(예: 2025-09-16) — DB/표시 포맷을 통일해 파싱오류를 줄임
+STATUS_ICON = {0: "☐", 1: "⏳", 2: "✔"}  # 상태코드→아이콘 매핑(미완/진행/완료)
+STATUS_TEXT = {0: "미완료", 1: "진행중", 2: "완료"}  # 상태코드→읽을 수 있는 텍스트
+STMT_CACHE_SIZE = 256       # SQLite 준비된 문장 캐시 크기(고정 SQL 문자열 재사용 시 파싱 생략)
+COMMIT_DEBOUNCE_MS = 250    # 연속 쓰기를 한 트랜잭션으로 묶는 디바운스 간격(ms)
+COMMIT_MAX_WAIT_S = 2.0     # 쓰기가 계속 이어져도 이 시간 안에는 반드시 커밋(데이터 유실 범위 상한)
+LOAD_CHUNK_ROWS = 5000      # 페이지 로딩 단위(행 수)
+TEMP_ID_BASE = 1 << 62      # 화면에서 새 항목에 붙이는 임시 id 시작값(DB가 발급하는 id와 겹치지 않는 구간 → 항상 목록 끝에 정렬)
+# New 아이콘/텍스트 매핑을 통해 리스트, 상세 팝업, 리포트 문구, CLI 출력의 표현을 일관되게 유지한다.
+
+# ─────────────────────────────────────────────────────────
+# DB 경로 고정(스크립트 폴더) + 대화형 환경 폴백             # 실행 환경 차이에 따른 DB 경로 보정
+# ─────────────────────────────────────────────────────────
+try:
+    DB_PATH = str(Path(__file__).with_name("todo.db"))  # 스크립트 파일과 같은 폴더에 todo.db 생성/사용
+except NameError:
+    DB_PATH = "todo.db"  # __file__이 없는 인터프리터/노트북 환경에서는 현재 작업 폴더에 저장
+# New __file__ 유무에 따라 경로 전략을 분기 → 어디서 실행해도 동일한 파일명을 쓰도록 안정화.
+
+# ─────────────────────────────────────────────────────────
+# 유틸: 날짜 파싱                                             # 자주 쓰는 헬퍼 함수 모음
+# ─────────────────────────────────────────────────────────
+def parse_date(s: str) -> datetime:  # 날짜 문자열을 datetime으로 파싱하는 헬퍼 시그니처
+    """날짜 문자열(YYYY-MM-DD)을 datetime 객체로 변환."""  # 형식 오류 시 예외를 발생시켜 호출부에서 UX 처리
+    return datetime.strptime(s, DATE_FMT)  # 형식 불일치 시 ValueError 발생 → 호출부에서 UX 메시지 처리
+
+@lru_cache(maxsize=8192)  # New 날짜 종류는 항목 수보다 훨씬 적다 → 같은 문자열은 같은 date 객체를 공유
+def to_date(s: str) -> date | None:  # 관대한 날짜 변환 헬퍼 시그니처
+    """날짜 문자열을 date로 변환(잘못된 형식이면 예외 대신 None)."""  # 모델 캐시용 변환 설명
+    if len(s) == 10 and s[4] == s[7] == "-":  # 표준 YYYY-MM-DD 모양이면
+        try:
+            return date.fromisoformat(s)  # New strptime보다 수십 배 빠른 전용 파서
+        except ValueError:
+            return None  # 모양은 맞지만 없는 날짜(예: 2025-02-30)
+    try:
+        return parse_date(s).date()  # 0 패딩 없는 입력(2025-9-1) 등은 기존 규칙으로
+    except (TypeError, ValueError):
+        return None  # 형식 오류 → 호출부에서 한 번만 표시
+
+# ─────────────────────────────────────────────────────────
+# 데이터 모델                                                 # 도메인 모델 정의
+# ─────────────────────────────────────────────────────────
+@dataclass(slots=True)  # New __dict__ 없는 슬롯 객체 → 10만 건 이상 로드 시 메모리/생성 시간 절감
+class Todo:  # Todo 데이터 클래스 선언
+    """할 일 1건을 표현하는 데이터 모델."""  # 모델 목적/필드 의미 설명
+    title: str  # 제목
+    start: str  # 시작일(YYYY-MM-DD)
+    end: str    # 종료일(YYYY-MM-DD)
+    desc: str = ""   # 상세 설명(옵션)
+    status: int = 0  # 상태 코드(0=미완,1=진행,2=완료) — UI/DB 공용 코드
+    id: int | None = None  # SQLite PK(아직 저장 전이면 None) — 행 단위 갱신/삭제의 키
+    start_d: date | None = field(init=False, repr=False, compare=False)  # 파싱된 시작일 캐시(오류면 None)
+    end_d: date | None = field(init=False, repr=False, compare=False)    # 파싱된 종료일 캐시(오류면 None)
+    _disp: tuple | None = field(default=None, init=False, repr=False, compare=False)  # 표시 캐시 (기준일, 문자열)
+    # New 문자열(start/end)은 DB/표시용으로 그대로 두고, 값이 대입될 때 한 번만 파싱해 캐시한다.
+
+    def __setattr__(self, name: str, value) -> None:  # 필드 대입 훅
+        """start/end가 대입될 때마다 대응하는 date 캐시를 갱신하고, 표시에 쓰이는 필드가 바뀌면 표시 캐시를 버린다."""  # 캐시 일관성 설명
+        object.__setattr__(self, name, value)  # 실제 대입
+        if name == "start":  # 시작일 변경
+            object.__setattr__(self, "start_d", to_date(value))  # 시작일 캐시 갱신
+        elif name == "end":  # 종료일 변경
+            object.__setattr__(self, "end_d", to_date(value))  # 종료일 캐시 갱신
+        elif name != "status" and name != "title":  # 표시와 무관한 필드(id/desc/캐시 자신)
+            return  # 표시 캐시 유지
+        object.__setattr__(self, "_disp", None)  # status/title/start/end 변경 → 표시 캐시 무효화
+
+    @property
+    def dates_ok(self) -> bool:  # 날짜 유효성
+        """시작/종료일이 모두 올바르게 파싱되었는지 여부."""  # 의미 설명
+        return self.start_d is not None and self.end_d is not None  # 둘 다 유효해야 True
+
+    def cycle(self) -> None:  # 상태 순환 메서드 시그니처
+        """상태를 다음 단계로 순환(0→1→2→0)."""  # 순환 규칙 설명
+        self.status = (self.status + 1) % 3  # 키보드 스페이스/버튼으로 빠른 상태 전환 지원
+        # New 리스트에서 '스페이스'로 토글할 때 이 메서드만 호출하면 되어 UI-로직 결합이 느슨해진다.
+
+    def display(self, today: date | None = None) -> str:  # 리스트 표시 문자열 생성 시그니처
+        """리스트박스에 표시할 1줄 요약 문자열(D-DAY 태그 포함). 같은 날 다시 부르면 캐시된 문자열을 반환."""  # 반환 포맷 설명
+        today = today or date.today()  # today 미지정 시 시스템 오늘 날짜
+        cached = self._disp  # (기준일, 문자열) 또는 None
+        if cached is not None and cached[0] == today:  # 필드도 날짜도 그대로
+            return cached[1]  # New 재포맷 없이 재사용(날짜가 바뀌면 자정 이후 첫 호출에서 자동 갱신)
+        text = self._format(today)  # 새로 생성
+        object.__setattr__(self, "_disp", (today, text))  # 캐시(훅 우회, 대입 1회)
+        return text  # 표시 문자열
+
+    def _format(self, today: date) -> str:  # 표시 문자열 생성
+        """아이콘/D-DAY 태그/기간/제목을 조합한 1줄 문자열을 만든다."""  # 조합 규칙
+        icon = STATUS_ICON.get(self.status, "☐")  # 상태에 맞는 시각 아이콘
+        d_end = self.end_d  # 캐시된 종료일(렌더마다 strptime 하지 않음)
+        if d_end is None:
+            # New 날짜 파싱 실패 케이스(유효성 검사가 완벽하지 않을 때를 대비) → 최소정보만 표시
+            return f"{icon} {self.start} ~ {self.end} | {self.title}"  # 안전한 폴백 문자열
+
+        delta = (d_end - today).days   # 종료일까지 남은 일수(D-표기 기준)
+        if delta < 0:  # 마감 초과 여부 판단
+            tag = "⛔ 지남"            # 마감 초과
+        elif delta == 0:  # 당일 마감 여부
+            tag = "⚠️ D-DAY"          # 마감 당일
+        elif delta <= 3:  # 3일 이내 임박 여부
+            tag = f"⏰ D-{delta}"      # 3일 이내 임박
+        else:  # 일반 케이스
+            tag = f"D-{delta}"         # 일반 D-N 표기
+        return f"{icon} [{tag}] {self.start} ~ {self.end} | {self.title}"  # 최종 1줄 표시 문자열
+        # New 태그를 통해 리스트만 보고도 긴급도/우선순위를 직관적으로 파악 가능.
+
+@dataclass  # 변경 집합 컨테이너
+class ChangeSet:  # 부분 갱신용 변경 기록
+    """한 번의 조작으로 바뀐 모델 인덱스 묶음(리스트는 이 행들만 다시 그림)."""  # 용도 설명
+    inserted: list[int] = field(default_factory=list)  # 새로 생긴 행(변경 '후' 인덱스)
+    removed: list[int] = field(default_factory=list)   # 사라진 행(변경 '전' 인덱스)
+    modified: list[int] = field(default_factory=list)  # 내용만 바뀐 행(변경 '후' 인덱스)
+    # New 적용 순서는 removed → inserted → modified. 핸들러가 바뀐 행만 보고하므로 UI 비용 ∝ 변경 행 수.
+
+    def __len__(self) -> int:  # 변경 규모
+        """보고된 변경 행 수의 합."""  # 의미 설명
+        return len(self.inserted) + len(self.removed) + len(self.modified)  # 합계
+
+# ─────────────────────────────────────────────────────────
+# DB 연동                                                     # 영속화 레이어
+# ─────────────────────────────────────────────────────────
+def _db(path: str | None = None) -> sql.Connection:  # DB 연결 함수 시그니처
+    """SQLite 연결을 열고 WAL/동기화 pragma를 적용해 반환."""  # 연결 설정 설명
+    con = sql.connect(path or DB_PATH, cached_statements=STMT_CACHE_SIZE)  # New 준비된 문장(prepared statement) 캐시 확대
+    con.execute("PRAGMA journal_mode=WAL")    # New 쓰기 로그 방식 → 읽기/쓰기 동시성↑, 커밋당 fsync 감소
+    con.execute("PRAGMA synchronous=NORMAL")  # New WAL에서 안전한 최소 동기화(체크포인트 때만 fsync)
+    con.execute("PRAGMA temp_store=MEMORY")   # 임시 B-tree를 메모리에 둠
+    return con  # 설정 완료된 연결 반환
+
+class Database:  # 장수명 연결 관리자
+    """앱 수명 동안 SQLite 연결 1개를 유지하고, 연속 쓰기를 한 트랜잭션으로 묶어 커밋."""  # 역할 설명
+
+    def __init__(self, path: str | None = None) -> None:  # 생성자 시그니처
+        """연결을 열고 스키마를 보장한다."""  # 초기화 설명
+        self.con = _db(path)  # 연결은 한 번만 연다(매 조작마다 connect/저널 셋업 비용 제거)
+        self.dirty = False    # 커밋 대기 중인 쓰기 존재 여부
+        init_db(self.con)     # 테이블 보장
+
+    def run(self, fn, *args):  # 쓰기 실행
+        """fn(con, *args)를 현재 트랜잭션 안에서 실행(커밋은 commit()에서 일괄 처리)."""  # 배치 전략 설명
+        con = self.con  # 단축 참조
+        if not con.in_transaction:  # 배치의 첫 쓰기
+            con.execute("BEGIN")  # 트랜잭션 시작(이후 쓰기는 커밋 전까지 같은 트랜잭션)
+        con.execute("SAVEPOINT job")  # New 작업 단위 세이브포인트 — 한 작업이 실패해도 배치의 다른 쓰기는 보존
+        try:
+            result = fn(con, *args)  # 실제 쓰기
+        except Exception:
+            con.execute("ROLLBACK TO job")  # 이 작업만 되돌림
+            con.execute("RELEASE job")      # 세이브포인트 정리
+            raise  # 호출부(워커)에서 오류 전달
+        con.execute("RELEASE job")  # 작업 확정(커밋은 아님)
+        self.dirty = True  # 커밋 필요 표시
+        return result  # 함수 반환값 전달
+
+    def commit(self) -> None:  # 일괄 커밋
+        """쌓인 쓰기를 한 번의 커밋(fsync 1회)으로 확정."""  # 배치 커밋 설명
+        if self.dirty:  # 대기 중인 쓰기가 있을 때만
+            self.con.commit()  # 커밋
+            self.dirty = False  # 상태 클리어
+
+    def close(self) -> None:  # 종료
+        """남은 쓰기를 커밋한 뒤 연결을 닫는다."""  # 안전 종료 설명
+        self.commit()  # 미커밋 데이터 보존
+        self.con.close()  # 연결 해제
+    # New 스페이스를 꾹 누르는 등 연속 이벤트가 와도 커밋은 DBWorker가 디바운스해서 한 번만 수행한다.
+
+def init_db(con: sql.Connection) -> None:  # DB 초기화 함수 시그니처
+    """앱 최초 실행 시 todos 테이블 생성(존재하면 무시)."""  # 테이블 스키마 개요
+    with con:  # 트랜잭션 컨텍스트(오류 시 자동 롤백, 정상 시 커밋)
+        # New status 컬럼에 CHECK 제약을 둬서 유효하지 않은 상태 값(0/1/2 외)을 DB 차원에서 차단
+        con.execute("""
+            CREATE TABLE IF NOT EXISTS todos(
+                id     INTEGER PRIMARY KEY AUTOINCREMENT,  -- 내부 PK(표시용 아님)
+                title  TEXT NOT NULL,                      -- 제목
+                start  TEXT NOT NULL,                      -- 시작일(YYYY-MM-DD)
+                end    TEXT NOT NULL,                      -- 종료일(YYYY-MM-DD)
+                memo   TEXT DEFAULT '',                    -- 상세설명(예약어 피하려고 'memo' 사용)
+                status INTEGER NOT NULL CHECK(status IN (0,1,2)) -- 상태코드(무결성 보장)
+            )
+        """)  # 스키마 생성 쿼리 실행
+    migrate(con)  # New 스키마 버전(PRAGMA user_version)에 맞춰 남은 마이그레이션 적용
+
+# ─────────────────────────────────────────────────────────
+# New 스키마 마이그레이션(PRAGMA user_version 기반)            # 스키마 진화
+# ─────────────────────────────────────────────────────────
+def _m1_iso_dates(con: sql.Connection) -> None:  # 마이그레이션 1
+    """0 패딩이 없는 날짜(2025-9-1)를 ISO 텍스트(2025-09-01)로 정규화 → 문자열 비교 = 날짜 비교."""  # 목적 설명
+    rows = con.execute(
+        "SELECT id, start, end FROM todos WHERE length(start) != 10 OR length(end) != 10"  # 비정규 행만
+    ).fetchall()  # 대상 조회
+    fixed = []  # 갱신 파라미터
+    for id_, start, end in rows:  # 대상 순회
+        d1, d2 = to_date(start), to_date(end)  # 앱과 같은 규칙으로 파싱
+        fixed.append((d1.isoformat() if d1 else start, d2.isoformat() if d2 else end, id_))  # 잘못된 값은 그대로 둠
+    con.executemany("UPDATE todos SET start=?, end=? WHERE id=?", fixed)  # 일괄 갱신
+
+def _m2_indexes(con: sql.Connection) -> None:  # 마이그레이션 2
+    """리포트 질의용 커버링 인덱스 생성(테이블을 읽지 않고 인덱스만으로 집계)."""  # 목적 설명
+    con.execute("CREATE INDEX IF NOT EXISTS idx_todos_status_end ON todos(status, end, start)")  # 상태별 개수/임박/지남
+    con.execute("CREATE INDEX IF NOT EXISTS idx_todos_end ON todos(end, start)")  # 주간 히트맵/평균 기간
+
+def _m3_timers(con: sql.Connection) -> None:  # 마이그레이션 3
+    """발표 타이머 세션(종료 전 상태)과 완료 이력 테이블 생성."""  # 목적 설명
+    con.execute("""
+        CREATE TABLE IF NOT EXISTS timer_sessions(
+            id       INTEGER PRIMARY KEY,  -- 보드 안 타이머 id(대기열 순서)
+            name     TEXT NOT NULL,        -- 발표자/순서 이름
+            total    REAL NOT NULL,        -- 총 시간(초)
+            warn     INTEGER NOT NULL,     -- 경고 임계(초)
+            state    TEXT NOT NULL,        -- idle/running/paused
+            left     REAL NOT NULL,        -- 일시정지/대기 중 남은 시간(초)
+            end_wall REAL                  -- 실행 중이면 종료 벽시계 시각(epoch 초) — 재시작 후 남은 시간 복원 기준
+        )
+    """)  # 진행 중 세션(앱 종료/크래시 후 복원)
+    con.execute("""
+        CREATE TABLE IF NOT EXISTS timer_history(
+            id       INTEGER PRIMARY KEY AUTOINCREMENT,
+            name     TEXT NOT NULL,        -- 발표자/순서 이름
+            total    REAL NOT NULL,        -- 총 시간(초)
+            finished TEXT NOT NULL,        -- 종료 시각(YYYY-MM-DDTHH:MM:SS, 로컬)
+            day      TEXT NOT NULL         -- 종료일(YYYY-MM-DD) — 기간 집계 키
+        )
+    """)  # 완료 세션 이력(추가만)
+    con.execute("CREATE INDEX IF NOT EXISTS idx_timer_history_day ON timer_history(day, total)")  # 기간 집계는 인덱스만 읽음
+
+def _m4_status_log(con: sql.Connection) -> None:  # 마이그레이션 4
+    """상태 변경 이벤트 로그(추가만)와 일별 롤업(리포트 추이용 물질화 집계) 테이블 생성."""  # 목적 설명
+    con.execute("""
+        CREATE TABLE IF NOT EXISTS status_events(
+            id      INTEGER PRIMARY KEY AUTOINCREMENT,
+            todo_id INTEGER NOT NULL,  -- 대상 할 일 id(삭제돼도 이력은 남김 → FK 없음)
+            old     INTEGER,           -- 이전 상태(NULL = 새로 추가됨)
+            new     INTEGER NOT NULL,  -- 바뀐 상태
+            at      TEXT NOT NULL,     -- 변경 시각(YYYY-MM-DDTHH:MM:SS, 로컬)
+            day     TEXT NOT NULL      -- 변경일(YYYY-MM-DD) — 롤업 키
+        )
+    """)  # 상태 변경 로그(수정/삭제하지 않음)
+    con.execute("""
+        CREATE TABLE IF NOT EXISTS daily_rollup(
+            day       TEXT PRIMARY KEY,            -- YYYY-MM-DD
+            created   INTEGER NOT NULL DEFAULT 0,  -- 그날 추가된 항목 수
+            completed INTEGER NOT NULL DEFAULT 0,  -- 그날 완료로 바뀐 횟수
+            reopened  INTEGER NOT NULL DEFAULT 0   -- 그날 완료에서 되돌린 횟수
+        ) WITHOUT ROWID
+    """)  # 일별 집계(이벤트가 들어올 때 같은 트랜잭션에서 갱신 → 조회 시 로그를 다시 훑지 않음)
+
+MIGRATIONS = [_m1_iso_dates, _m2_indexes, _m3_timers, _m4_status_log]  # 순서가 곧 버전 번호(1부터) — 추가만 하고 수정/삭제하지 않음
+
+def migrate(con: sql.Connection) -> None:  # 마이그레이션 실행기
+    """PRAGMA user_version 이후의 마이그레이션을 차례로 적용(각 단계는 자체 트랜잭션)."""  # 동작 설명
+    ver = con.execute("PRAGMA user_version").fetchone()[0]  # 현재 스키마 버전
+    for v, fn in enumerate(MIGRATIONS[ver:], start=ver + 1):  # 남은 단계만
+        with con:  # 단계별 커밋/롤백
+            fn(con)  # 마이그레이션 실행
+            con.execute(f"PRAGMA user_version = {v}")  # 버전 기록(PRAGMA는 바인딩 불가 → 정수만 포맷)
+
+def load_all(con: sql.Connection) -> list[Todo]:  # 전체 로드 함수 시그니처
+    """DB의 모든 항목을 읽어 메모리(list[Todo])로 반환."""  # 정렬/모델 변환 설명
+    rows = con.execute(
+        "SELECT id, title, start, end, memo, status FROM todos ORDER BY id"  # id 순으로 안정 정렬
+    ).fetchall()  # New ORDER BY id로 사용자 입력 순서를 그대로 유지 → UX 일관성
+    return [row_to_todo(r) for r in rows]  # 행→모델 변환
+
+def row_to_todo(row: tuple, _new=object.__new__, _set=object.__setattr__, _it=sys.intern) -> Todo:  # 행 변환 함수 시그니처
+    """(id, title, start, end, memo, status) 행을 Todo로 변환(반복 문자열은 intern으로 공유)."""  # 변환 규칙 설명
+    id_, title, start, end, memo, status = row  # 언팩
+    start, end = _it(start), _it(end)  # New 같은 날짜 문자열은 객체 1개만 유지
+    t = _new(Todo)  # New 대량 로드 전용: 필드별 __setattr__ 훅을 거치지 않고 슬롯에 직접 기록
+    _set(t, "title", _it(title))  # 제목(반복 제목 공유)
+    _set(t, "start", start)       # 시작일 문자열
+    _set(t, "end", end)           # 종료일 문자열
+    _set(t, "desc", memo)         # 상세설명
+    _set(t, "status", status)     # 상태 코드
+    _set(t, "id", id_)            # PK
+    _set(t, "start_d", to_date(start))  # 날짜 캐시(메모이즈된 파서)
+    _set(t, "end_d", to_date(end))      # 〃
+    _set(t, "_disp", None)              # 표시 캐시 비어 있음(첫 display()에서 생성)
+    return t  # 생성자와 같은 상태의 객체
+    # New 얇은 변환 계층: SQL 행 → 도메인 모델(Todo). 뷰/로직은 모델만 신경 쓰면 됨.
+
+# ─────────────────────────────────────────────────────────
+# New 행 단위 영속화: 바뀐 행만 쓰기(저장 비용 ∝ 변경 크기)     # 증분 저장 레이어
+# ─────────────────────────────────────────────────────────
+def _rid(i: int, remap: dict[int, int] | None) -> int:  # id 번역
+    """임시 id면 워커가 기록해 둔 DB id로, 아니면 그대로."""  # 번역 규칙
+    return remap.get(i, i) if remap else i  # 대응이 없으면 이미 DB id
+
+def insert_one(con: sql.Connection, t: Todo, remap: dict[int, int] | None = None) -> int:  # 단건 삽입 함수 시그니처
+    """Todo 1건을 id=NULL로 INSERT해 DB가 발급한 id를 반환(remap이 있으면 t.id(임시 id) → 발급 id를 기록)."""  # 부수효과 설명
+    cur = con.execute(
+        "INSERT INTO todos(title, start, end, memo, status) VALUES(?,?,?,?,?)",  # id는 항상 DB가 발급(다른 프로세스의 쓰기와 겹치지 않음)
+        (t.title, t.start, t.end, t.desc, t.status),  # 바인딩 파라미터
+    )  # 실행
+    if remap is not None:  # 화면 쪽 임시 id가 있는 경우
+        remap[t.id] = cur.lastrowid  # 뒤이어 큐에 들어 있는 수정/삭제/이벤트 작업이 이 대응으로 번역
+    return cur.lastrowid  # 발급된 id(모델 반영은 호출부가 Tk 스레드에서)
+
+def insert_many(con: sql.Connection, items: list[Todo]) -> list[int]:  # 다건 삽입 함수 시그니처
+    """여러 항목을 executemany 한 번으로 INSERT(id는 next_todo_id부터 선할당해 각 t.id에 기록)."""  # 대량 입력용
+    first = next_todo_id(con)  # 같은 트랜잭션 안이므로 다른 쓰기와 겹치지 않음
+    for k, t in enumerate(items):  # 항목별
+        t.id = first + k  # 연속 id 부여
+    con.executemany(
+        "INSERT INTO todos(id, title, start, end, memo, status) VALUES(?,?,?,?,?,?)",  # insert_one과 같은 SQL(문장 캐시 공유)
+        [(t.id, t.title, t.start, t.end, t.desc, t.status) for t in items],  # 파라미터 시퀀스
+    )  # 실행
+    return [t.id for t in items]  # 발급된 id 목록
+
+def next_todo_id(con: sql.Connection) -> int:  # id 선할당 시작값 함수 시그니처
+    """앞으로 발급할 첫 id(AUTOINCREMENT 시퀀스와 MAX(id) 중 큰 값 + 1 → 삭제된 id도 재사용하지 않음)."""  # 규칙 설명
+    seq = con.execute("SELECT seq FROM sqlite_sequence WHERE name = 'todos'").fetchone()  # 시퀀스(없을 수 있음)
+    top = con.execute("SELECT COALESCE(MAX(id), 0) FROM todos").fetchone()[0]  # 현재 최대 id
+    return max(seq[0] if seq else 0, top) + 1  # 다음 id
+
+def update_one(con: sql.Connection, t: Todo, remap: dict[int, int] | None = None) -> None:  # 단건 수정 함수 시그니처
+    """t.id 행의 모든 필드를 현재 모델 값으로 덮어쓴다(임시 id는 remap으로 번역)."""  # 전체 필드 갱신 설명
+    con.execute(
+        "UPDATE todos SET title=?, start=?, end=?, memo=?, status=? WHERE id=?",  # PK 기준 단건 갱신
+        (t.title, t.start, t.end, t.desc, t.status, _rid(t.id, remap)),  # 바인딩 파라미터
+    )  # 실행
+
+def delete_many(con: sql.Connection, ids: list[int], remap: dict[int, int] | None = None) -> None:  # 다건 삭제 함수 시그니처
+    """주어진 id들의 행을 삭제(다중 선택 삭제용, 임시 id는 remap으로 번역)."""  # 용도 설명
+    con.executemany("DELETE FROM todos WHERE id=?", [(_rid(i, remap),) for i in ids])  # PK 인덱스로 건별 삭제
+
+def update_status_many(con: sql.Connection, items: list[Todo], remap: dict[int, int] | None = None) -> None:  # 다건 상태 갱신 함수 시그니처
+    """여러 항목의 status 컬럼만 갱신(스페이스 토글용, 임시 id는 remap으로 번역)."""  # 용도 설명
+    con.executemany(
+        "UPDATE todos SET status=? WHERE id=?",  # 상태 컬럼만 갱신 → 가장 가벼운 쓰기
+        [(t.status, _rid(t.id, remap)) for t in items],  # 파라미터 시퀀스
+    )  # 실행
+    # New 제목/날짜는 그대로이므로 status만 쓰면 페이지 변경량도 최소가 된다.
+
+def missing_ids(con: sql.Connection, ids: list[int]) -> list[int]:  # 없는 id 조회
+    """ids 중 todos에 없는 id를 입력 순서대로(중복 제거) 반환(CLI 안내용)."""  # 용도 설명
+    found = set()  # 존재하는 id
+    uniq = list(dict.fromkeys(ids))  # 순서 유지 중복 제거
+    for chunk in (uniq[k:k + 500] for k in range(0, len(uniq), 500)):  # 바인딩 변수 한도 안에서
+        found.update(r[0] for r in con.execute(
+            f"SELECT id FROM todos WHERE id IN ({','.join('?' * len(chunk))})", chunk))  # PK 인덱스 조회
+    return [i for i in uniq if i not in found]  # 없는 id
+
+def cycle_status_ids(con: sql.Connection, ids: list[int]) -> int:  # id 기준 상태 순환 함수 시그니처
+    """메모리 모델 없이 id들의 상태를 0→1→2→0 순환하고 실제로 바뀐 행 수를 반환(CLI용, 변경 이력도 기록)."""  # 용도 설명
+    now = time.time()  # 이벤트 시각
+    cur: dict[int, int] = {}  # id → 순환 후 상태(같은 id가 여러 번 오면 이어서 순환)
+    events = []  # (todo_id, old, new, 시각)
+    for i in ids:  # 입력 순서대로
+        old = cur.get(i)  # 이번 명령에서 이미 바꾼 값
+        if old is None:  # 처음 보는 id
+            row = con.execute("SELECT status FROM todos WHERE id=?", (i,)).fetchone()  # PK 조회
+            if row is None:  # 없는 id
+                continue  # 건너뜀(바뀐 행 수에서 빠짐)
+            old = row[0]  # 현재 상태
+        cur[i] = (old + 1) % 3  # 순환
+        events.append((i, old, cur[i], now))  # 이력
+    con.executemany("UPDATE todos SET status=? WHERE id=?", [(st, i) for i, st in cur.items()])  # 최종 상태만 기록
+    log_status_events(con, events)  # 같은 트랜잭션에서 로그 + 롤업
+    return len(events)  # 없는 id는 0행
+
+def iter_todos(con: sql.Connection, statuses=None, due_before: date | None = None):  # 스트리밍 조회 함수 시그니처
+    """조건에 맞는 항목을 id 순으로 하나씩 내보내는 제너레이터(전체를 메모리에 올리지 않음)."""  # 스트리밍 설명
+    where, params = [], []  # 조건/파라미터
+    if statuses is not None:  # 상태 조건
+        statuses = sorted(set(statuses))  # 중복 제거
+        where.append(f"status IN ({','.join('?' * len(statuses))})")  # (status, end) 인덱스 선두 컬럼
+        params += statuses  # 바인딩
+    if due_before is not None:  # 마감 상한(미포함)
+        where.append("end < ? AND date(julianday(end)) = end")  # 형식이 올바른 날짜만 비교
+        params.append(due_before.isoformat())  # ISO 텍스트 비교 = 날짜 비교
+    sql_text = "SELECT id, title, start, end, memo, status FROM todos"  # 기본 조회
+    if where:  # 조건이 있으면
+        sql_text += " WHERE " + " AND ".join(where)  # 결합
+    for row in con.execute(sql_text + " ORDER BY id", params):  # 커서를 그대로 순회(행 단위 fetch)
+        yield row_to_todo(row)  # 행→모델 변환
+
+# ─────────────────────────────────────────────────────────
+# New 페이지 단위 로더 + SQL 집계(전체 로드 전에도 리포트 가능)  # 지연 로딩 레이어
+# ─────────────────────────────────────────────────────────
+class PagedLoader:  # 키셋(keyset) 커서 로더
+    """id 순으로 페이지를 끊어 읽는 로더(시작 시점의 MAX(id)까지만 읽어 새로 추가된 행과 겹치지 않음)."""  # 역할 설명
+
+    def __init__(self, con: sql.Connection) -> None:  # 생성자 시그니처
+        """읽을 범위(현재 MAX(id))를 고정하고 커서 위치를 0으로 둔다(연결은 보관하지 않음 → 워커 스레드에서만 사용)."""  # 초기화 설명
+        self.max_id: int = con.execute("SELECT COALESCE(MAX(id), 0) FROM todos").fetchone()[0]  # PK 인덱스로 O(1)
+        self.last_id = 0      # 마지막으로 읽은 id(키셋 커서)
+        self.loaded = 0       # 지금까지 읽은 행 수
+        self.done = self.max_id == 0  # 빈 DB면 바로 완료
+
+    def next_page(self, con: sql.Connection, n: int) -> list[Todo]:  # 다음 페이지 읽기
+        """다음 n행을 Todo 목록으로 반환(마지막 페이지면 done=True)."""  # 반환 규칙
+        if self.done:  # 이미 끝까지 읽음
+            return []  # 빈 목록
+        rows = con.execute(
+            "SELECT id, title, start, end, memo, status FROM todos WHERE id > ? AND id <= ? ORDER BY id LIMIT ?",
+            (self.last_id, self.max_id, n),  # New OFFSET 대신 키셋 → 페이지가 뒤로 갈수록 느려지지 않음
+        ).fetchall()  # PK 범위 스캔
+        if rows:  # 읽은 행이 있으면
+            self.last_id = rows[-1][0]  # 커서 전진
+        self.loaded += len(rows)  # 누적
+        self.done = len(rows) < n or self.last_id >= self.max_id  # 끝 판정
+        return [row_to_todo(r) for r in rows]  # 행→모델 변환
+
+_VALID = "date(julianday(start)) = start AND date(julianday(end)) = end"  # 유효한 ISO 날짜만(없는 날짜 2025-02-30은 왕복 변환 시 3월로 넘어가 불일치)
+
+def sql_report_stats(con: sql.Connection, today: date | None = None) -> dict:  # SQL 집계 함수 시그니처
+    """메모리에 전체 목록이 없어도 인덱스 질의로 리포트 요약을 계산(ReportStats.snapshot과 같은 모양)."""  # 용도 설명
+    today = today or date.today()  # 기준일
+    monday = today - timedelta(days=today.weekday())  # 이번 주 월요일
+    counts = [0, 0, 0]  # 상태별 개수
+    for st, n in con.execute("SELECT status, COUNT(*) FROM todos GROUP BY status"):  # 인덱스 선두 컬럼으로 집계
+        counts[st] = n  # 반영
+    total = sum(counts)  # 총 개수
+    if total == 0:  # 비어있을 때
+        return {"rate": 0.0, "avg_days": 0.0, "soon": 0, "overdue": 0,
+                "counts": (0, 0, 0), "week_bins": [0]*7}  # 기본 구조 반환
+    t, t3 = today.isoformat(), (today + timedelta(days=3)).isoformat()  # ISO 텍스트 → 문자열 범위 = 날짜 범위
+    soon = con.execute(
+        f"SELECT COUNT(*) FROM todos WHERE status IN (0, 1) AND end BETWEEN ? AND ? AND {_VALID}", (t, t3)
+    ).fetchone()[0]  # (status, end) 범위 스캔 — 임박 구간만 읽음
+    overdue = con.execute(
+        f"SELECT COUNT(*) FROM todos WHERE status IN (0, 1) AND end < ? AND {_VALID}", (t,)
+    ).fetchone()[0]  # (status, end) 범위 스캔 — 지난 구간만 읽음
+    avg = con.execute(
+        f"SELECT AVG(julianday(end) - julianday(start)) FROM todos WHERE end >= start AND {_VALID}"
+    ).fetchone()[0]  # 커버링 인덱스만 훑는 평균(테이블 본문은 읽지 않음)
+    week_bins = [0]*7  # 월~일 마감 건수
+    for end, n in con.execute(
+        f"SELECT end, COUNT(*) FROM todos WHERE end >= ? AND end < ? AND {_VALID} GROUP BY end",
+        (monday.isoformat(), (monday + timedelta(days=7)).isoformat()),
+    ):  # (end) 인덱스로 이번 주 7일 범위만
+        week_bins[(date.fromisoformat(end) - monday).days] = n  # 요일 칸에 반영
+    return {"rate": round(counts[2] / total * 100, 1), "avg_days": round(avg, 1) if avg is not None else 0.0,
+            "soon": soon, "overdue": overdue, "counts": tuple(counts), "week_bins": week_bins}  # 요약 반환
+    # New 로딩이 끝나면 앱은 증분 집계(ReportStats)로 넘어가고, 이 함수는 로딩 중에만 쓰인다.
+
+# ─────────────────────────────────────────────────────────
+# New 상태 변경 이력 + 일별 롤업(기간 추이는 롤업만 읽음)       # 히스토리 레이어
+# ─────────────────────────────────────────────────────────
+TREND_BINS = 30  # 추이 막대 최대 개수(30일=하루, 90일=3일, 365일=13일 단위)
+
+def log_status_events(con: sql.Connection, events: list[tuple], remap: dict[int, int] | None = None) -> None:  # 이벤트 기록
+    """(todo_id, old, new, epoch 초) 이벤트를 로그에 추가하고 일별 롤업을 같은 트랜잭션에서 증분 갱신(임시 id는 remap으로 번역)."""  # 동작 설명
+    if not events:  # 기록할 것 없음
+        return  # 종료
+    rows, deltas = [], {}  # 로그 파라미터 / 일자 → [created, completed, reopened]
+    for todo_id, old, new, wall in events:  # 이벤트별
+        ts = datetime.fromtimestamp(wall)  # 로컬 시각
+        day = ts.date().isoformat()  # 롤업 키
+        rows.append((_rid(todo_id, remap), old, new, ts.isoformat(timespec="seconds"), day))  # 로그 행
+        d = deltas.setdefault(day, [0, 0, 0])  # 일자 누적기
+        if old is None:  # 추가
+            d[0] += 1  # 추가 수
+        if new == 2 and old != 2:  # 완료(완료 상태로 추가된 것 포함)
+            d[1] += 1  # 완료 수
+        if old == 2 and new != 2:  # 되돌림
+            d[2] += 1  # 되돌림 수
+    con.executemany("INSERT INTO status_events(todo_id, old, new, at, day) VALUES(?,?,?,?,?)", rows)  # 로그 추가
+    con.executemany(
+        "INSERT INTO daily_rollup(day, created, completed, reopened) VALUES(?,?,?,?) "
+        "ON CONFLICT(day) DO UPDATE SET created = created + excluded.created, "
+        "completed = completed + excluded.completed, reopened = reopened + excluded.reopened",
+        [(day, *d) for day, d in deltas.items()],  # 보통 하루 1행
+    )  # 일자별 upsert(배치당 일자 수만큼만 씀)
+
+def created_events(items: list[Todo], wall: float | None = None) -> list[tuple]:  # 추가 이벤트 생성
+    """새로 추가된 항목들의 (todo_id, None, status, 시각) 이벤트 목록(id가 발급된 뒤 호출)."""  # 호출 규약
+    wall = time.time() if wall is None else wall  # 이벤트 시각
+    return [(t.id, None, t.status, wall) for t in items]  # 추가 이벤트
+
+def rollup_trend(con: sql.Connection, days: int = 30, today: date | None = None) -> dict:  # 기간 추이
+    """최근 days일(오늘 포함)의 완료/되돌림/추가 추이를 TREND_BINS개 이하 구간으로 묶어 반환(롤업 PK 범위만 읽음)."""  # 지표 설명
+    today = today or date.today()  # 기준일
+    width = -(-days // TREND_BINS)  # 구간 폭(일, 올림)
+    n = -(-days // width)  # 구간 수
+    origin = today - timedelta(days=n * width - 1)  # 구간 격자 시작(마지막 구간이 오늘에서 끝나도록 정렬)
+    since = today - timedelta(days=days - 1)  # 실제 조회 시작일(첫 구간은 짧을 수 있음)
+    bins = [[0, 0, 0] for _ in range(n)]  # 구간별 [completed, reopened, created]
+    for day, created, completed, reopened in con.execute(
+        "SELECT day, created, completed, reopened FROM daily_rollup WHERE day >= ? AND day <= ?",
+        (since.isoformat(), today.isoformat()),
+    ):  # 최대 days행
+        b = bins[(date.fromisoformat(day) - origin).days // width]  # 오래된 구간이 앞
+        b[0] += completed  # 완료 누적
+        b[1] += reopened   # 되돌림 누적
+        b[2] += created    # 추가 누적
+    done, back, new = (sum(col) for col in zip(*bins))  # 기간 합계
+    return {"days": days, "width": width, "since": since.isoformat(), "bins": [tuple(b) for b in bins],
+            "completed": done, "reopened": back, "created": new,
+            "per_day": round(done / days, 2)}  # 리포트/내보내기용 요약
+    # New 이벤트 로그는 감사/재구축용으로만 남고, 추이 조회는 하루 1행짜리 롤업만 읽어 365일도 수 ms에 끝난다.
+
+# ─────────────────────────────────────────────────────────
+# New 백그라운드 DB 워커(단일 작성자 스레드 + 작업 큐)           # Tk 스레드에서 디스크 I/O 제거
+# ─────────────────────────────────────────────────────────
+_STOP = object()  # 워커 종료 신호
+
+class DBWorker:  # DB 전용 스레드
+    """모든 SQLite 작업을 전용 스레드 1개에서 순서대로 실행하고, 결과는 drain()으로 Tk 스레드에 넘긴다."""  # 역할 설명
+
+    def __init__(self, path: str | None = None, on_error: Callable[[Exception], None] | None = None,
+                 profiler=None) -> None:  # 생성자 시그니처
+        """스레드를 시작한다(연결은 스레드 안에서 열어 sqlite 스레드 제약을 지킴).
+
+        profiler(todo_perf.Profiler)가 있으면 작업별 실행 시간(db:<함수>)과 큐 대기 시간, 커밋 시간을 기록한다.
+        """  # 초기화 설명
+        self._path = path                  # DB 경로(None이면 DB_PATH)
+        self._on_error = on_error          # 작업 실패 시 Tk 스레드에서 호출할 핸들러
+        self._perf = profiler              # New 옵트인 계측기(None이면 기록 안 함)
+        self._jobs: queue.Queue = queue.Queue()  # 작업 큐(FIFO → 삽입/수정/삭제 순서 보존)
+        self._done: queue.Queue = queue.Queue()  # 완료 큐(콜백, 결과, 예외)
+        self._keyed: dict = {}             # 병합 키 → 아직 시작 전인 작업(같은 키면 인자만 최신으로 교체)
+        self._lock = threading.Lock()      # _keyed 보호
+        self.outstanding = 0               # 제출했지만 아직 drain되지 않은 작업 수(Tk 스레드 전용)
+        self.failed: Exception | None = None  # DB 열기 실패 원인(설정되면 모든 작업이 이 예외로 실패)
+        self._thread = threading.Thread(target=self._run, name="db-worker", daemon=True)  # 워커 스레드
+        self._thread.start()  # 시작
+
+    def submit(self, fn, *args, callback=None, key=None, write: bool = True, errback=None) -> None:  # 작업 제출
+        """fn(con, *args)를 큐에 넣는다. key가 같은 작업이 아직 대기 중이면 새로 넣지 않고 인자만 교체(쓰기 병합).
+
+        errback이 있으면 실패 시 on_error 대신 errback(exc)을 호출한다(작업별 후처리용).
+        DB를 열지 못한 워커에 넣은 작업은 실행하지 않고 곧바로 그 예외로 실패 처리한다.
+        """  # 병합/오류 규칙
+        with self._lock:  # 병합 테이블/실패 상태 보호
+            if self.failed is not None:  # 워커가 이미 죽음
+                self.outstanding += 1  # drain에서 짝을 맞춤
+                self._done.put((callback, errback, None, self.failed))  # 바로 실패 전달
+                return  # 큐 추가 없음
+            if key is not None and key in self._keyed:  # 같은 키 작업이 대기 중
+                self._keyed[key][1] = args  # 최신 인자로 교체 → 한 번만 실행
+                return  # 큐 추가 없음
+            job = [fn, args, callback, key, write, errback, time.perf_counter()]  # 가변 작업 레코드(끝은 제출 시각)
+            if key is not None:  # 병합 가능한 작업
+                self._keyed[key] = job  # 등록
+            self.outstanding += 1  # 대기 작업 수 증가
+            self._jobs.put(job)  # 잠금 안에서 넣음 → 실패 처리(_fail_all)가 놓치는 작업 없음
+
+    def drain(self) -> bool:  # 완료 처리(Tk 스레드)
+        """완료된 작업의 콜백을 호출하고, 아직 남은 작업이 있으면 True."""  # 반환 의미
+        while True:  # 완료 큐 비우기
+            try:
+                callback, errback, result, exc = self._done.get_nowait()  # 완료 레코드
+            except queue.Empty:
+                break  # 더 없음
+            self.outstanding -= 1  # 대기 수 감소
+            if exc is not None:  # 실패
+                if errback is not None:  # 작업별 오류 처리
+                    errback(exc)  # 호출부 정리(진행창 닫기 등)
+                elif self._on_error:  # 공용 핸들러 있으면
+                    self._on_error(exc)  # 사용자 안내
+            elif callback is not None:  # 성공 + 콜백
+                callback(result)  # 결과 전달
+        return self.outstanding > 0  # 폴링 지속 여부
+
+    def close(self) -> None:  # 종료
+        """남은 작업을 모두 실행·커밋한 뒤 스레드를 끝낸다(완료 콜백은 버림)."""  # 안전 종료 설명
+        self._jobs.put(_STOP)  # 종료 신호(큐 맨 뒤 → 앞선 쓰기가 먼저 처리됨)
+        self._thread.join()  # 플러시 완료까지 대기
+
+    def _run(self) -> None:  # 스레드 본체
+        """작업을 실행하고, 쓰기가 멈추면(디바운스) 또는 최대 대기 시간이 지나면 한 번에 커밋."""  # 배치 커밋 규칙
+        try:
+            db = Database(self._path)  # 스레드 전용 연결(스키마/마이그레이션 포함)
+        except Exception as exc:
+            self._fail_all(exc)  # 대기 중/이후 작업을 모두 실패 처리(drain이 끝나도록)
+            return  # 종료
+        first_dirty = 0.0  # 이번 배치의 첫 쓰기 시각
+        while True:  # 작업 루프
+            timeout = None  # 기본: 작업이 올 때까지 대기
+            if db.dirty:  # 커밋 대기 중
+                timeout = max(0.0, min(COMMIT_DEBOUNCE_MS / 1000, first_dirty + COMMIT_MAX_WAIT_S - time.monotonic()))  # 디바운스/상한
+            try:
+                job = self._jobs.get(timeout=timeout)  # 다음 작업
+            except queue.Empty:
+                self._commit(db)  # 조용해졌으면 커밋(fsync 1회)
+                continue  # 계속 대기
+            if job is _STOP:  # 종료 신호
+                break  # 루프 탈출
+            with self._lock:  # 시작 시점에 병합 대상에서 제외(이후 같은 키는 새 작업)
+                fn, args, callback, key, write, errback, queued = job  # 최신 인자 확정
+                if key is not None:  # 병합 작업
+                    self._keyed.pop(key, None)  # 등록 해제
+            was_dirty = db.dirty  # 배치 시작 여부 판단용
+            t0 = time.perf_counter()  # 실행 시작
+            try:
+                result = db.run(fn, *args) if write else fn(db.con, *args)  # 쓰기는 세이브포인트, 읽기는 그대로
+                self._done.put((callback, errback, result, None))  # 성공 전달
+            except Exception as exc:
+                self._done.put((callback, errback, None, exc))  # 실패 전달
+            if self._perf is not None:  # 계측 중
+                self._perf.record("db:" + getattr(fn, "__name__", "job"), t0, time.perf_counter() - t0, t0 - queued)  # 지연 = 큐 대기
+            if db.dirty and not was_dirty:  # 새 배치 시작
+                first_dirty = time.monotonic()  # 시각 기록
+            elif db.dirty and time.monotonic() - first_dirty >= COMMIT_MAX_WAIT_S:  # 작업이 끊이지 않아도
+                self._commit(db)  # 상한이 지나면 커밋(장시간 미커밋 방지)
+        db.close()  # 남은 쓰기 커밋 후 연결 종료
+
+    def _fail_all(self, exc: Exception) -> None:  # 열기 실패 처리
+        """실패 상태로 바꾸고 큐에 남은 작업을 모두 exc로 실패 전달(이후 submit은 즉시 실패)."""  # 동작 설명
+        with self._lock:  # submit과 경쟁하지 않게
+            self.failed = exc  # 이후 작업은 큐를 거치지 않음
+            self._keyed.clear()  # 병합 대상도 모두 폐기
+            while True:  # 남은 작업 비우기
+                try:
+                    job = self._jobs.get_nowait()  # 다음 작업
+                except queue.Empty:
+                    break  # 더 없음
+                if job is not _STOP:  # 종료 신호는 건너뜀
+                    self._done.put((job[2], job[5], None, exc))  # (callback, errback)으로 실패 전달
+        # New 연결이 없으면 작업이 영원히 대기해 drain()이 계속 True가 되므로 여기서 모두 끝내 준다.
+
+    def _commit(self, db: Database) -> None:  # 커밋(+계측)
+        """배치 커밋. 계측 중이면 fsync를 포함한 소요 시간을 db:commit으로 기록."""  # 기록 이름
+        if self._perf is None:  # 평소 경로
+            db.commit()  # 커밋
+        else:  # 계측 경로
+            self._perf.timed("db:commit", db.commit)  # 커밋 시간 기록
+    # New Tk 스레드는 큐에 넣기만 하므로 느린 디스크/큰 DB에서도 창과 타이머가 멈추지 않는다.
+
+# ─────────────────────────────────────────────────────────
+# New 리포트 집계 엔진(변경 시 증분 반영, 조회는 O(1))         # 통계 레이어
+# ─────────────────────────────────────────────────────────
+class ReportStats:  # 증분 집계기
+    """할 일 추가/삭제 때마다 집계값을 갱신해 두고, 리포트는 요약만 꺼내 가는 집계 저장소."""  # 역할 설명
+
+    def __init__(self, today: date | None = None) -> None:  # 생성자 시그니처
+        """빈 집계 상태로 시작(today는 테스트/벤치용 기준일 주입)."""  # 파라미터 설명
+        self._today = today or date.today()  # 지남(overdue) 판정 기준일
+        self.version = 0           # 변경 카운터(스냅샷 캐시 무효화 키)
+        self._clear()              # 집계 필드 초기화
+
+    def _clear(self) -> None:  # 집계 초기화
+        """집계값과 스냅샷 캐시를 비운다(기준일/변경 카운터는 유지)."""  # 동작 설명
+        self.counts = [0, 0, 0]    # 상태별 개수(미완/진행/완료)
+        self.dur_sum = 0           # (종료-시작) 일수 합계
+        self.dur_n = 0             # 기간 계산 대상 개수
+        self.overdue = 0           # 기준일 이전에 마감된 미완료 항목 수
+        self._open_by_end: dict[date, int] = {}  # 미완료 항목의 종료일별 개수(임박/지남 버킷)
+        self._all_by_end: dict[date, int] = {}   # 전체 항목의 종료일별 개수(주간 히트맵 버킷)
+        self._snap_key: tuple | None = None  # 마지막 스냅샷의 (version, today)
+        self._snap: dict = {}      # 마지막 스냅샷
+
+    def _apply(self, t: Todo, sign: int) -> None:  # 공통 반영 로직
+        """sign=+1이면 t를 집계에 더하고, -1이면 뺀다."""  # 대칭 처리 설명
+        self.counts[t.status] += sign  # 상태 카운트
+        self.version += 1  # 스냅샷 무효화
+        d1, d2 = t.start_d, t.end_d  # 모델에 캐시된 날짜(파싱 없음)
+        if d1 is None or d2 is None:  # 날짜 오류 항목(로드 시 1회 안내됨)
+            return  # 날짜 지표는 건드리지 않음
+        if d2 >= d1:  # 음수 기간 방지
+            self.dur_sum += sign * (d2 - d1).days  # 기간 합
+            self.dur_n += sign  # 기간 개수
+        self._all_by_end[d2] = self._all_by_end.get(d2, 0) + sign  # 전체 종료일 버킷
+        if t.status != 2:  # 완료 제외(관리 포인트만 집계)
+            self._open_by_end[d2] = self._open_by_end.get(d2, 0) + sign  # 미완료 종료일 버킷
+            if d2 < self._today:  # 이미 지난 마감
+                self.overdue += sign  # 지남 카운트
+
+    def add(self, t: Todo) -> None:  # 항목 추가 반영
+        """t를 집계에 더한다."""  # 동작 설명
+        self._apply(t, +1)  # 공통 로직 위임
+
+    def remove(self, t: Todo) -> None:  # 항목 제거 반영
+        """t를 집계에서 뺀다(상태/날짜가 바뀌기 '전' 값으로 호출해야 함)."""  # 호출 규약
+        self._apply(t, -1)  # 공통 로직 위임
+
+    def reset(self, items: list[Todo]) -> None:  # 전체 재구축
+        """집계를 비우고 items로 다시 쌓는다(최초 로드 때 1회)."""  # 용도 설명
+        self._clear()  # 집계 초기화(기준일 유지)
+        self.version += 1  # 이전 버전을 키로 잡은 캐시도 무효화
+        for t in items:  # 전체 1회 순회
+            self._apply(t, +1)  # 추가 반영
+
+    def _roll_to(self, today: date) -> None:  # 날짜 변경 처리
+        """기준일이 바뀌면 그 사이에 걸친 종료일 버킷만 지남 카운트로 옮긴다."""  # 경계 재계산 설명
+        old, self._today = self._today, today  # 기준일 교체
+        lo, hi, sign = (old, today, +1) if today > old else (today, old, -1)  # 이동 구간/방향(시계 역행 대비)
+        span = (hi - lo).days  # 구간 일수
+        if span <= len(self._open_by_end):  # 보통(하루 이틀): 경계 버킷만 조회
+            moved = sum(self._open_by_end.get(lo + timedelta(days=k), 0) for k in range(span))  # 구간 합
+        else:  # 오래 잠들었다 깬 경우: 버킷 수가 더 적으므로 버킷을 순회
+            moved = sum(n for d, n in self._open_by_end.items() if lo <= d < hi)  # 구간 합
+        self.overdue += sign * moved  # 지남 카운트 보정
+
+    def snapshot(self, today: date | None = None) -> dict:  # 요약 조회
+        """리포트용 요약 dict를 반환(데이터와 날짜가 그대로면 캐시를 그대로 돌려줌 → O(1))."""  # 캐시 정책
+        today = today or date.today()  # 기준일
+        if today != self._today:  # 자정이 지났으면
+            self._roll_to(today)  # 경계 버킷만 재계산
+        key = (self.version, today)  # 캐시 키
+        if key == self._snap_key:  # 변경 없음
+            return self._snap  # 같은 객체 반환(호출부가 'is'로 재그리기 생략 가능)
+        total = sum(self.counts)  # 총 개수
+        if total == 0:  # 비어있을 때
+            snap = {"rate": 0.0, "avg_days": 0.0, "soon": 0, "overdue": 0,
+                    "counts": (0, 0, 0), "week_bins": [0]*7}  # 기본 구조
+        else:  # 일반 케이스
+            start_week = today - timedelta(days=today.weekday())  # 이번 주 월요일
+            ob, ab = self._open_by_end, self._all_by_end  # 단축 참조
+            snap = {
+                "rate": round(self.counts[2] / total * 100, 1),  # 완료율(소수 1자리)
+                "avg_days": round(self.dur_sum / self.dur_n, 1) if self.dur_n else 0.0,  # 평균 기간
+                "soon": sum(ob.get(today + timedelta(days=k), 0) for k in range(4)),  # D-0~D-3 버킷 4개
+                "overdue": self.overdue,  # 누적 카운트
+                "counts": tuple(self.counts),  # 상태 구성
+                "week_bins": [ab.get(start_week + timedelta(days=k), 0) for k in range(7)],  # 월~일 버킷 7개
+            }  # 요약 구성(항목 수와 무관하게 상수 시간)
+        self._snap_key, self._snap = key, snap  # 캐시 저장
+        return snap  # 요약 반환
+
+# ─────────────────────────────────────────────────────────
+# New 검색 역색인(토큰 → id 집합, 증분 유지)                  # 검색/필터 레이어
+# ─────────────────────────────────────────────────────────
+_TOKEN_RE = re.compile(r"\w+")  # 단어 토큰(영문/숫자/한글)
+_ID = attrgetter("id")          # 정렬 키: self.todos는 항상 id 오름차순
+
+class SearchIndex:  # 역색인
+    """제목/설명의 토큰별 id 집합을 유지하고, 부분 문자열 검색은 '어휘(토큰 종류)'만 훑어서 처리."""  # 역할 설명
+
+    def __init__(self) -> None:  # 생성자 시그니처
+        """빈 색인으로 시작."""  # 초기화 설명
+        self._postings: dict[str, set[int]] = {}  # 토큰 → 그 토큰을 가진 항목 id 집합
+        self._tokens: dict[int, set[str]] = {}    # id → 색인에 넣은 토큰(제거 시 사용)
+        self._match_cache: dict[str, list[str]] = {}  # 검색어 → 그 검색어를 포함하는 토큰 목록
+
+    @staticmethod
+    def tokens(t: Todo) -> set[str]:  # 토큰화
+        """제목+설명을 소문자 단어 토큰 집합으로 분리."""  # 규칙 설명
+        return set(_TOKEN_RE.findall(f"{t.title} {t.desc}".lower()))  # 중복 제거
+
+    def add(self, t: Todo) -> None:  # 색인 추가
+        """t의 토큰을 색인에 추가(새 토큰이 생기면 검색어 캐시 무효화)."""  # 동작 설명
+        toks = self.tokens(t)  # 토큰화
+        self._tokens[t.id] = toks  # 제거용 보관
+        for tok in toks:  # 토큰별 posting 갱신
+            ids = self._postings.get(tok)  # 기존 posting
+            if ids is None:  # 처음 보는 토큰 → 어휘 변경
+                self._postings[tok] = {t.id}  # 새 posting
+                self._match_cache.clear()  # 캐시된 토큰 목록이 불완전해짐
+            else:  # 기존 토큰
+                ids.add(t.id)  # id 추가
+
+    def remove(self, t: Todo) -> None:  # 색인 제거
+        """t.id의 토큰을 색인에서 뺀다(빈 posting은 어휘에서도 삭제)."""  # 동작 설명
+        for tok in self._tokens.pop(t.id, ()):  # 넣었던 토큰만
+            ids = self._postings[tok]  # posting
+            ids.discard(t.id)  # id 제거
+            if not ids:  # 더 이상 쓰이지 않는 토큰
+                del self._postings[tok]  # 어휘에서 제거
+                self._match_cache.clear()  # 캐시 무효화
+
+    def _matching_tokens(self, term: str) -> list[str]:  # 부분 문자열 매칭 토큰
+        """term을 포함하는 어휘 토큰 목록(직전 키 입력의 결과가 있으면 그 안에서만 좁혀 찾음)."""  # 좁히기 전략
+        hit = self._match_cache.get(term)  # 캐시 조회
+        if hit is not None:  # 캐시 적중
+            return hit  # 그대로 반환
+        base = self._match_cache.get(term[:-1]) or self._match_cache.get(term[1:])  # 한 글자 짧은 검색어 결과
+        if base is None:  # 좁힐 근거가 없으면
+            base = self._postings.keys()  # 전체 어휘(항목 수보다 훨씬 작음)
+        hit = [tok for tok in base if term in tok]  # C 수준 부분 문자열 검사
+        if len(self._match_cache) > 256:  # 캐시 크기 상한
+            self._match_cache.clear()  # 단순 초기화
+        self._match_cache[term] = hit  # 캐시 저장
+        return hit  # 결과 반환
+
+    def search(self, query: str) -> set[int] | None:  # 검색
+        """검색어의 모든 단어를 (부분 문자열로) 포함하는 항목 id 집합(검색어가 비면 None = 필터 없음)."""  # AND 규칙
+        result: set[int] | None = None  # 누적 결과
+        for term in _TOKEN_RE.findall(query.lower()):  # 검색어 단어별
+            post = self._postings  # 단축 참조
+            ids = set().union(*(post[tok] for tok in self._matching_tokens(term)))  # 매칭 토큰 posting 합집합
+            result = ids if result is None else result & ids  # 단어 간 AND
+            if not result:  # 이미 비었으면
+                break  # 조기 종료
+        return result  # None(검색어 없음) 또는 id 집합
+    # New 키 입력마다 전체 항목을 훑지 않고 어휘만 훑으므로 10만 건에서도 한 자리 ms로 응답한다.
+
+# ─────────────────────────────────────────────────────────
+# New 서비스 계층: 목록 + 집계 + 색인 + 저장을 한 곳에서       # GUI/CLI 공용 진입점
+# ─────────────────────────────────────────────────────────
+class TodoStore:  # 할 일 서비스
+    """메모리 목록(id 오름차순)과 ReportStats/SearchIndex를 함께 갱신하고, 바뀐 행만 저장소에 기록."""  # 역할 설명
+
+    def __init__(self, persist: Callable | None = None) -> None:  # 생성자 시그니처
+        """persist(fn, *args, key=None, callback=None)는 행 단위 저장 함수를 실행할 곳(동기 Database 또는 DBWorker)."""  # 주입 규칙
+        self.todos: list[Todo] = []      # 항상 id 오름차순(이분 탐색/페이지 삽입의 전제)
+        self.stats = ReportStats()       # 증분 집계 엔진
+        self.index = SearchIndex()       # 제목/설명 역색인
+        self.remap: dict[int, int] = {}  # 임시 id → DB id(INSERT 직후 워커가 기록, 뒤이은 작업이 번역 — 워커 쪽 전용)
+        self._temp_id = TEMP_ID_BASE     # 다음 임시 id(DB id는 INSERT 결과로만 받음)
+        self.bad_dates = 0               # 날짜 형식 오류 항목 수(로드 중 1회 판정)
+        self.db: Database | None = None  # open()으로 만든 동기 저장소일 때만 설정
+        self._persist = persist          # 저장 위임 대상(None이면 메모리 전용)
+
+    @classmethod
+    def open(cls, path: str | None = None) -> "TodoStore":  # 동기 저장소 생성
+        """DB를 열고 전체 목록을 읽은 동기 저장소(CLI/배치/벤치마크용)."""  # 사용처 설명
+        db = Database(path)  # 연결 + 스키마/마이그레이션
+        def persist(fn, *args, key=None, callback=None):  # 같은 스레드에서 바로 실행(커밋은 commit())
+            result = db.run(fn, *args)  # 실행
+            if callback is not None:  # 결과 후처리(발급 id 반영 등)
+                callback(result)  # 즉시 호출
+        store = cls(persist)  # 동기 저장소
+        store.db = db  # 커밋/종료용 보관
+        loader = PagedLoader(db.con)  # 키셋 커서
+        while not loader.done:  # 끝까지
+            store.extend(loader.next_page(db.con, LOAD_CHUNK_ROWS), loader.max_id)  # 청크 단위 적재
+        return store  # 준비 완료
+
+    def commit(self) -> None:  # 커밋
+        """동기 저장소의 쌓인 쓰기를 한 번에 커밋(워커 모드에서는 워커가 알아서 커밋)."""  # 모드별 동작
+        if self.db is not None:  # 동기 모드
+            self.db.commit()  # 일괄 커밋
+
+    def clear(self) -> None:  # 비우기
+        """메모리 목록/집계/색인을 비운다(DB는 그대로 — 가져오기 후 다시 읽을 때 사용)."""  # 용도 설명
+        self.todos.clear()  # 제자리 비우기(같은 리스트 객체를 공유하는 화면 계층 보호)
+        self.stats = ReportStats()  # 새 집계
+        self.index = SearchIndex()  # 새 색인
+        self.bad_dates = 0  # 오류 카운트 초기화
+
+    def close(self) -> None:  # 종료
+        """남은 쓰기를 커밋하고 연결을 닫는다."""  # 안전 종료 설명
+        if self.db is not None:  # 동기 모드
+            self.db.close()  # 커밋 후 닫기
+            self.db = None  # 재사용 방지
+
+    def _write(self, fn, *args, key=None, callback=None) -> None:  # 저장 위임
+        """행 단위 영속화 함수 fn(con, *args)를 persist에 넘긴다(callback은 결과를 받아 Tk/호출 스레드에서 실행)."""  # 위임 설명
+        if self._persist is not None:  # 저장소가 연결된 경우만
+            self._persist(fn, *args, key=key, callback=callback)  # 실행/예약
+
+    def _assign(self, temp: int, real: int) -> None:  # 발급 id 반영
+        """INSERT가 끝난 항목의 임시 id를 DB가 발급한 id로 바꾼다(그 사이 삭제/재적재됐으면 무시)."""  # 동작 설명
+        todos = self.todos  # 단축 참조
+        i = bisect_left(todos, temp, key=_ID)  # 임시 id는 꼬리 구간에 정렬돼 있음
+        if i == len(todos) or todos[i].id != temp:  # 이미 지워졌거나 목록을 다시 읽음
+            return  # 바꿀 것 없음
+        t = todos[i]  # 대상(편집으로 교체된 객체일 수도 있음)
+        self.index.remove(t)  # 임시 id로 넣은 색인 제거
+        t.id = real  # 발급 id는 앞선 모든 DB id보다 크고 남은 임시 id보다 작음 → 정렬 유지
+        self.index.add(t)  # 새 id로 다시 색인
+
+    # ── 읽기 ──
+    def position(self, t: Todo) -> int:  # 객체 → 인덱스
+        """todos에서 t의 위치(id 오름차순 불변식을 이용한 이분 탐색)."""  # 탐색 전략
+        todos = self.todos  # 단축 참조
+        i = bisect_left(todos, t.id, key=_ID)  # O(log n)
+        return i if i < len(todos) and todos[i] is t else todos.index(t)  # 불변식이 깨진 경우 대비
+
+    def filter(self, query: str = "", statuses=(0, 1, 2), lo: date | None = None,
+               hi: date | None = None) -> list[Todo] | None:  # 검색/필터
+        """검색어(AND, 부분 문자열)/상태/마감 범위를 만족하는 항목 목록(조건이 없으면 None)."""  # 반환 규칙
+        statuses = set(statuses)  # 포함 검사용
+        ids = self.index.search(query)  # 역색인 조회(None = 검색어 없음)
+        full = len(statuses) >= 3  # 상태 조건 없음
+        if ids is None and full and lo is None and hi is None:  # 조건 없음
+            return None  # 필터 해제
+        todos = self.todos  # 단축 참조
+        if ids is None:  # 검색어 없음 → 전체에서 상태/날짜만
+            src = todos  # 원본
+        elif len(ids) * 16 > len(todos):  # 결과가 크면 모델 순서대로 훑는 편이 빠름(이분 탐색 1회 ≈ 순회 16행)
+            src = [t for t in todos if t.id in ids]  # 순서 유지 필터
+        else:  # 결과가 작으면 id 정렬 후 이분 탐색으로 객체 회수
+            src = [todos[bisect_left(todos, i, key=_ID)] for i in sorted(ids)]  # id 순 = 모델 순
+        dated = lo is not None or hi is not None  # 날짜 조건 여부
+        if full and not dated:  # 검색어만 있는 경우
+            return src if src is not todos else list(src)  # 추가 순회 생략
+        return [t for t in src if t.status in statuses and (not dated or (
+            t.end_d is not None and (lo is None or t.end_d >= lo) and (hi is None or t.end_d <= hi)))]  # 최종 조건
+
+    def report(self, today: date | None = None) -> dict:  # 리포트 지표
+        """완료율/상태 구성/임박/지남/평균 기간/주간 분포(증분 집계 스냅샷)."""  # 지표 목록
+        return self.stats.snapshot(today)  # 데이터/날짜가 그대로면 캐시된 dict
+
+    # ── 쓰기(모두 ChangeSet 반환 → 화면은 바뀐 행만 다시 그림) ──
+    def extend(self, page: list[Todo], max_id: int) -> ChangeSet:  # 페이지 적재
+        """DB에서 읽은 페이지를 집계/색인에 반영하고 '이미 읽은 DB 행' 바로 뒤에 끼워 넣는다."""  # 삽입 위치 설명
+        for t in page:  # 읽은 항목만 순회
+            self.stats.add(t)  # 증분 집계 반영
+            self.index.add(t)  # 검색 색인 반영
+            if not t.dates_ok:  # 날짜 오류 항목
+                self.bad_dates += 1  # 카운트
+        todos = self.todos  # 단축 참조
+        pos = len(todos)  # 삽입 위치: 로딩 중 추가된 항목(id > max_id)들 앞
+        while pos and (todos[pos - 1].id or 0) > max_id:  # 꼬리의 새 항목만 건너뜀
+            pos -= 1  # 한 칸 앞으로
+        todos[pos:pos] = page  # id 순서를 유지하며 삽입
+        return ChangeSet(inserted=list(range(pos, pos + len(page))))  # 삽입된 구간
+
+    def add(self, t: Todo) -> ChangeSet:  # 추가
+        """새 항목에 임시 id를 붙여 끝에 추가하고 INSERT를 기록(DB id는 INSERT 결과로 받아 바꿔 끼움)."""  # 동작 설명
+        t.id = self._temp_id  # 임시 id(로딩 중에도 바로 추가 가능, DB id와 겹치지 않음)
+        self._temp_id += 1  # 다음 임시 id
+        self.todos.append(t)  # 최대 id → 끝에 붙여도 정렬 유지
+        self.stats.add(t)  # 집계 반영
+        self.index.add(t)  # 색인 반영
+        self._write(insert_one, t, self.remap, callback=lambda real, temp=t.id: self._assign(temp, real))  # id=NULL INSERT
+        self._write(log_status_events, created_events([t]), self.remap)  # 추가 이벤트(병합하지 않음)
+        return ChangeSet(inserted=[len(self.todos) - 1])  # 추가된 마지막 행
+
+    def replace(self, idx: int, t: Todo) -> ChangeSet:  # 편집
+        """idx 위치 항목을 t로 교체하고 해당 행만 UPDATE."""  # 동작 설명
+        old = self.todos[idx]  # 이전 값
+        self.stats.remove(old)  # 이전 값 집계에서 제거
+        self.index.remove(old)  # 이전 제목/설명 색인 제거
+        t.id = old.id  # PK 유지
+        self.todos[idx] = t  # 교체
+        self.stats.add(t)  # 새 값 집계 반영
+        self.index.add(t)  # 새 제목/설명 색인
+        self._write(update_one, t, self.remap, key=("row", t.id))  # 해당 행 1건만 UPDATE(대기 중이면 병합)
+        if t.status != old.status:  # 편집 대화상자에서 상태를 바꾼 경우
+            self._write(log_status_events, [(t.id, old.status, t.status, time.time())], self.remap)  # 상태 변경 이벤트
+        return ChangeSet(modified=[idx])  # 편집된 행
+
+    def delete(self, indices: list[int]) -> ChangeSet:  # 삭제
+        """오름차순 인덱스 목록의 항목을 삭제(뒤에서부터 지워 인덱스 당김 문제 방지)."""  # 구현 상세 설명
+        todos = self.todos  # 단축 참조
+        ids = [todos[i].id for i in indices]  # 삭제 대상 PK 수집(인덱스가 당겨지기 전에)
+        for i in reversed(indices):  # 뒤에서부터
+            self.stats.remove(todos[i])  # 집계에서 제거
+            self.index.remove(todos[i])  # 색인에서 제거
+            del todos[i]  # 목록에서 제거
+        self._write(delete_many, ids, self.remap)  # 선택된 행만 DELETE
+        return ChangeSet(removed=list(indices))  # 삭제된 행(변경 전 인덱스)
+
+    def cycle(self, indices: list[int]) -> ChangeSet:  # 상태 순환
+        """항목들의 상태를 0→1→2→0 순환하고 status 컬럼만 갱신."""  # 동작 설명
+        changed = [self.todos[i] for i in indices]  # 상태가 바뀔 항목들
+        now, events = time.time(), []  # 이벤트 시각/목록
+        for t in changed:  # 항목 순회
+            self.stats.remove(t)  # 바뀌기 전 상태로 집계에서 빼고
+            old = t.status  # 이전 상태
+            t.cycle()  # 상태 순환 실행
+            self.stats.add(t)  # 바뀐 상태로 다시 더함
+            events.append((t.id, old, t.status, now))  # 변경 이벤트
+        self._write(update_status_many, changed, self.remap, key=("status", tuple(t.id for t in changed)))  # 연타는 1회로 병합
+        self._write(log_status_events, events, self.remap)  # 이벤트는 병합하지 않음(연타의 중간 상태도 모두 기록)
+        return ChangeSet(modified=list(indices))  # 토글된 행
+    # New Tk 앱, CLI, 배치 작업이 같은 규칙(집계/색인/행 단위 저장)을 공유한다.
@@ -0,0 +1,198 @@
+# ─────────────────────────────────────────────────────────
+# 갓생살기 가져오기/내보내기: JSONL·CSV 스트리밍 백업/복원      # 제너레이터 파이프라인
+# ─────────────────────────────────────────────────────────
+# 내보내기는 커서에서 행을 바로 흘려 쓰고(list[Todo]를 만들지 않음), 가져오기는 청크 단위로 검증 → executemany.  # New 상위 요약
+# 모든 함수는 fn(con, ...) 모양이라 CLI(동기 Database.run)와 GUI(DBWorker.submit)에서 그대로 쓴다.  # New 호출 규약
+
+import csv  # CSV 읽기/쓰기(C 구현)
+import io  # 바이너리 파일 위에 텍스트 래퍼(진행률용 바이트 위치)
+import json  # JSON Lines
+import os  # 파일 크기(진행률 분모)
+import sys  # '-' = 표준 입출력
+from datetime import date  # 날짜 캐시 타입
+from itertools import islice  # 청크 자르기
+from operator import itemgetter  # CSV 컬럼 재배치
+import time  # 가져오기 이벤트 시각
+from typing import Callable, Iterable, Iterator  # 타입 힌트
+import sqlite3 as sql  # 연결 타입 힌트
+from todo_core import STATUS_TEXT, log_status_events, next_todo_id, to_date  # 코어 유틸
+
+# ─────────────────────────────────────────────────────────
+# 상수/형식                                                   # 컬럼/청크 크기
+# ─────────────────────────────────────────────────────────
+COLUMNS = ("id", "title", "start", "end", "desc", "status")  # 백업 파일 컬럼(순서 = CSV 헤더)
+CHUNK_ROWS = 10000  # 한 번에 검증/INSERT하는 행 수(메모리는 이 크기로 고정)
+Progress = Callable[[int, int], None]  # progress(done, total) — total을 모르면 0
+
+def guess_format(path: str, fmt: str | None = None) -> str:  # 형식 판정 함수 시그니처
+    """명시한 형식 또는 확장자(.csv → csv, 그 밖 → jsonl)로 형식을 정한다."""  # 판정 규칙
+    fmt = (fmt or ("csv" if str(path).lower().endswith(".csv") else "jsonl")).lower()  # 기본 jsonl
+    if fmt not in ("csv", "jsonl"):  # 지원하지 않는 형식
+        raise ValueError(f"지원하지 않는 형식: {fmt!r} (csv/jsonl)")  # 호출부에서 안내
+    return fmt  # 형식
+
+def chunked(it: Iterable, n: int) -> Iterator[list]:  # 청크 제너레이터
+    """이터러블을 최대 n개짜리 리스트로 잘라 내보낸다."""  # 동작 설명
+    it = iter(it)  # 한 번만 순회
+    while chunk := list(islice(it, n)):  # 빈 리스트면 끝
+        yield chunk  # 청크
+
+# ─────────────────────────────────────────────────────────
+# 내보내기: 커서 → 행 튜플 → 직렬화 → 파일                     # 스트리밍 출력
+# ─────────────────────────────────────────────────────────
+def iter_rows(con: sql.Connection, progress: Progress | None = None) -> Iterator[tuple]:  # 행 스트림
+    """todos 행을 id 순으로 (id, title, start, end, desc, status) 튜플로 흘려보낸다."""  # 스트리밍 설명
+    total = con.execute("SELECT COUNT(*) FROM todos").fetchone()[0] if progress else 0  # 진행률 분모(PK 인덱스)
+    cur = con.execute("SELECT id, title, start, end, memo, status FROM todos ORDER BY id")  # 커서
+    done = 0  # 누적 행 수
+    while rows := cur.fetchmany(CHUNK_ROWS):  # C 수준 배치 fetch
+        yield from rows  # 튜플 그대로(모델 변환 없음)
+        done += len(rows)  # 누적
+        if progress:  # 진행률 알림
+            progress(done, total)  # 청크마다 1회
+
+def write_jsonl(rows: Iterable[tuple], fp) -> int:  # JSONL 직렬화
+    """행 튜플을 1행 1객체 JSON Lines로 쓰고 행 수를 반환."""  # 출력 형식
+    dumps, n = json.JSONEncoder(ensure_ascii=False).encode, 0  # 인코더 재사용
+    for chunk in chunked(rows, CHUNK_ROWS):  # 청크 단위로 모아 write 1회
+        fp.write("".join(dumps(dict(zip(COLUMNS, r))) + "\n" for r in chunk))  # 시스템 콜 횟수 절감
+        n += len(chunk)  # 누적
+    return n  # 행 수
+
+def write_csv(rows: Iterable[tuple], fp) -> int:  # CSV 직렬화
+    """헤더 + 행 튜플을 CSV로 쓰고 행 수를 반환."""  # 출력 형식
+    w, n = csv.writer(fp), 0  # C 구현 writer
+    w.writerow(COLUMNS)  # 헤더
+    for chunk in chunked(rows, CHUNK_ROWS):  # 청크 단위
+        w.writerows(chunk)  # 튜플 그대로 기록
+        n += len(chunk)  # 누적
+    return n  # 행 수
+
+def export_todos(con: sql.Connection, path: str, fmt: str | None = None,
+                 progress: Progress | None = None) -> int:  # 내보내기 진입점
+    """todos 전체를 path('-'면 stdout)에 JSONL/CSV로 내보내고 행 수를 반환."""  # 동작 설명
+    fmt = guess_format(path, fmt)  # 형식
+    write = write_csv if fmt == "csv" else write_jsonl  # 직렬화기
+    rows = iter_rows(con, progress)  # 커서 스트림
+    if path == "-":  # 표준 출력
+        return write(rows, sys.stdout)  # 파이프로 바로
+    with open(path, "w", encoding="utf-8", newline="") as fp:  # CSV 모듈 권장 newline=""
+        return write(rows, fp)  # 파일로
+    # New 메모리 사용량은 행 수와 무관하게 청크 1개 분량으로 고정된다.
+
+# ─────────────────────────────────────────────────────────
+# 가져오기: 파일 → 레코드 → 검증 청크 → executemany             # 스트리밍 입력
+# ─────────────────────────────────────────────────────────
+def read_jsonl(fp) -> Iterator[tuple]:  # JSONL 파서
+    """(줄 번호, id, title, start, end, desc, status) 레코드를 흘려보낸다(빈 줄은 건너뜀)."""  # 출력 형식
+    loads = json.loads  # 단축 참조
+    for no, line in enumerate(fp, 1):  # 줄 번호는 1부터
+        if not line.strip():  # 빈 줄
+            continue  # 건너뜀
+        try:
+            r = loads(line)  # 레코드
+        except json.JSONDecodeError as exc:
+            raise ValueError(f"{no}행: JSON 오류 ({exc.msg})") from None  # 줄 번호를 붙여 전달
+        if not isinstance(r, dict):  # 객체가 아님
+            raise ValueError(f"{no}행: JSON 객체가 아닙니다")  # 형식 오류
+        yield no, *(r.get(c) for c in COLUMNS)  # 컬럼 순서 튜플
+
+def read_csv(fp) -> Iterator[tuple]:  # CSV 파서
+    """헤더 행으로 컬럼 위치를 찾아 (줄 번호, id, title, start, end, desc, status) 레코드를 흘려보낸다."""  # 출력 형식
+    reader = csv.reader(fp)  # C 구현 reader(DictReader보다 행당 dict 생성 비용이 없음)
+    header = [h.strip().lower() for h in next(reader, [])]  # 헤더
+    if "title" not in header:  # 필수 컬럼 없음
+        raise ValueError("1행: CSV 헤더에 title 컬럼이 없습니다")  # 형식 오류
+    pos = [header.index(c) if c in header else None for c in COLUMNS]  # 컬럼 → 위치(없으면 None)
+    width = len(header)  # 정상 행의 칸 수
+    pick = itemgetter(*pos) if None not in pos else None  # 모든 컬럼이 있으면 C 수준 추출(내보내기 파일의 경우)
+    for row in reader:  # 레코드별
+        if not row:  # 빈 줄
+            continue  # 건너뜀
+        if pick is not None and len(row) >= width:  # 빠른 경로
+            yield reader.line_num, *pick(row)  # 컬럼 순서 튜플
+        else:  # 컬럼 누락/짧은 행
+            yield reader.line_num, *(row[p] if p is not None and p < len(row) else None for p in pos)  # 없는 칸은 None
+
+def validate(records: Iterable[tuple], keep_ids: bool) -> Iterator[tuple]:  # 검증 단계
+    """레코드를 INSERT 파라미터 튜플로 바꾼다(날짜는 ISO로 정규화, 오류면 줄 번호와 함께 ValueError)."""  # 검증 규칙
+    iso: dict[str, date | None] = {}  # 날짜 문자열 → date(종류가 적어 행마다 파싱/포맷하지 않음)
+    seen: set[int] = set()  # 복원 모드에서 이미 나온 id(PK 중복은 INSERT 전에 줄 번호로 알림)
+    for no, rid, title, start, end, desc, status in records:  # 레코드별
+        title, start, end = (title or "").strip(), (start or "").strip(), (end or "").strip()  # 공백 정리
+        d1 = iso[start] if start in iso else iso.setdefault(start, to_date(start))  # New parse_date 규칙(관대한 형식 포함)
+        d2 = iso[end] if end in iso else iso.setdefault(end, to_date(end))  # 〃
+        if not title or d1 is None or d2 is None or d2 < d1:  # 필수/형식/순서 검사
+            why = "제목이 비어 있습니다" if not title else (
+                "종료일이 시작일보다 빠릅니다" if d1 and d2 else f"날짜 형식 오류: {start!r} ~ {end!r}")  # 사유
+            raise ValueError(f"{no}행: {why}")  # 호출부에서 롤백
+        try:
+            status = int(status or 0)  # 상태 코드
+            rid = int(rid) if keep_ids and rid not in (None, "") else None  # 원래 id(복원 모드)
+        except (TypeError, ValueError):
+            raise ValueError(f"{no}행: id/상태 값 오류") from None  # 숫자가 아님
+        if status not in STATUS_TEXT:  # 범위 밖
+            raise ValueError(f"{no}행: 상태 값 오류 ({status})")  # 0~2만 허용
+        if rid is not None:  # 원래 id를 쓰는 행
+            if rid in seen:  # 같은 파일 안에서 중복
+                raise ValueError(f"{no}행: 중복 id ({rid})")  # IntegrityError 대신 줄 번호로 안내
+            seen.add(rid)  # 기록
+        yield rid, title, str(d1), str(d2), desc or "", status  # INSERT 파라미터(str(date) = ISO)
+
+def _drop_indexes(con: sql.Connection) -> list[str]:  # 보조 인덱스 제거
+    """todos의 보조 인덱스를 지우고, 다시 만들 CREATE 문 목록을 반환(같은 트랜잭션 → 실패 시 함께 복구)."""  # 대량 적재 기법
+    ddl = con.execute(
+        "SELECT name, sql FROM sqlite_master WHERE type = 'index' AND tbl_name = 'todos' AND sql IS NOT NULL"
+    ).fetchall()  # 자동 인덱스(sql NULL)는 제외
+    for name, _ in ddl:  # 인덱스별
+        con.execute(f'DROP INDEX "{name}"')  # 제거
+    return [q for _, q in ddl]  # 재생성 문
+
+def import_todos(con: sql.Connection, path: str, fmt: str | None = None, replace: bool = False,
+                 progress: Progress | None = None) -> int:  # 가져오기 진입점
+    """path('-'면 stdin)의 JSONL/CSV를 검증하며 청크 단위로 INSERT하고 행 수를 반환.
+
+    replace=True면 기존 항목을 모두 지우고 파일의 id를 그대로 복원, 아니면 새 id로 뒤에 추가.
+    가져온 행마다 추가 이벤트를 청크 단위로 같은 트랜잭션에 기록한다(상태 로그는 추가 전용이라 복원 모드에서도 지우지 않음).
+    커밋은 호출부(Database.commit/DBWorker) 몫이므로, 오류가 나면 호출부 트랜잭션째 되돌아간다.
+    """  # 트랜잭션 규칙
+    fmt = guess_format(path, fmt)  # 형식
+    if path == "-":  # 표준 입력
+        raw, fp, total = None, sys.stdin, 0  # 크기 모름
+    else:  # 파일
+        total = os.path.getsize(path)  # 진행률 분모(바이트)
+        raw = open(path, "rb")  # 바이트 위치 = 진행률
+        fp = io.TextIOWrapper(raw, encoding="utf-8-sig", newline="")  # BOM 있는 엑셀 CSV도 허용
+    try:
+        records = read_csv(fp) if fmt == "csv" else read_jsonl(fp)  # 파서 단계
+        rows = validate(records, keep_ids=replace)  # 검증 단계
+        rebuild: list[str] = []  # 끝나고 다시 만들 인덱스
+        if replace:  # 복원 모드
+            con.execute("DELETE FROM todos")  # 같은 트랜잭션 안 → 실패하면 함께 되돌아감
+            rebuild = _drop_indexes(con)  # New 빈 테이블에 대량 INSERT → 인덱스는 끝에 한 번에 정렬 생성
+        next_id, n = next_todo_id(con), 0  # 추가 모드 id 시작값/누적
+        insert = "INSERT INTO todos(id, title, start, end, memo, status) VALUES(?,?,?,?,?,?)"  # 행 삽입 SQL
+        wall = time.time()  # 이번 가져오기의 이벤트 시각
+        for chunk in chunked(rows, CHUNK_ROWS):  # 청크 단위
+            loose: list[tuple] = []  # 복원 모드에서 id가 없는 행(DB 발급 id를 받아야 이벤트를 남길 수 있음)
+            if not replace:  # 추가 모드: 연속 id 선할당(insert_many와 같은 규칙)
+                chunk = [(next_id + k, *r[1:]) for k, r in enumerate(chunk)]  # id 채움
+                next_id += len(chunk)  # 다음 시작값
+            elif any(r[0] is None for r in chunk):  # id 빠진 행이 섞임(직접 만든 파일)
+                loose = [r for r in chunk if r[0] is None]  # 건별 삽입 대상
+                chunk = [r for r in chunk if r[0] is not None]  # 배치 삽입 대상
+            con.executemany(insert, chunk)  # 배치 삽입
+            events = [(r[0], None, r[5], wall) for r in chunk]  # 추가 이벤트(created_events와 같은 모양)
+            for r in loose:  # id 없는 행
+                events.append((con.execute(insert, r).lastrowid, None, r[5], wall))  # 발급 id로 이벤트
+            log_status_events(con, events)  # 같은 트랜잭션에서 로그 + 롤업(청크당 일자 1행 upsert)
+            n += len(events)  # 누적
+            if progress:  # 진행률 알림
+                progress(raw.tell() if raw else n, total)  # 읽은 바이트(파일) 또는 행 수(stdin)
+        for q in rebuild:  # 보조 인덱스 재생성
+            con.execute(q)  # 행마다 B-트리를 갱신하는 것보다 빠름
+        return n  # 행 수
+    finally:
+        if raw is not None:  # 파일이면
+            fp.close()  # 래퍼와 함께 닫기
+    # New 파일 크기와 무관하게 메모리는 청크 1개 분량 — 검증 실패 시 앞선 청크도 트랜잭션째 취소된다.
@@ -0,0 +1,119 @@
+# ─────────────────────────────────────────────────────────
+# 갓생살기 성능 계측: after() 루프/DB 작업 시간·지연 기록       # 옵트인 프로파일러
+# ─────────────────────────────────────────────────────────
+# TODO_PROFILE=1 이면 after()로 예약되는 모든 콜백과 DB 워커 작업의 소요 시간/호출 수/이벤트 루프 지연을 링 버퍼에 기록한다.  # New 상위 요약
+# TODO_PROFILE_DUMP=경로 를 주면 종료 시 cProfile(.prof)과 링 버퍼 trace(.trace.json, chrome://tracing 형식)를 저장한다.  # New 덤프
+# 환경변수가 없으면 아무것도 감싸지 않으므로 평소 실행에는 비용이 0이다.  # New 옵트인 원칙
+
+import cProfile  # 함수 단위 프로파일(메인 스레드)
+import json  # trace 파일
+import os  # 환경변수
+import threading  # 워커 스레드 기록 보호
+import time  # perf_counter
+from collections import deque  # 고정 크기 링 버퍼
+
+# ─────────────────────────────────────────────────────────
+# 상수                                                        # 환경변수/버퍼 크기
+# ─────────────────────────────────────────────────────────
+PROFILE_ENV = "TODO_PROFILE"            # "1"이면 계측 + F12 오버레이
+PROFILE_DUMP_ENV = "TODO_PROFILE_DUMP"  # 종료 시 덤프 경로(설정하면 계측도 자동으로 켬)
+RING_SIZE = 4096                        # 최근 기록 수(오래된 것부터 밀려남 → 메모리 고정)
+
+def callback_name(fn) -> str:  # 콜백 이름
+    """after 콜백의 읽기 쉬운 이름(TodoApp._animate_ring_to.<locals>.step → _animate_ring_to.step)."""  # 이름 규칙
+    name = getattr(fn, "__qualname__", None) or getattr(fn, "__name__", None) or repr(fn)  # 한정 이름 우선
+    return name.replace(".<locals>", "").removeprefix("TodoApp.")  # 군더더기 제거
+
+class Profiler:  # 계측기
+    """(이름, 시작, 소요, 지연) 기록을 링 버퍼에 쌓고 이름별 누계를 유지(어느 스레드에서 record해도 안전)."""  # 역할 설명
+
+    def __init__(self, size: int = RING_SIZE, dump_path: str | None = None) -> None:  # 생성자 시그니처
+        """링 버퍼와 누계를 준비하고, dump_path가 있으면 cProfile을 시작."""  # 초기화 설명
+        self.ring: deque = deque(maxlen=size)  # (name, start, dur, lag, thread) — 초 단위
+        self.totals: dict[str, list] = {}      # name → [count, total, max, lag_total, lag_max]
+        self._lock = threading.Lock()          # 누계 보호(워커 스레드도 기록)
+        self.t0 = time.perf_counter()          # 기준 시각(trace 타임스탬프 원점)
+        self.dump_path = dump_path             # 종료 시 덤프 경로
+        self._cprof = cProfile.Profile() if dump_path else None  # 함수 단위 프로파일러
+        if self._cprof is not None:  # 덤프 요청 시
+            self._cprof.enable()  # 메인 스레드 프로파일 시작
+
+    @classmethod
+    def from_env(cls) -> "Profiler | None":  # 환경변수로 생성
+        """TODO_PROFILE/TODO_PROFILE_DUMP가 설정돼 있을 때만 계측기를 만든다(아니면 None)."""  # 옵트인 규칙
+        dump = os.environ.get(PROFILE_DUMP_ENV) or None  # 덤프 경로
+        if not dump and os.environ.get(PROFILE_ENV, "") in ("", "0"):  # 둘 다 꺼짐
+            return None  # 계측 없음
+        return cls(dump_path=dump)  # 계측기
+
+    # ── 기록 ──
+    def record(self, name: str, start: float, dur: float, lag: float = 0.0) -> None:  # 기록 1건
+        """소요(dur)와 지연(lag: 예정 시각 대비 늦게 시작한 시간)을 기록."""  # 의미 설명
+        self.ring.append((name, start, dur, lag, threading.get_ident()))  # deque.append는 원자적
+        with self._lock:  # 누계 갱신
+            t = self.totals.get(name)  # 기존 누계
+            if t is None:  # 첫 기록
+                self.totals[name] = [1, dur, dur, lag, lag]  # 초기화
+            else:  # 누적
+                t[0] += 1  # 횟수
+                t[1] += dur  # 소요 합계
+                t[2] = max(t[2], dur)  # 최대 소요
+                t[3] += lag  # 지연 합계
+                t[4] = max(t[4], lag)  # 최대 지연
+
+    def timed(self, name: str, fn, *args, lag: float = 0.0):  # 감싸서 실행
+        """fn(*args)를 실행하며 소요 시간을 기록하고 반환값을 그대로 돌려준다."""  # 래퍼 설명
+        t = time.perf_counter()  # 시작
+        try:
+            return fn(*args)  # 실행
+        finally:
+            self.record(name, t, time.perf_counter() - t, lag)  # 예외여도 기록
+
+    def wrap_after(self, widget) -> None:  # after 계측 설치
+        """widget.after를 감싸 모든 예약 콜백의 소요 시간과 이벤트 루프 지연을 기록(after_idle 포함)."""  # 설치 설명
+        orig = widget.after  # 원래 바운드 메서드
+        def after(ms, func=None, *args):  # 대체 after
+            if func is None:  # after(ms) = 대기(콜백 없음)
+                return orig(ms)  # 그대로
+            name = callback_name(func)  # 기록 이름
+            due = time.perf_counter() + (ms / 1000 if isinstance(ms, (int, float)) else 0.0)  # 예정 시각('idle'은 즉시)
+            def run(*a):  # 실제 호출되는 콜백
+                t = time.perf_counter()  # 시작
+                return self.timed(name, func, *a, lag=max(0.0, t - due))  # 지연 = 실제 시작 - 예정
+            return orig(ms, run, *args)  # 원래 after로 예약(반환 id로 after_cancel 가능)
+        widget.after = after  # 인스턴스 속성으로 덮어씀(Misc.after_idle도 self.after를 거침)
+
+    # ── 조회 ──
+    def summary(self) -> list[tuple]:  # 이름별 요약
+        """(이름, 횟수, 평균ms, 최대ms, 평균 지연ms, 최대 지연ms, 평균 간격ms) 목록(총 소요 시간 내림차순)."""  # 열 설명
+        with self._lock:  # 누계 스냅샷
+            items = [(k, *v) for k, v in self.totals.items()]  # 복사
+        last: dict[str, float] = {}  # 이름별 직전 시작 시각
+        gaps: dict[str, list] = {}   # 이름별 [간격 합, 개수]
+        for name, start, _, _, _ in list(self.ring):  # 최근 기록으로 프레임/틱 간격 계산
+            if name in last:  # 두 번째 이후
+                g = gaps.setdefault(name, [0.0, 0])  # 누적기
+                g[0] += start - last[name]  # 간격 합
+                g[1] += 1  # 간격 개수
+            last[name] = start  # 갱신
+        rows = []  # 결과
+        for name, n, total, mx, lag_total, lag_max in sorted(items, key=lambda r: -r[2]):  # 총 소요 순
+            g = gaps.get(name)  # 간격
+            rows.append((name, n, total / n * 1000, mx * 1000, lag_total / n * 1000, lag_max * 1000,
+                         g[0] / g[1] * 1000 if g else 0.0))  # ms 단위
+        return rows  # 요약
+
+    # ── 덤프 ──
+    def dump(self) -> None:  # 종료 시 저장
+        """cProfile 통계(dump_path)와 링 버퍼 trace(dump_path + '.trace.json')를 저장."""  # 출력 파일
+        if not self.dump_path:  # 덤프 요청 없음
+            return  # 종료
+        if self._cprof is not None:  # cProfile
+            self._cprof.disable()  # 중지
+            self._cprof.dump_stats(self.dump_path)  # python -m pstats 로 열람
+        events = [{"name": name, "ph": "X", "pid": 1, "tid": tid,
+                   "ts": (start - self.t0) * 1e6, "dur": dur * 1e6, "args": {"lag_ms": lag * 1000}}
+                  for name, start, dur, lag, tid in list(self.ring)]  # Trace Event Format(µs)
+        with open(self.dump_path + ".trace.json", "w", encoding="utf-8") as fp:  # trace 파일
+            json.dump({"traceEvents": events}, fp)  # chrome://tracing / Perfetto에서 열람
+    # New 계측은 기록만 하고 화면 갱신은 오버레이가 0.5초마다 읽어 가므로 측정 대상의 타이밍을 거의 흔들지 않는다.
@@ -0,0 +1,222 @@
+# ─────────────────────────────────────────────────────────
+# 갓생살기 리포트 내보내기: 텍스트/HTML(인라인 SVG)/CSV 요약      # 보고서 생성기
+# ─────────────────────────────────────────────────────────
+# 리포트 탭과 같은 지표(sql_report_stats/ReportStats 스냅샷)와 일별 롤업 추이, 발표 연습 이력을 한 파일로 쓴다.  # New 상위 요약
+# 미완료 항목 목록은 커서에서 청크 단위로 흘려 쓰므로 큰 DB에서도 메모리는 청크 1개 분량으로 고정된다.  # New 스트리밍
+# 모든 함수는 fn(con, ...) 모양이라 CLI(동기 Database.run)와 GUI(DBWorker.submit)에서 그대로 쓴다.  # New 호출 규약
+
+import csv  # CSV 요약
+import sys  # '-' = 표준 출력
+from datetime import date  # 기준일
+from html import escape  # HTML 이스케이프
+from math import pi  # 도넛 둘레
+import sqlite3 as sql  # 연결 타입 힌트
+from todo_core import STATUS_TEXT, row_to_todo, rollup_trend, sql_report_stats  # 코어 집계/모델
+from todo_io import CHUNK_ROWS, Progress  # 청크 크기/진행률 콜백 규약
+from todo_timer import timer_history_stats  # 발표 연습 이력 요약
+
+# ─────────────────────────────────────────────────────────
+# 상수/팔레트(리포트 탭 캔버스와 공유)                         # 색/라벨
+# ─────────────────────────────────────────────────────────
+HEAT_LEVELS = 64            # 히트맵 농도 단계 수(팔레트 LUT 크기 — 눈으로 구분 가능한 단계보다 충분히 많게)
+STACK_COLORS = ("#90a4ae", "#fb8c00", "#43a047")  # 스택바 미완/진행/완료 색
+WEEK_DAYS = ("월", "화", "수", "목", "금", "토", "일")  # 히트맵 요일 라벨
+TREND_DAYS = (30, 90, 365)  # 완료 추이 기간 선택지(일)
+SVG_W = 600                 # HTML 막대/히트맵 SVG 폭(px)
+
+def blend(a: str, b: str, t: float) -> str:  # 색 보간 유틸
+    """hex 색상 a→b 사이를 t(0~1)로 보간하여 hex로 반환."""  # 보간 규칙 설명
+    ah, ag, ab = int(a[1:3], 16), int(a[3:5], 16), int(a[5:7], 16)  # 색상 a 분해
+    bh, bg, bb = int(b[1:3], 16), int(b[3:5], 16), int(b[5:7], 16)  # 색상 b 분해
+    ih, ig, ib = int(ah + (bh - ah) * t), int(ag + (bg - ag) * t), int(ab + (bb - ab) * t)  # 보간
+    return f"#{ih:02x}{ig:02x}{ib:02x}"  # 보간 결과 hex
+
+HEAT_LUT = tuple(blend("#e8f5e9", "#1b5e20", i / (HEAT_LEVELS - 1)) for i in range(HEAT_LEVELS))  # 연녹→진녹 팔레트(모듈 로드 시 1회 계산)
+
+def rate_color(rate: float) -> str:  # 색상 결정 함수
+    """완료율(%)에 따른 시그널 색을 반환: <50 빨강, <80 주황, 그 외 초록."""  # 색상 구간 규칙
+    return "#e53935" if rate < 50 else "#fb8c00" if rate < 80 else "#43a047"  # 삼항으로 간결 처리
+
+def heat_color(v: int, mx: int) -> str:  # 히트맵 칸 색
+    """0~mx 값을 LUT 농도로 변환(mx가 0이면 가장 옅은 색)."""  # 매핑 규칙
+    return HEAT_LUT[round(v * (HEAT_LEVELS - 1) / (mx or 1))]  # LUT 조회
+
+def guess_report_format(path: str, fmt: str | None = None) -> str:  # 형식 판정 함수 시그니처
+    """명시한 형식 또는 확장자(.html/.htm → html, .csv → csv, 그 밖 → txt)로 형식을 정한다."""  # 판정 규칙
+    low = str(path).lower()  # 확장자 비교용
+    fmt = (fmt or ("html" if low.endswith((".html", ".htm")) else "csv" if low.endswith(".csv") else "txt")).lower()  # 기본 txt
+    if fmt not in ("txt", "html", "csv"):  # 지원하지 않는 형식
+        raise ValueError(f"지원하지 않는 형식: {fmt!r} (txt/html/csv)")  # 호출부에서 안내
+    return fmt  # 형식
+
+# ─────────────────────────────────────────────────────────
+# 데이터 수집: 요약(상수 크기) + 미완료 항목 스트림             # 입력 단계
+# ─────────────────────────────────────────────────────────
+def collect(con: sql.Connection, stats: dict | None = None, today: date | None = None) -> dict:  # 요약 수집
+    """리포트 지표(stats가 없으면 SQL 집계), 기간별 완료 추이, 발표 연습 요약을 모은다."""  # 수집 항목
+    today = today or date.today()  # 기준일
+    return {
+        "today": today,  # 기준일
+        "stats": stats or sql_report_stats(con, today),  # GUI는 calc_report_stats() 결과를 넘김(재계산 없음)
+        "trends": [rollup_trend(con, d, today) for d in TREND_DAYS],  # 롤업 PK 범위만 읽음
+        "timers": timer_history_stats(con, today),  # 최근 7일 발표 연습
+    }  # 요약(항목 수와 무관한 크기)
+
+def iter_open(con: sql.Connection, progress: Progress | None = None):  # 미완료 항목 스트림
+    """미완료/진행중 항목을 마감일 순 Todo로 흘려보낸다(청크마다 progress 호출)."""  # 스트리밍 설명
+    total = con.execute("SELECT COUNT(*) FROM todos WHERE status IN (0, 1)").fetchone()[0] if progress else 0  # 분모(인덱스)
+    cur = con.execute(
+        "SELECT id, title, start, end, memo, status FROM todos WHERE status IN (0, 1) ORDER BY end, id"
+    )  # (status, end) 인덱스 범위
+    done = 0  # 누적 행 수
+    while rows := cur.fetchmany(CHUNK_ROWS):  # C 수준 배치 fetch
+        yield [row_to_todo(r) for r in rows]  # 청크 단위(쓰기도 청크마다 1회)
+        done += len(rows)  # 누적
+        if progress:  # 진행률 알림
+            progress(done, total)  # 청크마다 1회
+
+# ─────────────────────────────────────────────────────────
+# 인라인 SVG(리포트 탭 캔버스와 같은 모양/색)                   # HTML 시각화
+# ─────────────────────────────────────────────────────────
+def svg_donut(rate: float) -> str:  # 도넛
+    """완료율 도넛(12시에서 시계방향) SVG."""  # 모양 설명
+    r, th = 70, 14  # 반지름/두께
+    arc = 2 * pi * r * rate / 100  # 칠할 둘레 길이
+    return (f'<svg width="160" height="160" viewBox="0 0 160 160">'
+            f'<circle cx="80" cy="80" r="{r}" fill="none" stroke="#e6e6e6" stroke-width="{th}"/>'
+            f'<circle cx="80" cy="80" r="{r}" fill="none" stroke="{rate_color(rate)}" stroke-width="{th}"'
+            f' stroke-dasharray="{arc:.2f} {2 * pi * r:.2f}" transform="rotate(-90 80 80)"/>'
+            f'<text x="80" y="86" text-anchor="middle" font-size="18" font-weight="bold">{rate:.1f}%</text></svg>')  # 바탕 링 + 진행 아크
+
+def svg_stack(counts: tuple[int, int, int], w: int = SVG_W) -> str:  # 스택바
+    """상태 구성(미완/진행/완료) 가로 스택바 SVG."""  # 모양 설명
+    total, x, parts = max(1, sum(counts)), 0.0, []  # 0분모 방지/누적 X/조각
+    for n, col in zip(counts, STACK_COLORS):  # 구간별
+        seg = w * n / total  # 구간 길이
+        parts.append(f'<rect x="{x:.1f}" y="0" width="{seg:.1f}" height="22" fill="{col}"/>')  # 구간 박스
+        x += seg  # 다음 시작점
+    return (f'<svg width="{w}" height="22">{"".join(parts)}'
+            f'<rect x="0" y="0" width="{w}" height="22" fill="none" stroke="#d0d0d0"/></svg>')  # 외곽선
+
+def svg_heat(bins: list[int], w: int = SVG_W) -> str:  # 주간 히트맵
+    """이번 주(월~일) 마감 건수 히트맵 SVG(캔버스와 같은 LUT)."""  # 모양 설명
+    cell, pad, mx, parts = w // 7, 4, max(bins), []  # 칸 폭/패딩/최대값/조각
+    for i, (v, d) in enumerate(zip(bins, WEEK_DAYS)):  # 7일
+        x0, x1 = i * cell + pad, (i + 1) * cell - pad  # X 영역
+        parts.append(f'<rect x="{x0}" y="{pad}" width="{x1 - x0}" height="34" fill="{heat_color(v, mx)}"'
+                     f' stroke="#cfd8dc"><title>{d} {v}건</title></rect>'
+                     f'<text x="{(x0 + x1) // 2}" y="52" text-anchor="middle" font-size="11">{d}</text>')  # 칸 + 요일
+    return f'<svg width="{w}" height="56">{"".join(parts)}</svg>'  # 완성
+
+def svg_trend(tr: dict, w: int = SVG_W) -> str:  # 완료 추이
+    """구간별 완료(초록)/되돌림(빨강) 막대 SVG."""  # 모양 설명
+    bins = tr["bins"]  # [(completed, reopened, created)]
+    slot, base, top = w / len(bins), 62, 4  # 구간 폭/기준선/상단 여백
+    mx = max(max(b[0], b[1]) for b in bins) or 1  # 0 나누기 방지
+    parts = []  # 조각
+    for i, (done, back, _) in enumerate(bins):  # 구간별
+        x = i * slot + 1  # 막대 X
+        for n, col in ((done, "#43a047"), (back, "#e53935")):  # 완료 위에 되돌림을 겹침
+            hgt = (base - top) * n / mx  # 막대 높이
+            if hgt:  # 0이면 생략
+                parts.append(f'<rect x="{x:.1f}" y="{base - hgt:.1f}" width="{slot - 2:.1f}" height="{hgt:.1f}" fill="{col}"/>')  # 막대
+    return (f'<svg width="{w}" height="64">{"".join(parts)}'
+            f'<line x1="0" y1="{base}" x2="{w}" y2="{base}" stroke="#d0d0d0"/></svg>')  # 기준선
+
+# ─────────────────────────────────────────────────────────
+# 직렬화: 텍스트 / HTML / CSV                                 # 출력 단계
+# ─────────────────────────────────────────────────────────
+def summary_lines(data: dict) -> list[str]:  # 요약 문장
+    """리포트 탭/CLI report와 같은 문구의 요약 줄 목록(텍스트/HTML 공용)."""  # 재사용 설명
+    s, tm = data["stats"], data["timers"]  # 지표/발표 연습
+    c0, c1, c2 = s["counts"]  # 상태 튜플 언팩
+    lines = [
+        f"완료율 {s['rate']:.1f}%",  # 완료율
+        f"평균 기간: {s['avg_days']}일",  # 평균 기간
+        f"마감 임박: {s['soon']}건",  # 임박
+        f"지남: {s['overdue']}건",  # 지남
+        f"상태 구성: 미완 {c0} · 진행 {c1} · 완료 {c2}",  # 상태 구성
+        "이번 주 마감: " + " ".join(f"{d}{n}" for d, n in zip(WEEK_DAYS, s["week_bins"])),  # 주간 분포
+    ]  # 현재 스냅샷
+    for tr in data["trends"]:  # 기간별 추이
+        lines.append(f"최근 {tr['days']}일: 완료 {tr['completed']} · 되돌림 {tr['reopened']} · 추가 {tr['created']}"
+                     f" (하루 평균 {tr['per_day']}건 완료)")  # 기간 합계
+    lines.append(f"발표 연습({tm['days']}일): {tm['sessions']}회 · {tm['minutes']:g}분 / 누적 {tm['all_sessions']}회")  # 타이머 이력
+    return lines  # 요약 줄
+
+def write_text(data: dict, chunks, fp) -> int:  # 텍스트 리포트
+    """요약 + 미완료 항목(마감순, 리스트 탭과 같은 표시)을 평문으로 쓰고 항목 수를 반환."""  # 출력 형식
+    fp.write(f"갓생살기 리포트 ({data['today'].isoformat()} 기준)\n\n")  # 제목
+    fp.write("".join(f"{line}\n" for line in summary_lines(data)))  # 요약
+    fp.write("\n미완료 항목(마감순)\n")  # 목록 제목
+    n, today = 0, data["today"]  # 누적/기준일
+    for chunk in chunks:  # 청크 단위로 모아 write 1회
+        fp.write("".join(f"  {t.display(today)}\n" for t in chunk))  # 표시 문자열(캐시 경로)
+        n += len(chunk)  # 누적
+    return n  # 항목 수
+
+_HTML_HEAD = """<!DOCTYPE html>
+<html lang="ko"><head><meta charset="utf-8"><title>갓생살기 리포트 {day}</title>
+<style>body{{font-family:sans-serif;margin:24px;color:#222}}h2{{margin-top:28px}}
+table{{border-collapse:collapse}}td,th{{padding:2px 10px;border-bottom:1px solid #eee;text-align:left}}
+.muted{{color:#666}}</style></head><body>
+"""  # 문서 머리(스타일 인라인 → 파일 하나로 열람)
+
+def write_html(data: dict, chunks, fp) -> int:  # HTML 리포트
+    """요약 + 인라인 SVG(도넛/스택바/히트맵/추이) + 미완료 항목 표를 쓰고 항목 수를 반환."""  # 출력 형식
+    s, today, lines = data["stats"], data["today"], summary_lines(data)  # 지표/기준일/요약 문구
+    fp.write(_HTML_HEAD.format(day=today.isoformat()))  # 머리
+    fp.write(f"<h1>📊 갓생살기 리포트 <span class='muted'>{today.isoformat()} 기준</span></h1>\n")  # 제목
+    fp.write(f"<div style='display:flex;gap:24px;align-items:center'>{svg_donut(s['rate'])}<div>")  # 도넛 + KPI
+    fp.write("".join(f"<div>{escape(line)}</div>" for line in lines[:5]))  # 현재 스냅샷 문구
+    fp.write(f"</div></div>\n{svg_stack(s['counts'])}\n<h2>이번 주 마감</h2>\n{svg_heat(s['week_bins'])}\n")  # 스택바/히트맵
+    for tr, line in zip(data["trends"], lines[6:]):  # 기간별 추이
+        fp.write(f"<h2>최근 {tr['days']}일 완료 추이</h2><p class='muted'>{escape(line)}</p>\n{svg_trend(tr)}\n")  # 추이 막대
+    fp.write(f"<p>{escape(lines[-1])}</p>\n")  # 발표 연습
+    fp.write("<h2>미완료 항목(마감순)</h2>\n<table><tr><th>id</th><th>제목</th><th>기간</th><th>상태</th><th>표시</th></tr>\n")  # 표 머리
+    n = 0  # 누적
+    for chunk in chunks:  # 청크 단위로 모아 write 1회
+        fp.write("".join(
+            f"<tr><td>{t.id}</td><td>{escape(t.title)}</td><td>{t.start} ~ {t.end}</td>"
+            f"<td>{STATUS_TEXT[t.status]}</td><td>{escape(t.display(today))}</td></tr>\n" for t in chunk))  # 행
+        n += len(chunk)  # 누적
+    fp.write("</table>\n</body></html>\n")  # 꼬리
+    return n  # 항목 수
+
+def write_csv(data: dict, fp) -> int:  # CSV 요약
+    """(section, key, metric, value) 세로형 요약을 쓰고 행 수를 반환(스프레드시트 피벗용)."""  # 출력 형식
+    s, tm = data["stats"], data["timers"]  # 지표/발표 연습
+    rows = [("summary", "", k, s[k]) for k in ("rate", "avg_days", "soon", "overdue")]  # 스냅샷 지표
+    rows += [("status", STATUS_TEXT[i], "count", n) for i, n in enumerate(s["counts"])]  # 상태 구성
+    rows += [("week", d, "due", n) for d, n in zip(WEEK_DAYS, s["week_bins"])]  # 이번 주 마감
+    for tr in data["trends"]:  # 기간별 추이
+        sec = f"trend_{tr['days']}d"  # 섹션 이름
+        since, width = date.fromisoformat(tr["since"]).toordinal(), tr["width"]  # 조회 시작일/구간 폭
+        origin = data["today"].toordinal() - len(tr["bins"]) * width + 1  # 구간 격자 시작(마지막 구간이 오늘에서 끝남)
+        for i, b in enumerate(tr["bins"]):  # 구간별(키 = 구간 시작일, 첫 구간은 짧을 수 있음)
+            key = date.fromordinal(max(since, origin + i * width)).isoformat()  # 구간 시작일
+            rows += [(sec, key, m, v) for m, v in zip(("completed", "reopened", "created"), b)]  # 세 지표
+        rows += [(sec, "total", m, tr[m]) for m in ("completed", "reopened", "created", "per_day")]  # 기간 합계
+    rows += [("timers", f"{tm['days']}d", m, tm[m]) for m in ("sessions", "minutes", "all_sessions")]  # 발표 연습
+    w = csv.writer(fp)  # C 구현 writer
+    w.writerow(("section", "key", "metric", "value"))  # 헤더
+    w.writerows(rows)  # 요약 행
+    return len(rows)  # 행 수
+
+def export_report(con: sql.Connection, path: str, fmt: str | None = None, progress: Progress | None = None,
+                  stats: dict | None = None, today: date | None = None) -> int:  # 내보내기 진입점
+    """리포트를 path('-'면 stdout)에 txt/html/csv로 쓰고 기록한 항목(CSV는 요약 행) 수를 반환."""  # 동작 설명
+    fmt = guess_report_format(path, fmt)  # 형식
+    data = collect(con, stats, today)  # 요약(수 ms)
+    def write(fp) -> int:  # 형식별 직렬화
+        if fmt == "csv":  # 요약만
+            n = write_csv(data, fp)  # 기록
+            if progress:  # 진행률 알림
+                progress(1, 1)  # 한 번에 끝
+            return n  # 행 수
+        return (write_html if fmt == "html" else write_text)(data, iter_open(con, progress), fp)  # 항목 스트림 포함
+    if path == "-":  # 표준 출력
+        return write(sys.stdout)  # 파이프로 바로
+    with open(path, "w", encoding="utf-8", newline="") as fp:  # CSV 모듈 권장 newline=""
+        return write(fp)  # 파일로
+    # New 요약은 롤업/인덱스 질의라 크기와 무관하고, 시간은 미완료 항목 수에만 비례한다.
@@ -0,0 +1,197 @@
+# ─────────────────────────────────────────────────────────
+# 갓생살기 타이머 모델: 여러 발표 타이머 + 대기열 + 마감 힙     # GUI 비의존 타이머 엔진
+# ─────────────────────────────────────────────────────────
+# 타이머는 id로 관리하고, 실행 중인 모든 타이머의 "다음에 깨어날 시각"을 힙 하나에 넣는다.  # New 상위 요약
+# 화면 계층은 힙의 맨 앞 시각에 after() 하나만 예약하므로 타이머가 늘어도 이벤트 루프 콜백은 1개다.  # New 설계 의도
+
+import heapq  # 마감 시각 최소 힙
+import itertools  # 동순위 정렬용 일련번호
+import sqlite3 as sql  # 세션/이력 영속화
+from dataclasses import dataclass  # 모델 선언
+from datetime import date, datetime, timedelta  # 이력 시각/기간 집계
+
+# ─────────────────────────────────────────────────────────
+# 상수                                                        # 상태 코드/표시 문구
+# ─────────────────────────────────────────────────────────
+IDLE, RUNNING, PAUSED, DONE = "idle", "running", "paused", "done"  # 타이머 상태(대기열/실행/일시정지/종료)
+TIMER_STATE_TEXT = {IDLE: "대기", RUNNING: "진행", PAUSED: "일시정지", DONE: "종료"}  # 목록 표시 문구
+
+# ─────────────────────────────────────────────────────────
+# 모델                                                        # 타이머 1개
+# ─────────────────────────────────────────────────────────
+@dataclass(slots=True)  # 타이머 모델
+class Timer:  # 발표 타이머 1개
+    """이름 붙은 카운트다운 1개(실행 중이면 end_mono 기준, 아니면 left에 남은 시간을 보관)."""  # 모델 설명
+    id: int           # 보드 안에서 유일한 번호
+    name: str         # 발표자/순서 이름
+    total: float      # 총 시간(초)
+    warn: int         # 경고 시작 임계(초)
+    left: float = 0.0       # 실행 중이 아닐 때의 남은 시간(초, 소수 — 일시정지/재개에 오차 누적 없음)
+    end_mono: float = 0.0   # 실행 중일 때의 종료 단조 시각
+    state: str = IDLE       # 상태(IDLE/RUNNING/PAUSED/DONE)
+    gen: int = 0            # 예약 세대(바뀌면 힙에 남은 이전 예약은 무효)
+
+    def remaining(self, now: float) -> float:  # 남은 시간
+        """now(단조 시각) 기준 남은 시간(초)."""  # 상태별 계산
+        return max(0.0, self.end_mono - now) if self.state == RUNNING else self.left  # 실행 중이면 시계로 계산
+
+    def start(self, now: float) -> None:  # 시작/재개
+        """남은 시간(left)만큼 달리도록 종료 시각을 정한다."""  # 동작 설명
+        self.end_mono = now + self.left  # 종료 목표 시각
+        self.state = RUNNING  # 실행
+        self.gen += 1  # 이전 예약 무효화
+
+    def pause(self, now: float) -> None:  # 일시정지
+        """남은 시간을 소수 초 그대로 보관하고 멈춘다."""  # 동작 설명
+        self.left = self.remaining(now)  # 남은 시간 보관
+        self.state = PAUSED  # 정지
+        self.gen += 1  # 예약 무효화
+
+    def finish(self) -> None:  # 종료
+        """0초에 도달한 타이머를 종료 상태로 바꾼다."""  # 동작 설명
+        self.left = 0.0  # 남은 시간 없음
+        self.state = DONE  # 종료
+        self.gen += 1  # 예약 무효화
+
+# ─────────────────────────────────────────────────────────
+# 마감 힙                                                      # 단일 after 체인의 예약표
+# ─────────────────────────────────────────────────────────
+class DeadlineHeap:  # 마감 시각 최소 힙
+    """(시각, 일련번호, 타이머, 세대) 항목의 최소 힙. 타이머당 유효한 예약은 마지막 push 1개뿐(지연 삭제)."""  # 무효화 규칙
+
+    def __init__(self) -> None:  # 생성자 시그니처
+        """빈 힙."""  # 초기화 설명
+        self._heap: list[tuple] = []        # 힙 배열
+        self._seq = itertools.count()       # 같은 시각일 때 순서 보장(타이머 객체끼리는 비교하지 않음)
+
+    def push(self, when: float, t: Timer) -> None:  # 예약
+        """t를 when(단조 시각)에 깨우도록 예약(같은 타이머의 이전 예약은 세대가 바뀌어 무효)."""  # 동작 설명
+        t.gen += 1  # 새 세대
+        heapq.heappush(self._heap, (when, next(self._seq), t, t.gen))  # O(log n)
+
+    def _valid(self, entry: tuple) -> bool:  # 유효성
+        """예약 이후 상태 변경/재예약이 없었는지."""  # 판정 기준
+        return entry[2].gen == entry[3] and entry[2].state == RUNNING  # 세대 일치 + 실행 중
+
+    def next_due(self) -> float | None:  # 가장 이른 예약
+        """무효 항목을 버리고 가장 이른 유효 예약 시각(없으면 None)."""  # 반환 규칙
+        heap = self._heap  # 단축 참조
+        while heap and not self._valid(heap[0]):  # 맨 앞이 무효면
+            heapq.heappop(heap)  # 버림
+        return heap[0][0] if heap else None  # 시각
+
+    def pop_due(self, now: float) -> list[Timer]:  # 기한 도래 항목
+        """now까지 도래한 유효 예약의 타이머들(시각 순)."""  # 반환 규칙
+        heap, out = self._heap, []  # 단축 참조/결과
+        while heap and heap[0][0] <= now:  # 도래
+            entry = heapq.heappop(heap)  # 꺼냄
+            if self._valid(entry):  # 유효하면
+                out.append(entry[2])  # 수집
+        return out  # 타이머 목록
+
+    def clear(self) -> None:  # 전체 취소
+        """모든 예약을 버린다."""  # 동작 설명
+        self._heap.clear()  # 비움
+
+    def __len__(self) -> int:  # 크기
+        """힙 항목 수(무효 항목 포함)."""  # 의미 설명
+        return len(self._heap)  # 크기
+
+# ─────────────────────────────────────────────────────────
+# 보드                                                         # 타이머 모음 + 대기열
+# ─────────────────────────────────────────────────────────
+class TimerBoard:  # 타이머 보드
+    """id → Timer 사전(삽입 순서 = 대기열 순서)과 마감 힙을 함께 관리."""  # 역할 설명
+
+    def __init__(self) -> None:  # 생성자 시그니처
+        """빈 보드."""  # 초기화 설명
+        self.timers: dict[int, Timer] = {}  # id → 타이머(삽입 순서 유지)
+        self.heap = DeadlineHeap()          # 실행 중 타이머의 다음 깨어날 시각
+        self._next_id = 1                   # 다음 id
+        self.history: list[tuple] = []      # 아직 저장하지 않은 완료 이력 (name, total, 종료 epoch 초)
+
+    def add(self, name: str, total: float, warn: int) -> Timer:  # 추가
+        """대기(IDLE) 상태 타이머를 대기열 끝에 추가."""  # 동작 설명
+        t = Timer(self._next_id, name, total, min(warn, max(1, int(total) - 1)), left=total)  # 경고 임계가 총시간 이상이 되지 않게 보정
+        self._next_id += 1  # 다음 id
+        self.timers[t.id] = t  # 등록
+        return t  # 새 타이머
+
+    def remove(self, tid: int) -> Timer | None:  # 삭제
+        """타이머를 보드에서 빼고(예약은 세대 변경으로 무효) 반환."""  # 동작 설명
+        t = self.timers.pop(tid, None)  # 제거
+        if t is not None:  # 있었으면
+            t.gen += 1  # 힙 예약 무효화
+        return t  # 제거된 타이머
+
+    def next_queued(self) -> Timer | None:  # 대기열 맨 앞
+        """아직 시작하지 않은 첫 타이머(없으면 None)."""  # 반환 규칙
+        return next((t for t in self.timers.values() if t.state == IDLE), None)  # 삽입 순서 = 발표 순서
+
+    def running(self) -> list[Timer]:  # 실행 중 목록
+        """실행 중인 타이머들."""  # 반환 규칙
+        return [t for t in self.timers.values() if t.state == RUNNING]  # 필터
+
+    def complete(self, t: Timer, wall: float) -> None:  # 완료 처리
+        """t를 종료 상태로 바꾸고 완료 이력(저장 대기)에 남긴다(wall: 실제 종료 epoch 초)."""  # 동작 설명
+        t.finish()  # 종료(예약 무효화)
+        self.history.append((t.name, t.total, wall))  # 이력 대기열
+
+    def snapshot(self, now: float, wall: float) -> list[tuple]:  # 저장용 행
+        """종료되지 않은 타이머들의 timer_sessions 행(실행 중이면 단조 시각을 벽시계 종료 시각으로 환산)."""  # 환산 규칙
+        return [(t.id, t.name, t.total, t.warn, t.state, t.remaining(now),
+                 wall + t.remaining(now) if t.state == RUNNING else None)
+                for t in self.timers.values() if t.state != DONE]  # 종료된 것은 이력으로만 남김
+
+    def restore(self, rows: list[tuple], now: float, wall: float) -> list[Timer]:  # 복원
+        """저장된 행으로 타이머를 되살린다. 꺼져 있는 동안 끝난 타이머는 완료 처리해 목록으로 반환."""  # 복원 규칙
+        ended = []  # 꺼진 사이 끝난 타이머
+        for id_, name, total, warn, state, left, end_wall in rows:  # 저장 순서 = id 순
+            if id_ in self.timers:  # 로드 전에 새로 만든 타이머와 id가 겹치면
+                id_ = self._next_id  # 새 id(다음 저장 때 그대로 기록됨)
+            t = Timer(id_, name, total, warn, left=left, state=state if state in (IDLE, PAUSED) else IDLE)  # 정지 상태로 생성
+            self.timers[id_] = t  # 등록
+            self._next_id = max(self._next_id, id_ + 1)  # id 충돌 방지
+            if state == RUNNING and end_wall is not None:  # 실행 중이었으면
+                t.left = end_wall - wall  # 벽시계 기준 남은 시간
+                if t.left > 0:  # 아직 남음
+                    t.start(now)  # 이어서 진행
+                else:  # 꺼진 사이 끝남
+                    self.complete(t, end_wall)  # 원래 종료 시각으로 이력 기록
+                    ended.append(t)  # 호출부에서 목록 정리
+        return ended  # 꺼진 사이 끝난 타이머
+    # New 타이머 상태 변경(start/pause/finish)은 세대를 올려 힙의 낡은 예약을 자동으로 무시하게 만든다.
+
+# ─────────────────────────────────────────────────────────
+# 영속화(워커 스레드에서 실행되는 SQL 함수)                   # timer_sessions / timer_history
+# ─────────────────────────────────────────────────────────
+def load_timers(con: sql.Connection) -> list[tuple]:  # 세션 로드
+    """저장된 미완료 세션 행(id 순)."""  # 반환 규칙
+    return con.execute(
+        "SELECT id, name, total, warn, state, left, end_wall FROM timer_sessions ORDER BY id"  # 대기열 순서
+    ).fetchall()  # 보통 몇 행
+
+def save_timers(con: sql.Connection, rows: list[tuple]) -> None:  # 세션 저장
+    """미완료 세션 전체를 스냅샷으로 교체(행 수가 작아 전량 교체가 가장 단순하고 빠름)."""  # 전략 설명
+    con.execute("DELETE FROM timer_sessions")  # 비우고
+    con.executemany("INSERT INTO timer_sessions(id, name, total, warn, state, left, end_wall) VALUES(?,?,?,?,?,?,?)",
+                    rows)  # 다시 씀
+
+def append_history(con: sql.Connection, items: list[tuple]) -> None:  # 이력 추가
+    """완료 세션 (name, total, 종료 epoch 초)들을 이력 테이블에 추가."""  # 입력 형식
+    rows = []  # INSERT 파라미터
+    for name, total, wall in items:  # 완료 세션별
+        ts = datetime.fromtimestamp(wall)  # 로컬 시각
+        rows.append((name, total, ts.isoformat(timespec="seconds"), ts.date().isoformat()))  # 일자 키 포함
+    con.executemany("INSERT INTO timer_history(name, total, finished, day) VALUES(?,?,?,?)", rows)  # 일괄 추가
+
+def timer_history_stats(con: sql.Connection, today: date | None = None, days: int = 7) -> dict:  # 이력 집계
+    """최근 days일(오늘 포함)의 완료 세션 수/총 분과 전체 완료 수(day 인덱스만 읽음)."""  # 지표 설명
+    today = today or date.today()  # 기준일
+    since = (today - timedelta(days=days - 1)).isoformat()  # 시작일
+    n, secs = con.execute(
+        "SELECT COUNT(*), COALESCE(SUM(total), 0) FROM timer_history WHERE day >= ?", (since,)  # 기간 범위 스캔
+    ).fetchone()  # 기간 집계
+    total = con.execute("SELECT COUNT(*) FROM timer_history").fetchone()[0]  # 전체 완료 수
+    return {"days": days, "sessions": n, "minutes": round(secs / 60, 1), "all_sessions": total}  # 리포트용 요약
+    # New 앱 시작 경로에서는 이력을 읽지 않고, 리포트 탭이 보일 때 워커에서 이 집계만 요청한다.